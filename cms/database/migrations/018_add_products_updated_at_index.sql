@@ -0,0 +1,25 @@
+-- Delta syncs (GET /api/products?updated_since=...&after_id=...&sort=updated_asc)
+-- walk products by (updated_at, id). The API returns timestamps in milliseconds,
+-- so updated_at is stored in whole milliseconds: a cursor read back from the
+-- JSON then compares equal to its row and the walk runs on the plain index.
+
+-- Runs after update_products_updated_at (triggers fire in name order)
+CREATE OR REPLACE FUNCTION truncate_updated_at_to_milliseconds()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = date_trunc('milliseconds', NEW.updated_at);
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_products_updated_at_ms ON products;
+CREATE TRIGGER update_products_updated_at_ms BEFORE INSERT OR UPDATE ON products FOR EACH ROW EXECUTE FUNCTION truncate_updated_at_to_milliseconds();
+
+-- Truncate the existing rows without bumping them to now
+ALTER TABLE products DISABLE TRIGGER update_products_updated_at;
+UPDATE products SET updated_at = date_trunc('milliseconds', updated_at)
+WHERE updated_at <> date_trunc('milliseconds', updated_at);
+ALTER TABLE products ENABLE TRIGGER update_products_updated_at;
+
+DROP INDEX IF EXISTS idx_products_updated_at;
+CREATE INDEX IF NOT EXISTS idx_products_updated_at_id ON products(updated_at, id);
@@ -93,12 +93,25 @@ export const Product = {
       values.push(`%${filters.search}%`);
     }
 
+    // Changed since (delta sync); with after_id, after (updated_since, after_id)
+    // in 'updated_asc' order, so the sync pages by key instead of by offset.
+    // updated_at is stored in whole milliseconds (migration 018), so a timestamp
+    // read back from the API's JSON compares equal to the row it came from
+    if (filters.updated_since && filters.after_id) {
+      query += ` AND (p.updated_at, p.id) > ($${paramCount++}::timestamptz, $${paramCount++}::uuid)`;
+      values.push(filters.updated_since, filters.after_id);
+    } else if (filters.updated_since) {
+      query += ` AND p.updated_at > $${paramCount++}`;
+      values.push(filters.updated_since);
+    }
+
     // Sorting
     const sortOptions = {
       'title_asc': 'p.title ASC',
       'title_desc': 'p.title DESC',
       'newest': 'p.created_at DESC',
-      'oldest': 'p.created_at ASC'
+      'oldest': 'p.created_at ASC',
+      'updated_asc': 'p.updated_at ASC, p.id ASC'
     };
     query += ` ORDER BY ${sortOptions[filters.sort] || 'p.created_at DESC'}`;
 
@@ -304,6 +317,14 @@ export const Product = {
     return result.rows;
   },
 
+  /**
+   * Get ids of all active products (cheap deletion check for delta syncs)
+   */
+  async findActiveIds() {
+    const result = await pool.query('SELECT id FROM products WHERE is_active = true ORDER BY id');
+    return result.rows.map(r => r.id);
+  },
+
   /**
    * Get filter options (for frontend filter UI)
    */
@@ -403,6 +424,14 @@ export const Product = {
       values.push(`%${filters.search}%`);
     }
 
+    if (filters.updated_since && filters.after_id) {
+      query += ` AND (p.updated_at, p.id) > ($${paramCount++}::timestamptz, $${paramCount++}::uuid)`;
+      values.push(filters.updated_since, filters.after_id);
+    } else if (filters.updated_since) {
+      query += ` AND p.updated_at > $${paramCount++}`;
+      values.push(filters.updated_since);
+    }
+
     const result = await pool.query(query, values);
     return result.rows[0].count;
   }
@@ -5,6 +5,8 @@ import { cacheMiddleware } from '../../middleware/cache.js';
 
 const router = Router();
 
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
 /**
  * GET /api/products
  * Get all products (public, no prices)
@@ -16,9 +18,16 @@ router.get('/', cacheMiddleware(5 * 60 * 1000), async (req, res, next) => {
       subcategory_slug, subcategory_id, 
       brand_id, brand_slug, attachment_type,
       excavator_weight, volume_min, volume_max, width,
-      search, sort, limit, offset, featured
+      search, sort, limit, offset, featured, updated_since, after_id
     } = req.query;
 
+    if (updated_since && isNaN(Date.parse(updated_since))) {
+      return res.status(400).json({ error: 'Invalid updated_since timestamp' });
+    }
+    if (after_id && !UUID_PATTERN.test(after_id)) {
+      return res.status(400).json({ error: 'Invalid after_id' });
+    }
+
     const filters = {
       category_slug: category_slug || category, // Support both param names
       category_id,
@@ -35,7 +44,9 @@ router.get('/', cacheMiddleware(5 * 60 * 1000), async (req, res, next) => {
       sort,
       limit: limit ? parseInt(limit) : undefined,
       offset: offset ? parseInt(offset) : undefined,
-      is_featured: featured === 'true'
+      is_featured: featured === 'true',
+      updated_since,
+      after_id
     };
 
     const [products, total] = await Promise.all([
@@ -67,6 +78,19 @@ router.get('/filters', async (req, res, next) => {
   }
 });
 
+/**
+ * GET /api/products/ids
+ * Get ids of all active products (used by the static site sync to detect deletions)
+ */
+router.get('/ids', async (req, res, next) => {
+  try {
+    const ids = await Product.findActiveIds();
+    res.json({ ids, total: ids.length });
+  } catch (error) {
+    next(error);
+  }
+});
+
 /**
  * GET /api/products/featured
  * Get featured products
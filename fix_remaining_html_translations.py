@@ -6,8 +6,13 @@ Translates all remaining Dutch text in be-fr and de-de HTML files
 
 import os
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine, match_report
+
 # Translation dictionaries
 translations_fr = {
     # Common phrases
@@ -135,7 +140,7 @@ translations_de = {
     'Neem contact op met onze specialisten voor persoonlijk advies': 'Kontaktieren Sie unsere Spezialisten für persönliche Beratung',
 }
 
-def translate_html_file(filepath, translations):
+def translate_html_file(filepath, translations, matched):
     """Translate Dutch text in HTML file"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -143,14 +148,9 @@ def translate_html_file(filepath, translations):
         
         original_content = content
         
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_translations = sorted(translations.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for dutch, translation in sorted_translations:
-            # Only replace if not already in target language
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(dutch) + r'\b'
-            content = re.sub(pattern, translation, content, flags=re.IGNORECASE)
+        # Whole words only, case-insensitive, longest match first
+        content, found = get_engine(translations, context='word', ignore_case=True).translate(content)
+        matched.update(found)
         
         if content != original_content:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -162,29 +162,33 @@ def translate_html_file(filepath, translations):
         return False
 
 def main():
-    base_dir = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_dir = Path(__file__).parent / 'web'
     
     # Process be-fr
     print("Processing be-fr files...")
     be_fr_dir = base_dir / 'be-fr'
     fr_count = 0
+    matched = Counter()
     for html_file in be_fr_dir.rglob('*.html'):
-        if translate_html_file(html_file, translations_fr):
+        if translate_html_file(html_file, translations_fr, matched):
             fr_count += 1
             print(f"  ✓ {html_file.relative_to(base_dir)}")
     
     print(f"\nTranslated {fr_count} be-fr files")
+    print(match_report(get_engine(translations_fr, context='word', ignore_case=True), matched))
     
     # Process de-de
     print("\nProcessing de-de files...")
     de_de_dir = base_dir / 'de-de'
     de_count = 0
+    matched = Counter()
     for html_file in de_de_dir.rglob('*.html'):
-        if translate_html_file(html_file, translations_de):
+        if translate_html_file(html_file, translations_de, matched):
             de_count += 1
             print(f"  ✓ {html_file.relative_to(base_dir)}")
     
     print(f"\nTranslated {de_count} de-de files")
+    print(match_report(get_engine(translations_de, context='word', ignore_case=True), matched))
     print(f"\nTotal: {fr_count + de_count} files updated")
 
 if __name__ == '__main__':
@@ -0,0 +1,48 @@
+"""
+Brand and machine model data from web/assets/js/data/brand-data.js.
+brand-data.js is the source of the brand pages (brand-template.js); this reads
+the parts the build needs - brand names and the model selector entries - from
+its object literal, so the brands stay maintained in one place.
+
+Usage:
+    from brand_data import load_brands
+
+    for slug, brand in load_brands().items():
+        print(brand['name'], [model['name'] for model in brand['models']])
+"""
+
+import re
+from pathlib import Path
+
+BRAND_DATA_PATH = Path(__file__).parent.parent / 'web' / 'assets' / 'js' / 'data' / 'brand-data.js'
+
+# `  caterpillar: {` / `  'wacker-neuson': {` at the top level of BRAND_DATA
+BRAND_PATTERN = re.compile(r"^  '?([a-z0-9-]+)'?: \{$", re.MULTILINE)
+NAME_PATTERN = re.compile(r"^    name: '([^']*)'", re.MULTILINE)
+SHORT_NAME_PATTERN = re.compile(r"^    shortName: '([^']*)'", re.MULTILINE)
+MODEL_PATTERN = re.compile(r"\{ name: '([^']*)', tonnage: ([\d.]+), cw: '([^']*)'")
+
+
+def parse_brands(source):
+    """{slug: {'name', 'short_name', 'models': [{'name', 'tonnage', 'cw'}]}} in file order."""
+    source = source.split('export const BRAND_DATA', 1)[-1].split('\n};', 1)[0]
+    matches = list(BRAND_PATTERN.finditer(source))
+    brands = {}
+    for match, following in zip(matches, matches[1:] + [None]):
+        block = source[match.end():following.start() if following else len(source)]
+        name = NAME_PATTERN.search(block)
+        short_name = SHORT_NAME_PATTERN.search(block)
+        brands[match.group(1)] = {
+            'name': name.group(1) if name else match.group(1),
+            'short_name': short_name.group(1) if short_name else '',
+            'models': [{'name': model, 'tonnage': float(tonnage), 'cw': cw}
+                       for model, tonnage, cw in MODEL_PATTERN.findall(block)],
+        }
+    return brands
+
+
+def load_brands(path=BRAND_DATA_PATH):
+    try:
+        return parse_brands(Path(path).read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
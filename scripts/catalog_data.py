@@ -159,8 +159,8 @@ SUBCATEGORIES = {
 }
 
 LABELS = {
-    'be-nl': {'home': 'Home', 'products': 'Producten', 'subcategories': 'Subcategorieën', 'products_found': 'producten gevonden', 'filters': 'Filters', 'clear': 'Wissen', 'brand': 'Merk', 'loading_brands': 'Merken laden...', 'volume': 'Inhoud (liter)', 'excavator_class': 'Graafmachine Klasse', 'width': 'Breedte (mm)', 'attachment': 'Ophanging', 'apply_filters': 'Filters Toepassen', 'sort': 'Sorteren:', 'newest': 'Nieuwste eerst', 'oldest': 'Oudste eerst', 'name_az': 'Naam A-Z', 'name_za': 'Naam Z-A', 'loading': 'Producten laden...', 'prev': 'Vorige', 'next': 'Volgende', 'meta_suffix': '| Structon'},
-    'nl-nl': {'home': 'Home', 'products': 'Producten', 'subcategories': 'Subcategorieën', 'products_found': 'producten gevonden', 'filters': 'Filters', 'clear': 'Wissen', 'brand': 'Merk', 'loading_brands': 'Merken laden...', 'volume': 'Inhoud (liter)', 'excavator_class': 'Graafmachine Klasse', 'width': 'Breedte (mm)', 'attachment': 'Ophanging', 'apply_filters': 'Filters Toepassen', 'sort': 'Sorteren:', 'newest': 'Nieuwste eerst', 'oldest': 'Oudste eerst', 'name_az': 'Naam A-Z', 'name_za': 'Naam Z-A', 'loading': 'Producten laden...', 'prev': 'Vorige', 'next': 'Volgende', 'meta_suffix': '| Structon'},
-    'be-fr': {'home': 'Accueil', 'products': 'Produits', 'subcategories': 'Sous-catégories', 'products_found': 'produits trouvés', 'filters': 'Filtres', 'clear': 'Effacer', 'brand': 'Marque', 'loading_brands': 'Chargement...', 'volume': 'Contenu (litres)', 'excavator_class': 'Classe d\'excavatrice', 'width': 'Largeur (mm)', 'attachment': 'Fixation', 'apply_filters': 'Appliquer', 'sort': 'Trier:', 'newest': 'Plus récent', 'oldest': 'Plus ancien', 'name_az': 'Nom A-Z', 'name_za': 'Nom Z-A', 'loading': 'Chargement...', 'prev': 'Précédent', 'next': 'Suivant', 'meta_suffix': '| Structon'},
-    'de-de': {'home': 'Startseite', 'products': 'Produkte', 'subcategories': 'Unterkategorien', 'products_found': 'Produkte gefunden', 'filters': 'Filter', 'clear': 'Löschen', 'brand': 'Marke', 'loading_brands': 'Laden...', 'volume': 'Inhalt (Liter)', 'excavator_class': 'Baggerklasse', 'width': 'Breite (mm)', 'attachment': 'Aufhängung', 'apply_filters': 'Anwenden', 'sort': 'Sortieren:', 'newest': 'Neueste', 'oldest': 'Älteste', 'name_az': 'Name A-Z', 'name_za': 'Name Z-A', 'loading': 'Laden...', 'prev': 'Zurück', 'next': 'Weiter', 'meta_suffix': '| Structon'}
+    'be-nl': {'home': 'Home', 'products': 'Producten', 'subcategories': 'Subcategorieën', 'products_found': 'producten gevonden', 'filters': 'Filters', 'clear': 'Wissen', 'brand': 'Merk', 'loading_brands': 'Merken laden...', 'volume': 'Inhoud (liter)', 'excavator_class': 'Graafmachine Klasse', 'width': 'Breedte (mm)', 'attachment': 'Ophanging', 'apply_filters': 'Filters Toepassen', 'sort': 'Sorteren:', 'newest': 'Nieuwste eerst', 'oldest': 'Oudste eerst', 'name_az': 'Naam A-Z', 'name_za': 'Naam Z-A', 'loading': 'Producten laden...', 'prev': 'Vorige', 'next': 'Volgende', 'meta_suffix': '| Structon', 'product': 'product', 'products_lower': 'producten', 'card_weight': 'Gewicht', 'card_width': 'Breedte', 'card_volume': 'Inhoud', 'card_machine_class': 'Machine klasse', 'card_attachment': 'Ophanging', 'card_more_info': 'Meer info', 'related_products': 'Gerelateerde producten'},
+    'nl-nl': {'home': 'Home', 'products': 'Producten', 'subcategories': 'Subcategorieën', 'products_found': 'producten gevonden', 'filters': 'Filters', 'clear': 'Wissen', 'brand': 'Merk', 'loading_brands': 'Merken laden...', 'volume': 'Inhoud (liter)', 'excavator_class': 'Graafmachine Klasse', 'width': 'Breedte (mm)', 'attachment': 'Ophanging', 'apply_filters': 'Filters Toepassen', 'sort': 'Sorteren:', 'newest': 'Nieuwste eerst', 'oldest': 'Oudste eerst', 'name_az': 'Naam A-Z', 'name_za': 'Naam Z-A', 'loading': 'Producten laden...', 'prev': 'Vorige', 'next': 'Volgende', 'meta_suffix': '| Structon', 'product': 'product', 'products_lower': 'producten', 'card_weight': 'Gewicht', 'card_width': 'Breedte', 'card_volume': 'Inhoud', 'card_machine_class': 'Machine klasse', 'card_attachment': 'Ophanging', 'card_more_info': 'Meer info', 'related_products': 'Gerelateerde producten'},
+    'be-fr': {'home': 'Accueil', 'products': 'Produits', 'subcategories': 'Sous-catégories', 'products_found': 'produits trouvés', 'filters': 'Filtres', 'clear': 'Effacer', 'brand': 'Marque', 'loading_brands': 'Chargement...', 'volume': 'Contenu (litres)', 'excavator_class': 'Classe d\'excavatrice', 'width': 'Largeur (mm)', 'attachment': 'Fixation', 'apply_filters': 'Appliquer', 'sort': 'Trier:', 'newest': 'Plus récent', 'oldest': 'Plus ancien', 'name_az': 'Nom A-Z', 'name_za': 'Nom Z-A', 'loading': 'Chargement...', 'prev': 'Précédent', 'next': 'Suivant', 'meta_suffix': '| Structon', 'product': 'produit', 'products_lower': 'produits', 'card_weight': 'Poids', 'card_width': 'Largeur', 'card_volume': 'Contenance', 'card_machine_class': 'Classe de machine', 'card_attachment': 'Fixation', 'card_more_info': 'Plus d\'infos', 'related_products': 'Produits associés'},
+    'de-de': {'home': 'Startseite', 'products': 'Produkte', 'subcategories': 'Unterkategorien', 'products_found': 'Produkte gefunden', 'filters': 'Filter', 'clear': 'Löschen', 'brand': 'Marke', 'loading_brands': 'Laden...', 'volume': 'Inhalt (Liter)', 'excavator_class': 'Baggerklasse', 'width': 'Breite (mm)', 'attachment': 'Aufhängung', 'apply_filters': 'Anwenden', 'sort': 'Sortieren:', 'newest': 'Neueste', 'oldest': 'Älteste', 'name_az': 'Name A-Z', 'name_za': 'Name Z-A', 'loading': 'Laden...', 'prev': 'Zurück', 'next': 'Weiter', 'meta_suffix': '| Structon', 'product': 'Produkt', 'products_lower': 'Produkte', 'card_weight': 'Gewicht', 'card_width': 'Breite', 'card_volume': 'Inhalt', 'card_machine_class': 'Maschinenklasse', 'card_attachment': 'Aufhängung', 'card_more_info': 'Mehr Infos', 'related_products': 'Ähnliche Produkte'}
 }
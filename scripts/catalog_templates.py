@@ -1,7 +1,16 @@
 """
 HTML Templates for Structon Catalog Pages
+Page templates are compiled once at import. Labels are bound once per locale
+and cached, so rendering a page only fills in its own title and texts. The
+header and footer are baked in from site_layout.py.
 """
 
+from html import escape
+
+from product_listing import PAGE_SIZE, card_path
+from site_layout import render_header, render_footer
+from template_engine import PageTemplate
+
 BASE_URL = 'https://leelars.github.io/Structon'
 LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
 
@@ -13,61 +22,79 @@ def get_hreflang_tags(locale, path_suffix):
     tags.append(f'  <link rel="alternate" hreflang="x-default" href="{BASE_URL}/be-nl/{path_suffix}">')
     return '\n'.join(tags)
 
-def get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES):
-    category = CATEGORIES[category_slug]
-    labels = LABELS[locale]
-    title = category['title_translations'].get(locale, category['title'])
-    description = category['description_translations'].get(locale, category['description'])
-    assets_prefix = '../../../assets'
-    home_link = '../../index.html'
-    products_link = '../index.html'
-    path_suffix = f'producten/{category_slug}/'
-    hreflang_tags = get_hreflang_tags(locale, path_suffix)
-    canonical = f'  <link rel="canonical" href="{BASE_URL}/{locale}/{path_suffix}">'
-    
-    # Build subcategory cards
-    subcat_cards = []
-    for subcat_slug in category.get('subcategories', []):
-        subcat = SUBCATEGORIES.get(subcat_slug, {})
-        subcat_title = subcat.get('title_translations', {}).get(locale, subcat.get('title', subcat_slug))
-        subcat_cards.append(f'''<a href="{subcat_slug}/" class="subcategory-card">
-              <div class="subcategory-image"><img src="https://res.cloudinary.com/dchrgzyb4/image/upload/v1768988292/graafbak-hero_apbtll.png" alt="{subcat_title}"></div>
+DEFAULT_SUBCATEGORY_IMAGE = 'https://res.cloudinary.com/dchrgzyb4/image/upload/v1768988292/graafbak-hero_apbtll.png'
+
+# Same as PLACEHOLDER_PHOTOS in web/assets/js/main.js
+PLACEHOLDER_PHOTOS = [
+    'https://images.unsplash.com/photo-1504307651254-35680f356dfd?w=400&h=400&fit=crop',
+    'https://images.unsplash.com/photo-1581094288338-2314dddb7ece?w=400&h=400&fit=crop',
+    'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=400&h=400&fit=crop',
+    'https://images.unsplash.com/photo-1589939705384-5185137a7f0f?w=400&h=400&fit=crop',
+]
+
+SUBCATEGORY_CARD = PageTemplate('''<a href="{{subcat_slug}}/" class="subcategory-card">
+              <div class="subcategory-image"><img src="{{image}}" alt="{{subcat_title}}"></div>
               <div class="subcategory-overlay"></div>
-              <div class="subcategory-content"><h3>{subcat_title}</h3></div>
+              <div class="subcategory-content"><h3>{{subcat_title}}</h3>{{count_html}}</div>
             </a>''')
-    subcategories_html = '\n            '.join(subcat_cards)
-    
-    return f'''<!DOCTYPE html>
-<html lang="{locale.replace('-', '_')}">
+
+SUBCATEGORY_COUNT = PageTemplate('<div class="subcategory-count">{{count}} {{count_label}}</div>')
+
+PRODUCTS_LOADING = PageTemplate('<div class="loading"><div class="spinner"></div><p>{{label_loading}}</p></div>')
+
+# Server-side version of createProductCardHorizontal() in web/assets/js/main.js
+PRODUCT_CARD = PageTemplate('''
+              <article class="product-card-horizontal" data-product-id="{{id}}" data-width="{{width}}" data-volume="{{volume}}" data-attachment="{{attachment}}" data-excavator-min="{{excavator_min}}" data-excavator-max="{{excavator_max}}" data-brand="{{brand}}">
+                <a href="{{url}}" class="product-image"><img src="{{image}}" alt="{{title}}" loading="lazy"></a>
+                <div class="product-info">
+                  <h3 class="product-title"><a href="{{url}}">{{title}}</a></h3>
+                  <dl class="product-specs">{{specs}}</dl>
+                  <div class="product-actions-wrapper">
+                    <div class="product-price-section" data-product-id="{{id}}"></div>
+                    <div class="product-buttons">
+                      <a href="{{url}}" class="btn-split btn-split-sm" style="text-decoration: none;">
+                        <span class="btn-split-text">{{label_card_more_info}}</span>
+                        <span class="btn-split-icon"><svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg></span>
+                      </a>
+                    </div>
+                  </div>
+                </div>
+              </article>''')
+
+SPEC_ROW = PageTemplate('<dt>{{label}}</dt><dd>{{value}}</dd>')
+
+# Category pages live at /<locale>/producten/<category>/
+CATEGORY_PAGE = PageTemplate('''<!DOCTYPE html>
+<html lang="{{lang}}">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <meta name="description" content="{description[:155]}">
-  <title>{title} {labels['meta_suffix']}</title>
-  <link rel="preload" href="{assets_prefix}/css/fonts.css" as="style">
-  <link rel="stylesheet" href="{assets_prefix}/css/fonts.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/global.css?v=8">
-  <link rel="stylesheet" href="{assets_prefix}/css/components/mega-menu.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/pages/category.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/pages/products.css">
-  <link rel="icon" type="image/svg+xml" href="{assets_prefix}/images/static/favicon.svg">
-{canonical}
-{hreflang_tags}
+  <meta name="description" content="{{meta_desc}}">
+  <title>{{title}} {{label_meta_suffix}}</title>
+  <link rel="preload" href="{{assets_prefix}}/css/fonts.css" as="style">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/fonts.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/global.css?v=8">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/components/mega-menu.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/pages/category.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/pages/products.css">
+  <link rel="icon" type="image/svg+xml" href="{{assets_prefix}}/images/static/favicon.svg">
+{{canonical}}
+{{hreflang_tags}}
 </head>
 <body>
-  <div id="header-placeholder"></div>
+  {{site_header}}
   <main style="padding-top: 0;">
     <section class="page-hero" style="padding-top: var(--space-8);">
       <div class="container">
         <nav class="breadcrumb" aria-label="Kruimelpad">
-          <a href="{home_link}">{labels['home']}</a><span>/</span>
-          <a href="{products_link}">{labels['products']}</a><span>/</span>
-          <span aria-current="page">{title}</span>
+          <a href="{{home_link}}">{{label_home}}</a><span>/</span>
+          <a href="{{products_link}}">{{label_products}}</a><span>/</span>
+          <span aria-current="page">{{title}}</span>
         </nav>
         <div class="page-hero-content">
           <div class="page-hero-text">
-            <h1 class="page-title">{title.upper()}</h1>
-            <p class="page-subtitle">{description}</p>
+            <h1 class="page-title">{{title_upper}}</h1>
+            <p class="page-subtitle">{{description}}</p>
           </div>
         </div>
       </div>
@@ -77,16 +104,16 @@ def get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS,
         <div class="category-layout">
           <aside class="filters-sidebar" id="filters-sidebar">
             <div class="filters-header">
-              <h3 class="filters-title">{labels['filters']}</h3>
-              <button class="btn-text" id="clear-filters">{labels['clear']}</button>
+              <h3 class="filters-title">{{label_filters}}</h3>
+              <button class="btn-text" id="clear-filters">{{label_clear}}</button>
             </div>
             <div class="filter-group" style="display: none;">
-              <h4 class="filter-group-title">{labels['brand']}</h4>
-              <div id="brand-filters-loading" class="filter-loading"><div class="spinner-small"></div><span>{labels['loading_brands']}</span></div>
+              <h4 class="filter-group-title">{{label_brand}}</h4>
+              <div id="brand-filters-loading" class="filter-loading"><div class="spinner-small"></div><span>{{label_loading_brands}}</span></div>
               <div id="brand-filters-container" style="display: none;"></div>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['volume']}</h4>
+              <h4 class="filter-group-title">{{label_volume}}</h4>
               <div class="range-slider">
                 <input type="range" id="volume-min" min="0" max="5000" value="0" step="100">
                 <input type="range" id="volume-max" min="0" max="5000" value="5000" step="100">
@@ -94,7 +121,7 @@ def get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS,
               </div>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['excavator_class']}</h4>
+              <h4 class="filter-group-title">{{label_excavator_class}}</h4>
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="1500"><span>1,5 - 3 ton</span></label>
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="4000"><span>3 - 8 ton</span></label>
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="12000"><span>8 - 15 ton</span></label>
@@ -102,7 +129,7 @@ def get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS,
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="30000"><span>25 - 50 ton</span></label>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['width']}</h4>
+              <h4 class="filter-group-title">{{label_width}}</h4>
               <label class="checkbox-label"><input type="checkbox" name="width" value="300"><span>300mm</span></label>
               <label class="checkbox-label"><input type="checkbox" name="width" value="600"><span>600mm</span></label>
               <label class="checkbox-label"><input type="checkbox" name="width" value="800"><span>800mm</span></label>
@@ -110,127 +137,114 @@ def get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS,
               <label class="checkbox-label"><input type="checkbox" name="width" value="1500"><span>1500mm</span></label>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['attachment']}</h4>
+              <h4 class="filter-group-title">{{label_attachment}}</h4>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW05"><span>CW05</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW10"><span>CW10</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW20"><span>CW20</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW30"><span>CW30</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW40"><span>CW40</span></label>
             </div>
-            <button class="btn btn-primary btn-full" id="apply-filters" style="display: none;">{labels['apply_filters']}</button>
+            <button class="btn btn-primary btn-full" id="apply-filters" style="display: none;">{{label_apply_filters}}</button>
           </aside>
           <div class="category-content">
             <div id="category-header" class="category-header" style="display: block;">
-              <h2 class="category-header-title">{title.upper()}</h2>
-              <p class="category-header-description">{description}</p>
+              <h2 class="category-header-title">{{title_upper}}</h2>
+              <p class="category-header-description">{{description}}</p>
             </div>
-            <div id="subcategories-section" style="display: block; margin-bottom: 40px;">
-              <h2 class="subcategories-title">{labels['subcategories']}</h2>
+            <div id="subcategories-section" style="display: {{subcategories_display}}; margin-bottom: 40px;">
+              <h2 class="subcategories-title">{{label_subcategories}}</h2>
               <div class="subcategories-grid" id="subcategories-grid">
-            {subcategories_html}
+            {{subcategories_html}}
               </div>
             </div>
             <div class="products-toolbar">
               <div class="toolbar-left">
                 <button class="btn-filter-toggle" id="toggle-filters">
                   <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="4" y1="6" x2="20" y2="6"></line><line x1="4" y1="12" x2="20" y2="12"></line><line x1="4" y1="18" x2="20" y2="18"></line></svg>
-                  {labels['filters']}
+                  {{label_filters}}
                 </button>
-                <span class="products-count-text"><strong id="products-count">0</strong> {labels['products_found']}</span>
+                <span class="products-count-text"><strong id="products-count">{{products_count}}</strong> {{label_products_found}}</span>
               </div>
               <div class="toolbar-right">
-                <label for="sort-select" class="sort-label">{labels['sort']}</label>
+                <label for="sort-select" class="sort-label">{{label_sort}}</label>
                 <select id="sort-select" class="sort-select">
-                  <option value="newest">{labels['newest']}</option>
-                  <option value="oldest">{labels['oldest']}</option>
-                  <option value="title_asc">{labels['name_az']}</option>
-                  <option value="title_desc">{labels['name_za']}</option>
+                  <option value="newest">{{label_newest}}</option>
+                  <option value="oldest">{{label_oldest}}</option>
+                  <option value="title_asc">{{label_name_az}}</option>
+                  <option value="title_desc">{{label_name_za}}</option>
                 </select>
               </div>
             </div>
-            <div class="products-list" id="products-grid"><div class="loading"><div class="spinner"></div><p>{labels['loading']}</p></div></div>
+            <div class="products-list" id="products-grid"{{grid_attributes}}>{{products_html}}</div>
             <div class="pagination" id="pagination" style="display: none;">
-              <button class="pagination-btn" id="prev-page" disabled>{labels['prev']}</button>
+              <button class="pagination-btn" id="prev-page" disabled>{{label_prev}}</button>
               <span class="pagination-info" id="pagination-info">Pagina 1 van 1</span>
-              <button class="pagination-btn" id="next-page" disabled>{labels['next']}</button>
+              <button class="pagination-btn" id="next-page" disabled>{{label_next}}</button>
             </div>
           </div>
         </div>
       </div>
     </section>
   </main>
-  <div id="footer-placeholder"></div>
-  <script src="{assets_prefix}/js/components/header-loader.js"></script>
-  <script src="{assets_prefix}/js/components/footer-loader.js"></script>
-  <script type="module" src="{assets_prefix}/js/main.js?v=2"></script>
-  <script type="module" src="{assets_prefix}/js/pages/all-products.js?v=3"></script>
-  <script src="{assets_prefix}/js/components/login-modal.js?v=2"></script>
-  <script src="{assets_prefix}/js/client-filters.js"></script>
+  {{site_footer}}
+  <script src="{{assets_prefix}}/js/components/header-loader.js"></script>
+  <script src="{{assets_prefix}}/js/components/footer-loader.js"></script>
+  <script type="module" src="{{assets_prefix}}/js/main.js?v=2"></script>
+  <script type="module" src="{{assets_prefix}}/js/pages/all-products.js?v=3"></script>
+  <script src="{{assets_prefix}}/js/components/login-modal.js?v=2"></script>
+  <script src="{{assets_prefix}}/js/client-filters.js"></script>
   <script>
-    (function() {{
+    (function() {
       const pathParts = window.location.pathname.split('/').filter(Boolean);
       const productenIndex = pathParts.indexOf('producten');
-      if (productenIndex !== -1 && pathParts[productenIndex + 1]) {{
+      if (productenIndex !== -1 && pathParts[productenIndex + 1]) {
         const category = pathParts[productenIndex + 1];
-        if (!window.location.search.includes('cat=')) {{
+        if (!window.location.search.includes('cat=')) {
           window.history.replaceState(null, '', window.location.pathname + '?cat=' + category);
-        }}
-      }}
-    }})();
+        }
+      }
+    })();
   </script>
 </body>
-</html>'''
-
+</html>''').bind(
+    assets_prefix='../../../assets',
+    home_link='../../index.html',
+    products_link='../index.html',
+)
 
-def get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES):
-    subcategory = SUBCATEGORIES[subcategory_slug]
-    parent_slug = subcategory['parent_category']
-    parent = CATEGORIES[parent_slug]
-    labels = LABELS[locale]
-    title = subcategory['title_translations'].get(locale, subcategory['title'])
-    description = subcategory['description_translations'].get(locale, subcategory['description'])
-    long_description = subcategory.get('long_description_translations', {}).get(locale, subcategory.get('long_description', description))
-    parent_title = parent['title_translations'].get(locale, parent['title'])
-    assets_prefix = '../../../../assets'
-    home_link = '../../../index.html'
-    products_link = '../../index.html'
-    category_link = '../'
-    path_suffix = f'producten/{parent_slug}/{subcategory_slug}/'
-    hreflang_tags = get_hreflang_tags(locale, path_suffix)
-    canonical = f'  <link rel="canonical" href="{BASE_URL}/{locale}/{path_suffix}">'
-    
-    return f'''<!DOCTYPE html>
-<html lang="{locale.replace('-', '_')}">
+# Subcategory pages live at /<locale>/producten/<category>/<subcategory>/
+SUBCATEGORY_PAGE = PageTemplate('''<!DOCTYPE html>
+<html lang="{{lang}}">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <meta name="description" content="{description[:155]}">
-  <title>{title} {labels['meta_suffix']}</title>
-  <link rel="preload" href="{assets_prefix}/css/fonts.css" as="style">
-  <link rel="stylesheet" href="{assets_prefix}/css/fonts.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/global.css?v=8">
-  <link rel="stylesheet" href="{assets_prefix}/css/components/mega-menu.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/pages/category.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/pages/products.css">
-  <link rel="icon" type="image/svg+xml" href="{assets_prefix}/images/static/favicon.svg">
-{canonical}
-{hreflang_tags}
+  <meta name="description" content="{{meta_desc}}">
+  <title>{{title}} {{label_meta_suffix}}</title>
+  <link rel="preload" href="{{assets_prefix}}/css/fonts.css" as="style">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/fonts.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/global.css?v=8">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/components/mega-menu.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/pages/category.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/pages/products.css">
+  <link rel="icon" type="image/svg+xml" href="{{assets_prefix}}/images/static/favicon.svg">
+{{canonical}}
+{{hreflang_tags}}
 </head>
 <body>
-  <div id="header-placeholder"></div>
+  {{site_header}}
   <main style="padding-top: 0;">
     <section class="page-hero" style="padding-top: var(--space-8);">
       <div class="container">
         <nav class="breadcrumb" aria-label="Kruimelpad">
-          <a href="{home_link}">{labels['home']}</a><span>/</span>
-          <a href="{products_link}">{labels['products']}</a><span>/</span>
-          <a href="{category_link}">{parent_title}</a><span>/</span>
-          <span aria-current="page">{title}</span>
+          <a href="{{home_link}}">{{label_home}}</a><span>/</span>
+          <a href="{{products_link}}">{{label_products}}</a><span>/</span>
+          <a href="{{category_link}}">{{parent_title}}</a><span>/</span>
+          <span aria-current="page">{{title}}</span>
         </nav>
         <div class="page-hero-content">
           <div class="page-hero-text">
-            <h1 class="page-title">{title.upper()}</h1>
-            <p class="page-subtitle">{description}</p>
+            <h1 class="page-title">{{title_upper}}</h1>
+            <p class="page-subtitle">{{description}}</p>
           </div>
         </div>
       </div>
@@ -240,16 +254,16 @@ def get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LA
         <div class="category-layout">
           <aside class="filters-sidebar" id="filters-sidebar">
             <div class="filters-header">
-              <h3 class="filters-title">{labels['filters']}</h3>
-              <button class="btn-text" id="clear-filters">{labels['clear']}</button>
+              <h3 class="filters-title">{{label_filters}}</h3>
+              <button class="btn-text" id="clear-filters">{{label_clear}}</button>
             </div>
             <div class="filter-group" style="display: none;">
-              <h4 class="filter-group-title">{labels['brand']}</h4>
-              <div id="brand-filters-loading" class="filter-loading"><div class="spinner-small"></div><span>{labels['loading_brands']}</span></div>
+              <h4 class="filter-group-title">{{label_brand}}</h4>
+              <div id="brand-filters-loading" class="filter-loading"><div class="spinner-small"></div><span>{{label_loading_brands}}</span></div>
               <div id="brand-filters-container" style="display: none;"></div>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['volume']}</h4>
+              <h4 class="filter-group-title">{{label_volume}}</h4>
               <div class="range-slider">
                 <input type="range" id="volume-min" min="0" max="5000" value="0" step="100">
                 <input type="range" id="volume-max" min="0" max="5000" value="5000" step="100">
@@ -257,7 +271,7 @@ def get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LA
               </div>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['excavator_class']}</h4>
+              <h4 class="filter-group-title">{{label_excavator_class}}</h4>
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="1500"><span>1,5 - 3 ton</span></label>
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="4000"><span>3 - 8 ton</span></label>
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="12000"><span>8 - 15 ton</span></label>
@@ -265,7 +279,7 @@ def get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LA
               <label class="checkbox-label"><input type="checkbox" name="excavator" value="30000"><span>25 - 50 ton</span></label>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['width']}</h4>
+              <h4 class="filter-group-title">{{label_width}}</h4>
               <label class="checkbox-label"><input type="checkbox" name="width" value="300"><span>300mm</span></label>
               <label class="checkbox-label"><input type="checkbox" name="width" value="600"><span>600mm</span></label>
               <label class="checkbox-label"><input type="checkbox" name="width" value="800"><span>800mm</span></label>
@@ -273,67 +287,214 @@ def get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LA
               <label class="checkbox-label"><input type="checkbox" name="width" value="1500"><span>1500mm</span></label>
             </div>
             <div class="filter-group">
-              <h4 class="filter-group-title">{labels['attachment']}</h4>
+              <h4 class="filter-group-title">{{label_attachment}}</h4>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW05"><span>CW05</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW10"><span>CW10</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW20"><span>CW20</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW30"><span>CW30</span></label>
               <label class="checkbox-label"><input type="checkbox" name="attachment" value="CW40"><span>CW40</span></label>
             </div>
-            <button class="btn btn-primary btn-full" id="apply-filters" style="display: none;">{labels['apply_filters']}</button>
+            <button class="btn btn-primary btn-full" id="apply-filters" style="display: none;">{{label_apply_filters}}</button>
           </aside>
           <div class="category-content">
             <div id="category-header" class="category-header" style="display: block;">
-              <h2 class="category-header-title">{title.upper()}</h2>
-              <p class="category-header-description">{long_description}</p>
+              <h2 class="category-header-title">{{title_upper}}</h2>
+              <p class="category-header-description">{{long_description}}</p>
             </div>
             <div class="products-toolbar">
               <div class="toolbar-left">
                 <button class="btn-filter-toggle" id="toggle-filters">
                   <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="4" y1="6" x2="20" y2="6"></line><line x1="4" y1="12" x2="20" y2="12"></line><line x1="4" y1="18" x2="20" y2="18"></line></svg>
-                  {labels['filters']}
+                  {{label_filters}}
                 </button>
-                <span class="products-count-text"><strong id="products-count">0</strong> {labels['products_found']}</span>
+                <span class="products-count-text"><strong id="products-count">{{products_count}}</strong> {{label_products_found}}</span>
               </div>
               <div class="toolbar-right">
-                <label for="sort-select" class="sort-label">{labels['sort']}</label>
+                <label for="sort-select" class="sort-label">{{label_sort}}</label>
                 <select id="sort-select" class="sort-select">
-                  <option value="newest">{labels['newest']}</option>
-                  <option value="oldest">{labels['oldest']}</option>
-                  <option value="title_asc">{labels['name_az']}</option>
-                  <option value="title_desc">{labels['name_za']}</option>
+                  <option value="newest">{{label_newest}}</option>
+                  <option value="oldest">{{label_oldest}}</option>
+                  <option value="title_asc">{{label_name_az}}</option>
+                  <option value="title_desc">{{label_name_za}}</option>
                 </select>
               </div>
             </div>
-            <div class="products-list" id="products-grid"><div class="loading"><div class="spinner"></div><p>{labels['loading']}</p></div></div>
+            <div class="products-list" id="products-grid"{{grid_attributes}}>{{products_html}}</div>
             <div class="pagination" id="pagination" style="display: none;">
-              <button class="pagination-btn" id="prev-page" disabled>{labels['prev']}</button>
+              <button class="pagination-btn" id="prev-page" disabled>{{label_prev}}</button>
               <span class="pagination-info" id="pagination-info">Pagina 1 van 1</span>
-              <button class="pagination-btn" id="next-page" disabled>{labels['next']}</button>
+              <button class="pagination-btn" id="next-page" disabled>{{label_next}}</button>
             </div>
           </div>
         </div>
       </div>
     </section>
   </main>
-  <div id="footer-placeholder"></div>
-  <script src="{assets_prefix}/js/components/header-loader.js"></script>
-  <script src="{assets_prefix}/js/components/footer-loader.js"></script>
-  <script type="module" src="{assets_prefix}/js/main.js?v=2"></script>
-  <script type="module" src="{assets_prefix}/js/pages/all-products.js?v=3"></script>
-  <script src="{assets_prefix}/js/components/login-modal.js?v=2"></script>
-  <script src="{assets_prefix}/js/client-filters.js"></script>
+  {{site_footer}}
+  <script src="{{assets_prefix}}/js/components/header-loader.js"></script>
+  <script src="{{assets_prefix}}/js/components/footer-loader.js"></script>
+  <script type="module" src="{{assets_prefix}}/js/main.js?v=2"></script>
+  <script type="module" src="{{assets_prefix}}/js/pages/all-products.js?v=3"></script>
+  <script src="{{assets_prefix}}/js/components/login-modal.js?v=2"></script>
+  <script src="{{assets_prefix}}/js/client-filters.js"></script>
   <script>
-    (function() {{
+    (function() {
       const pathParts = window.location.pathname.split('/').filter(Boolean);
       const productenIndex = pathParts.indexOf('producten');
-      if (productenIndex !== -1 && pathParts[productenIndex + 2]) {{
+      if (productenIndex !== -1 && pathParts[productenIndex + 2]) {
         const subcategory = pathParts[productenIndex + 2];
-        if (!window.location.search.includes('cat=')) {{
+        if (!window.location.search.includes('cat=')) {
           window.history.replaceState(null, '', window.location.pathname + '?cat=' + subcategory);
-        }}
-      }}
-    }})();
+        }
+      }
+    })();
   </script>
 </body>
-</html>'''
+</html>''').bind(
+    assets_prefix='../../../../assets',
+    home_link='../../../index.html',
+    products_link='../../index.html',
+    category_link='../',
+)
+
+_locale_templates = {}
+
+def get_locale_template(template, locale, labels):
+    """Return `template` with the locale and its labels bound, compiling it only once."""
+    key = (id(template), locale, tuple(sorted(labels.items())))
+    if key not in _locale_templates:
+        _locale_templates[key] = template.bind(
+            lang=locale.replace('-', '_'),
+            **{f'label_{name}': value for name, value in labels.items()},
+        )
+    return _locale_templates[key]
+
+def format_number(value):
+    """Print a spec value the way JavaScript does (250.0 -> 250)."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def format_tonnage(value):
+    """1.5 -> '1,5', as the machine class on the JavaScript cards."""
+    return f'{float(value):.1f}'.replace('.', ',')
+
+def get_card_specs(card, labels):
+    rows = []
+    if card.get('weight'):
+        rows.append((labels['card_weight'], f"{format_number(card['weight'])} kg"))
+    if card.get('width'):
+        rows.append((labels['card_width'], f"{format_number(card['width'])} mm"))
+    if card.get('volume'):
+        rows.append((labels['card_volume'], f"{format_number(card['volume'])} liter"))
+    if card.get('excavator_weight_min') and card.get('excavator_weight_max'):
+        tonnage = f"{format_tonnage(card['excavator_weight_min'])} - {format_tonnage(card['excavator_weight_max'])} ton"
+        rows.append((labels['card_machine_class'], tonnage))
+    if card.get('attachment_type'):
+        rows.append((labels['card_attachment'], escape(str(card['attachment_type']))))
+    return ''.join(SPEC_ROW.render(label=label, value=value) for label, value in rows)
+
+def get_product_card(card, locale, labels, depth):
+    """One listing card; product links are relative to a page `depth` folders below the locale root."""
+    product_id = str(card.get('id', ''))
+    placeholder = PLACEHOLDER_PHOTOS[ord(product_id[0]) % len(PLACEHOLDER_PHOTOS) if product_id else 0]
+    return get_locale_template(PRODUCT_CARD, locale, labels).render(
+        id=escape(product_id),
+        url='../' * depth + card_path(card),
+        image=escape(card.get('image') or placeholder),
+        title=escape(card.get('title', '')),
+        specs=get_card_specs(card, labels),
+        width=escape(format_number(card.get('width') or '')),
+        volume=escape(format_number(card.get('volume') or '')),
+        attachment=escape(str(card.get('attachment_type') or '')),
+        excavator_min=escape(format_number(card.get('excavator_weight_min') or '')),
+        excavator_max=escape(format_number(card.get('excavator_weight_max') or '')),
+        brand=escape(card.get('brand_slug') or ''),
+    )
+
+def get_product_listing(cards, locale, labels, depth):
+    """Slot values for the products grid: the first page of `cards`, or the loader without a listing."""
+    if cards is None:
+        return {
+            'products_html': PRODUCTS_LOADING.render(label_loading=labels['loading']),
+            'products_count': 0,
+            'grid_attributes': '',
+        }
+    return {
+        'products_html': ''.join(get_product_card(card, locale, labels, depth) for card in cards[:PAGE_SIZE]) + '\n            ',
+        'products_count': len(cards),
+        'grid_attributes': f' data-prerendered="true" data-total="{len(cards)}"',
+    }
+
+def get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES, listing=None):
+    category = CATEGORIES[category_slug]
+    title = category['title_translations'].get(locale, category['title'])
+    description = category['description_translations'].get(locale, category['description'])
+    path_suffix = f'producten/{category_slug}/'
+    hreflang_tags = get_hreflang_tags(locale, path_suffix)
+    canonical = f'  <link rel="canonical" href="{BASE_URL}/{locale}/{path_suffix}">'
+    
+    labels = LABELS[locale]
+    
+    # Build subcategory cards; with a listing, empty subcategories are left out
+    # and each card shows its product count and first product image
+    subcat_cards = []
+    for subcat_slug in category.get('subcategories', []):
+        subcat = SUBCATEGORIES.get(subcat_slug, {})
+        subcat_title = subcat.get('title_translations', {}).get(locale, subcat.get('title', subcat_slug))
+        image, count_html = DEFAULT_SUBCATEGORY_IMAGE, ''
+        if listing is not None:
+            subcat_products = listing.in_subcategory(subcat_slug)
+            if not subcat_products:
+                continue
+            count = len(subcat_products)
+            image = next((card['image'] for card in subcat_products if card.get('image')), image)
+            count_html = SUBCATEGORY_COUNT.render(
+                count=count, count_label=labels['product'] if count == 1 else labels['products_lower'])
+        subcat_cards.append(SUBCATEGORY_CARD.render(
+            subcat_slug=subcat_slug, subcat_title=subcat_title, image=escape(image), count_html=count_html))
+    subcategories_html = '\n            '.join(subcat_cards)
+    products = listing.in_category(category_slug) if listing is not None else None
+    
+    return get_locale_template(CATEGORY_PAGE, locale, labels).render(
+        **get_product_listing(products, locale, labels, 2),
+        meta_desc=description[:155],
+        title=title,
+        title_upper=title.upper(),
+        description=description,
+        canonical=canonical,
+        hreflang_tags=hreflang_tags,
+        subcategories_html=subcategories_html,
+        subcategories_display='block' if subcat_cards else 'none',
+        site_header=render_header(locale, 2, path_suffix),
+        site_footer=render_footer(locale, 2),
+    )
+
+
+def get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES, listing=None):
+    subcategory = SUBCATEGORIES[subcategory_slug]
+    parent_slug = subcategory['parent_category']
+    parent = CATEGORIES[parent_slug]
+    title = subcategory['title_translations'].get(locale, subcategory['title'])
+    description = subcategory['description_translations'].get(locale, subcategory['description'])
+    long_description = subcategory.get('long_description_translations', {}).get(locale, subcategory.get('long_description', description))
+    parent_title = parent['title_translations'].get(locale, parent['title'])
+    path_suffix = f'producten/{parent_slug}/{subcategory_slug}/'
+    hreflang_tags = get_hreflang_tags(locale, path_suffix)
+    canonical = f'  <link rel="canonical" href="{BASE_URL}/{locale}/{path_suffix}">'
+    
+    products = listing.in_subcategory(subcategory_slug) if listing is not None else None
+    
+    return get_locale_template(SUBCATEGORY_PAGE, locale, LABELS[locale]).render(
+        **get_product_listing(products, locale, LABELS[locale], 3),
+        meta_desc=description[:155],
+        title=title,
+        title_upper=title.upper(),
+        description=description,
+        long_description=long_description,
+        parent_title=parent_title,
+        canonical=canonical,
+        hreflang_tags=hreflang_tags,
+        site_header=render_header(locale, 3, path_suffix),
+        site_footer=render_footer(locale, 3),
+    )
@@ -6,11 +6,12 @@ Remove all remaining Adapters/Adapterstukken references from locale folders.
 import os
 import re
 
-def cleanup_file(filepath):
+from site_inventory import SiteInventory
+
+def cleanup_file(page):
     """Remove adapters references from a file."""
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = page.read()
     
     original = content
     
@@ -34,27 +35,18 @@ def cleanup_file(filepath):
     content = re.sub(r'<a href="[^"]*\?cat=adapters[^"]*"[^>]*>[^<]*</a>\s*', '', content)
     
     if content != original:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        page.write(content)
         return True
     return False
 
 def process_folder(web_root, folder):
     """Process all HTML files in a folder."""
     
-    folder_path = os.path.join(web_root, folder)
-    if not os.path.exists(folder_path):
-        return 0
-    
     count = 0
-    for root, dirs, files in os.walk(folder_path):
-        for filename in files:
-            if filename.endswith('.html'):
-                filepath = os.path.join(root, filename)
-                if cleanup_file(filepath):
-                    rel_path = os.path.relpath(filepath, web_root)
-                    print(f"  ✓ {rel_path}")
-                    count += 1
+    for page in SiteInventory.load(web_root).pages(under=folder):
+        if cleanup_file(page):
+            print(f"  ✓ {page.rel}")
+            count += 1
     
     return count
 
@@ -71,6 +63,7 @@ def main():
         count = process_folder(web_root, folder)
         total += count
     
+    SiteInventory.load(web_root).save()
     print()
     print(f"Total files cleaned: {total}")
 
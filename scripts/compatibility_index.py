@@ -0,0 +1,87 @@
+"""
+Excavator model -> compatible products, published with the static JSON API.
+Joins the machine models of brand-data.js (tonnage, CW coupler) with the
+excavator weight range and attachment type of the products in the listing
+snapshot, one shard per brand:
+
+    compat/<brand>.json    {"models": {model: {"tonnage", "cw", "products": {category: [ids]}}}}
+
+A product fits a model when the model's tonnage lies within the product's
+excavator_weight_min..max and, if both are known, the product's attachment
+type is the model's coupler. Product ids are in listing order (newest first)
+and point into the categories/<slug>.json shards.
+
+The products' tonnage ranges are swept once per brand with the models in
+tonnage order: ranges enter when the sweep passes their minimum and leave
+(through a heap on their maximum) once it passes their maximum, so the cost
+grows with the catalog plus the matches instead of models x products.
+
+Usage:
+    from compatibility_index import build_compatibility_shards
+
+    shards = build_compatibility_shards(listing)   # {shard name: data}
+"""
+
+import heapq
+
+from brand_data import load_brands
+from product_listing import newest_first
+
+COMPAT_VERSION = 1
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def tonnage_ranges(cards):
+    """(min, max, order, card) of every card with an excavator weight range, by minimum."""
+    ranges = []
+    for order, card in enumerate(cards):
+        low, high = to_float(card.get('excavator_weight_min')), to_float(card.get('excavator_weight_max'))
+        if high and low <= high:
+            ranges.append((low, high, order, card))
+    return sorted(ranges, key=lambda entry: entry[0])
+
+
+def stab(ranges, points):
+    """Yield (point, cards whose range contains it, in listing order) for `points` in ascending order."""
+    active, ends, next_range = {}, [], 0
+    for point in points:
+        while next_range < len(ranges) and ranges[next_range][0] <= point:
+            low, high, order, card = ranges[next_range]
+            active[order] = card
+            heapq.heappush(ends, (high, order))
+            next_range += 1
+        while ends and ends[0][0] < point:
+            active.pop(heapq.heappop(ends)[1], None)
+        yield point, [active[order] for order in sorted(active)]
+
+
+def fits_coupler(card, cw):
+    attachment = card.get('attachment_type')
+    return not (attachment and cw) or attachment == cw
+
+
+def brand_compatibility(brand, ranges):
+    """Compat shard of a brand; its models in tonnage order."""
+    models = sorted(brand['models'], key=lambda model: model['tonnage'])
+    fitting = [cards for _, cards in stab(ranges, [model['tonnage'] for model in models])]
+
+    compatible = {}
+    for model, cards in zip(models, fitting):
+        by_category = {}
+        for card in cards:
+            if fits_coupler(card, model['cw']) and card.get('id') is not None:
+                by_category.setdefault(card['category_slug'], []).append(card['id'])
+        compatible[model['name']] = {'tonnage': model['tonnage'], 'cw': model['cw'], 'products': by_category}
+    return {'version': COMPAT_VERSION, 'brand': brand['name'], 'models': compatible}
+
+
+def build_compatibility_shards(listing):
+    """{shard name: data}, a compat/<brand> shard per brand of brand-data.js."""
+    ranges = tonnage_ranges(newest_first(listing.cards.values()))
+    return {f'compat/{slug}': brand_compatibility(brand, ranges) for slug, brand in load_brands().items()}
@@ -6,6 +6,8 @@ These redirect to the appropriate locale version based on user preference.
 
 import os
 
+from output_writer import OutputWriter
+
 # Configuration
 DEFAULT_LOCALE = 'be-nl'
 
@@ -61,7 +63,7 @@ REDIRECT_TEMPLATE = '''<!DOCTYPE html>
 </html>
 '''
 
-def create_redirect(web_root, page_folder, page_path):
+def create_redirect(web_root, page_folder, page_path, writer):
     """Create a redirect page for a legacy URL."""
     
     folder_path = os.path.join(web_root, page_folder)
@@ -77,10 +79,7 @@ def create_redirect(web_root, page_folder, page_path):
         page_path=page_path
     )
     
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    return True
+    return writer.write(index_path, content)
 
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -107,14 +106,13 @@ def main():
     print("Creating legacy redirect pages...")
     print()
     
-    created = 0
+    writer = OutputWriter()
     for folder, page_path in legacy_pages:
-        if create_redirect(web_root, folder, page_path):
+        if create_redirect(web_root, folder, page_path, writer):
             print(f"  ✓ /{folder}/ -> /{DEFAULT_LOCALE}/{page_path}")
-            created += 1
     
     print()
-    print(f"Created {created} redirect pages")
+    print(f"Redirect pages: {writer.summary()}")
 
 if __name__ == '__main__':
     main()
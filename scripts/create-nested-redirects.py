@@ -5,6 +5,9 @@ Create redirect pages for nested legacy URLs (slotenbakken, kraanbakken, etc.).
 
 import os
 
+from output_writer import OutputWriter
+from site_inventory import SiteInventory
+
 DEFAULT_LOCALE = 'be-nl'
 
 REDIRECT_TEMPLATE = '''<!DOCTYPE html>
@@ -59,32 +62,23 @@ REDIRECT_TEMPLATE = '''<!DOCTYPE html>
 </html>
 '''
 
-def create_redirect_for_folder(web_root, folder_path):
+def create_redirect_for_folder(web_root, folder_path, writer):
     """Create redirect for a folder and all its subfolders."""
-    full_path = os.path.join(web_root, folder_path)
-    
-    if not os.path.exists(full_path):
-        return 0
-    
     count = 0
     
-    for root, dirs, files in os.walk(full_path):
-        for filename in files:
-            if filename == 'index.html':
-                filepath = os.path.join(root, filename)
-                rel_path = os.path.relpath(root, web_root)
-                page_path = rel_path + '/'
-                
-                content = REDIRECT_TEMPLATE.format(
-                    default_locale=DEFAULT_LOCALE,
-                    page_path=page_path
-                )
-                
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                print(f"  ✓ /{rel_path}/ -> /{DEFAULT_LOCALE}/{page_path}")
-                count += 1
+    for page in SiteInventory.load(web_root).pages(under=folder_path):
+        if not page.is_index:
+            continue
+        page_path = page.url_path
+        
+        content = REDIRECT_TEMPLATE.format(
+            default_locale=DEFAULT_LOCALE,
+            page_path=page_path
+        )
+        
+        if writer.write(page.path, content):
+            print(f"  ✓ /{page_path} -> /{DEFAULT_LOCALE}/{page_path}")
+        count += 1
     
     return count
 
@@ -105,14 +99,16 @@ def main():
     print("Creating nested legacy redirect pages...")
     print()
     
+    writer = OutputWriter()
     total = 0
     for folder in nested_folders:
         print(f"Processing /{folder}/...")
-        count = create_redirect_for_folder(web_root, folder)
+        count = create_redirect_for_folder(web_root, folder, writer)
         total += count
         print()
     
-    print(f"Total: {total} redirect pages created")
+    SiteInventory.load(web_root).save()
+    print(f"Total: {total} redirect pages ({writer.summary()})")
 
 if __name__ == '__main__':
     main()
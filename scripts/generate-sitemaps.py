@@ -1,115 +1,79 @@
 #!/usr/bin/env python3
 """
 Generate locale-specific sitemaps and sitemap index for multilanguage SEO.
+Only the static pages section of each sitemap is rebuilt; catalog and product
+entries are maintained by update_sitemaps.py and sync_products.py.
+Sitemaps are split into shards within the 50,000 URL / 50 MB limits and
+sitemap.xml indexes every shard. Use --gzip to write .xml.gz shards.
+<lastmod> only moves when a page's content hash changes (sitemap_ledger.json).
 """
 
 import os
+import argparse
 from datetime import datetime
 
+from output_writer import OutputWriter
+from site_inventory import SiteInventory
+from sitemap_store import SitemapStore, LastmodLedger, url_entry, update_sitemap_index
+
 # Configuration
 LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
-HREFLANG_MAP = {
-    'be-nl': 'nl-BE',
-    'nl-nl': 'nl-NL',
-    'be-fr': 'fr-BE',
-    'de-de': 'de-DE'
-}
-DEFAULT_LOCALE = 'be-nl'
 BASE_URL = 'https://structon.be'
 TODAY = datetime.now().strftime('%Y-%m-%d')
 
 def get_all_pages(web_root, locale):
-    """Get all HTML pages in a locale folder."""
-    locale_folder = os.path.join(web_root, locale)
-    pages = []
+    """Get all HTML pages in a locale folder, as {url path: page serving it}."""
+    pages = {}
     
-    for root, dirs, files in os.walk(locale_folder):
-        for filename in files:
-            if filename.endswith('.html'):
-                filepath = os.path.join(root, filename)
-                rel_path = os.path.relpath(filepath, locale_folder)
-                
-                # Convert to URL path
-                if rel_path == 'index.html':
-                    url_path = ''
-                else:
-                    url_path = os.path.dirname(rel_path) + '/'
-                
-                pages.append(url_path)
+    for page in SiteInventory.load(web_root).pages(locale):
+        # Other HTML files in a folder fall back to the folder URL
+        url_path = page.url_path
+        if not page.is_index:
+            url_path = url_path.rpartition('/')[0] + '/'
+        
+        # A folder's index.html is what its URL serves
+        if url_path not in pages or page.is_index:
+            pages[url_path] = page
     
-    return sorted(pages)
+    return dict(sorted(pages.items()))
 
-def generate_locale_sitemap(web_root, locale, pages):
-    """Generate sitemap XML for a single locale."""
-    
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"',
-        '        xmlns:xhtml="http://www.w3.org/1999/xhtml">',
-        ''
-    ]
+def get_page_settings(page):
+    """Priority and changefreq based on page type."""
+    if page == '':
+        return '1.0', 'daily'
+    elif page in ['producten/', 'contact/', 'over-ons/']:
+        return '0.9', 'weekly'
+    elif 'kraanbakken/' in page or 'slotenbakken/' in page:
+        return '0.8', 'weekly'
+    else:
+        return '0.7', 'monthly'
+
+def update_locale_sitemap(store, locale, pages):
+    """Make the static pages section of a locale sitemap match `pages`.
     
+    Pages already listed in another section (catalog or product pages) are
+    owned by their own generators and left alone. Returns the number of
+    entries added, changed or removed.
+    """
+    entries = []
     for page in pages:
         url = f'{BASE_URL}/{locale}/{page}'
-        
-        # Determine priority and changefreq based on page type
-        if page == '':
-            priority = '1.0'
-            changefreq = 'daily'
-        elif page in ['producten/', 'contact/', 'over-ons/']:
-            priority = '0.9'
-            changefreq = 'weekly'
-        elif 'kraanbakken/' in page or 'slotenbakken/' in page:
-            priority = '0.8'
-            changefreq = 'weekly'
-        else:
-            priority = '0.7'
-            changefreq = 'monthly'
-        
-        xml_lines.append('  <url>')
-        xml_lines.append(f'    <loc>{url}</loc>')
-        xml_lines.append(f'    <lastmod>{TODAY}</lastmod>')
-        xml_lines.append(f'    <changefreq>{changefreq}</changefreq>')
-        xml_lines.append(f'    <priority>{priority}</priority>')
-        
-        # Add hreflang alternates
-        for alt_locale in LOCALES:
-            hreflang = HREFLANG_MAP[alt_locale]
-            alt_url = f'{BASE_URL}/{alt_locale}/{page}'
-            xml_lines.append(f'    <xhtml:link rel="alternate" hreflang="{hreflang}" href="{alt_url}"/>')
-        
-        # Add x-default
-        default_url = f'{BASE_URL}/{DEFAULT_LOCALE}/{page}'
-        xml_lines.append(f'    <xhtml:link rel="alternate" hreflang="x-default" href="{default_url}"/>')
-        
-        xml_lines.append('  </url>')
-        xml_lines.append('')
-    
-    xml_lines.append('</urlset>')
-    
-    return '\n'.join(xml_lines)
+        if store.section_of(url) not in (None, 'pages'):
+            continue
+        priority, changefreq = get_page_settings(page)
+        entry = url_entry(locale, page, TODAY, changefreq=changefreq, priority=priority,
+                          base_url=BASE_URL, locales=LOCALES)
+        entries.append((entry, pages[page].digest()))
+    return store.replace_section('pages', entries)
 
-def generate_sitemap_index(locales):
-    """Generate sitemap index XML."""
-    
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-        ''
-    ]
-    
-    for locale in locales:
-        xml_lines.append('  <sitemap>')
-        xml_lines.append(f'    <loc>{BASE_URL}/sitemap-{locale}.xml</loc>')
-        xml_lines.append(f'    <lastmod>{TODAY}</lastmod>')
-        xml_lines.append('  </sitemap>')
-        xml_lines.append('')
-    
-    xml_lines.append('</sitemapindex>')
-    
-    return '\n'.join(xml_lines)
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate the Structon locale sitemaps and sitemap index.')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Write sitemaps as .xml.gz (existing .xml shards are replaced)')
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
     script_dir = os.path.dirname(os.path.abspath(__file__))
     web_root = os.path.join(os.path.dirname(script_dir), 'web')
     
@@ -117,6 +81,8 @@ def main():
     print(f"Base URL: {BASE_URL}")
     print()
     
+    writer = OutputWriter()
+    ledger = LastmodLedger.load()
     for locale in LOCALES:
         locale_folder = os.path.join(web_root, locale)
         if not os.path.exists(locale_folder):
@@ -124,25 +90,24 @@ def main():
             continue
         
         pages = get_all_pages(web_root, locale)
-        sitemap_content = generate_locale_sitemap(web_root, locale, pages)
-        
-        sitemap_path = os.path.join(web_root, f'sitemap-{locale}.xml')
-        with open(sitemap_path, 'w', encoding='utf-8') as f:
-            f.write(sitemap_content)
+        store = SitemapStore.load(os.path.join(web_root, f'sitemap-{locale}.xml'), ledger)
+        if args.gzip:
+            store.compress = True
+        changes = update_locale_sitemap(store, locale, pages)
+        store.save(writer)
         
-        print(f"  ✓ sitemap-{locale}.xml ({len(pages)} URLs)")
+        print(f"  ✓ sitemap-{locale}.xml ({len(pages)} pages, {changes} URLs changed, {len(store)} total)")
     
     print()
     print("Generating sitemap index...")
     
-    index_content = generate_sitemap_index(LOCALES)
-    index_path = os.path.join(web_root, 'sitemap.xml')
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(index_content)
+    ledger.save()
+    SiteInventory.load(web_root).save()
+    update_sitemap_index(web_root, LOCALES, TODAY, BASE_URL, writer)
     
-    print(f"  ✓ sitemap.xml (index with {len(LOCALES)} sitemaps)")
+    print("  ✓ sitemap.xml (index over all sitemap shards)")
     print()
-    print("Done!")
+    print(f"Done! {writer.summary()}")
 
 if __name__ == '__main__':
     main()
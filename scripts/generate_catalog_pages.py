@@ -2,6 +2,10 @@
 """
 Structon Catalog Page Generator
 Generates static HTML pages for categories and subcategories with clean URLs.
+Header and footer are baked into each page (see site_layout.py).
+Product cards, counts and subcategory images are rendered from the listing
+snapshot kept by sync_products.py (see product_listing.py); without one the
+pages load their products through the API.
 """
 
 import os
@@ -13,6 +17,8 @@ BASE_URL = 'https://leelars.github.io/Structon'
 
 # Import data from separate file
 from catalog_data import CATEGORIES, SUBCATEGORIES, LABELS
+from output_writer import OutputWriter
+from product_listing import ProductListing
 
 def get_hreflang_tags(locale, path_suffix):
     tags = []
@@ -25,44 +31,52 @@ def get_hreflang_tags(locale, path_suffix):
 def get_canonical_tag(locale, path_suffix):
     return f'  <link rel="canonical" href="{BASE_URL}/{locale}/{path_suffix}">'
 
-def generate_category_page(category_slug, locale):
+def generate_category_page(category_slug, locale, listing=None):
     from catalog_templates import get_category_html
-    return get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES)
+    return get_category_html(category_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES, listing)
 
-def generate_subcategory_page(subcategory_slug, locale):
+def generate_subcategory_page(subcategory_slug, locale, listing=None):
     from catalog_templates import get_subcategory_html
-    return get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES)
+    return get_subcategory_html(subcategory_slug, locale, CATEGORIES, SUBCATEGORIES, LABELS, BASE_URL, LOCALES, listing)
 
-def main():
-    print("🚀 Structon Catalog Page Generator")
-    print("=" * 50)
-    
-    pages_created = 0
-    
+def write_catalog_pages(writer, listing=None, verbose=True, categories=None):
+    """Render the category and subcategory pages of `categories` (default: all) in every locale."""
     for locale in LOCALES:
-        print(f"\n📁 Processing locale: {locale}")
+        if verbose:
+            print(f"\n📁 Processing locale: {locale}")
         
         # Create category pages
         for category_slug in CATEGORIES:
+            if categories is not None and category_slug not in categories:
+                continue
             category_dir = WEB_ROOT / locale / 'producten' / category_slug
-            category_dir.mkdir(parents=True, exist_ok=True)
             
-            html = generate_category_page(category_slug, locale)
-            (category_dir / 'index.html').write_text(html, encoding='utf-8')
-            pages_created += 1
-            print(f"  ✅ Created: /{locale}/producten/{category_slug}/")
+            html = generate_category_page(category_slug, locale, listing)
+            if writer.write(category_dir / 'index.html', html) and verbose:
+                print(f"  ✅ Updated: /{locale}/producten/{category_slug}/")
             
             # Create subcategory pages
             for subcat_slug in CATEGORIES[category_slug].get('subcategories', []):
                 subcat_dir = category_dir / subcat_slug
-                subcat_dir.mkdir(parents=True, exist_ok=True)
                 
-                html = generate_subcategory_page(subcat_slug, locale)
-                (subcat_dir / 'index.html').write_text(html, encoding='utf-8')
-                pages_created += 1
-                print(f"    ✅ Created: /{locale}/producten/{category_slug}/{subcat_slug}/")
+                html = generate_subcategory_page(subcat_slug, locale, listing)
+                if writer.write(subcat_dir / 'index.html', html) and verbose:
+                    print(f"    ✅ Updated: /{locale}/producten/{category_slug}/{subcat_slug}/")
+
+def main():
+    print("🚀 Structon Catalog Page Generator")
+    print("=" * 50)
+    
+    listing = ProductListing.load()
+    if listing:
+        print(f"📦 Listing snapshot: {len(listing.cards)} products")
+    else:
+        print("ℹ️ No listing snapshot yet (run sync_products.py), products load through the API")
+    
+    writer = OutputWriter()
+    write_catalog_pages(writer, listing or None)
     
-    print(f"\n🎉 Done! Created {pages_created} pages across {len(LOCALES)} locales.")
+    print(f"\n🎉 Done! {writer.summary()} across {len(LOCALES)} locales.")
     print("\n📋 Next steps:")
     print("  1. Update internal links to use clean URLs")
     print("  2. Update sitemap.xml with new URLs")
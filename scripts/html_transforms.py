@@ -0,0 +1,166 @@
+"""
+The HTML rewrites shared by the fix-*/add-* scripts, registered as
+rewrite_pipeline transforms. Each one is a pure function of a page's text and
+its site inventory record, so the standalone scripts and rewrite-pages.py run
+exactly the same code. Registration order is pipeline order.
+"""
+
+import re
+
+from rewrite_pipeline import transform
+from site_layout import HEADER_START, bake_layout
+
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+HREFLANG_MAP = {
+    'be-nl': 'nl-BE',
+    'nl-nl': 'nl-NL',
+    'be-fr': 'fr-BE',
+    'de-de': 'de-DE'
+}
+DEFAULT_LOCALE = 'be-nl'
+BASE_URL = 'https://structon.be'
+
+# html lang attribute per locale folder
+LOCALE_LANG = HREFLANG_MAP
+
+# Pages that exist in locale folders
+LOCALE_PAGES = [
+    'contact', 'over-ons', 'blog', 'faq', 'dealer', 'configurator',
+    'producten', 'privacy', 'voorwaarden', 'login', 'sitemap-pagina',
+    'offerte-aanvragen', 'sorteergrijpers', 'sloophamers', 'slotenbakken',
+    'kraanbakken', 'industrieen', 'sectoren', 'kennisbank', 'account'
+]
+
+# Absolute link to a locale page: /contact/, /contact/form/ or /contact
+ABSOLUTE_LINK_PATTERN = re.compile(r'href="/(' + '|'.join(map(re.escape, LOCALE_PAGES)) + r')(/[^"]*)?(")')
+HTML_LANG_PATTERN = re.compile(r'<html lang="[^"]*"')
+SCRIPTS_BEFORE_BODY_PATTERN = re.compile(r'(<script[^>]*>.*?</script>\s*)+\s*</body>', re.DOTALL)
+SCRIPT_OPEN_PATTERN = re.compile(r'\s*<script[^>]*>')
+BODY_CLOSE_PATTERN = re.compile(r'(</body>)')
+
+# Folders fix-missing-headers never touches
+HEADER_SKIP_FOLDERS = ('node_modules', '.git', 'cms')
+
+
+def root_prefix(page):
+    """Relative prefix from a page back to the web root."""
+    return '../' * page.rel.count('/')
+
+
+@transform('fix-locale-paths')
+def fix_locale_paths(content, page):
+    """Add one ../ to asset paths, for the extra locale folder level."""
+    depth = page.depth
+
+    # Prefix to get back to web root from this file
+    # depth 0 = index.html in locale folder -> ../
+    # depth 1 = contact/index.html -> ../../
+    prefix = '../' * (depth + 1)
+
+    # What the file had before it moved into the locale folder
+    # depth 0 = index.html -> had assets/ -> needs ../assets/
+    # depth 1 = contact/index.html -> had ../assets/ -> needs ../../assets/
+    # depth 2 = slotenbakken/caterpillar/index.html -> had ../../assets/ -> needs ../../../assets/
+    original_prefix = r'\.\./' * depth
+
+    replacements = [
+        (r'href="' + original_prefix + r'assets/', f'href="{prefix}assets/'),
+        (r"href='" + original_prefix + r"assets/", f"href='{prefix}assets/"),
+        (r'src="' + original_prefix + r'assets/', f'src="{prefix}assets/'),
+        (r"src='" + original_prefix + r"assets/", f"src='{prefix}assets/"),
+    ]
+
+    for pattern, replacement in replacements:
+        content = re.sub(pattern, replacement, content)
+    return content
+
+
+@transform('fix-absolute-links')
+def fix_absolute_links(content, page):
+    """Make absolute links to locale pages relative within the locale."""
+    # Prefix to get back to locale root
+    prefix = '../' * page.depth
+    return ABSOLUTE_LINK_PATTERN.sub(rf'href="{prefix}\1\2\3', content)
+
+
+def get_hreflang_tags(page_path, current_locale=None):
+    """Generate hreflang tags for a page."""
+    tags = []
+
+    for locale in LOCALES:
+        hreflang = HREFLANG_MAP[locale]
+        url = f'{BASE_URL}/{locale}/{page_path}'
+        tags.append(f'  <link rel="alternate" hreflang="{hreflang}" href="{url}">')
+
+    # Add x-default pointing to default locale
+    default_url = f'{BASE_URL}/{DEFAULT_LOCALE}/{page_path}'
+    tags.append(f'  <link rel="alternate" hreflang="x-default" href="{default_url}">')
+
+    return '\n'.join(tags)
+
+
+@transform('add-hreflang')
+def add_hreflang(content, page):
+    """Add hreflang alternates before </head> (pages that have none yet)."""
+    if 'hreflang=' in content or '</head>' not in content:
+        return content
+
+    hreflang_tags = get_hreflang_tags(page.url_path, page.locale)
+    hreflang_block = f'\n  <!-- Hreflang tags for multilanguage SEO -->\n{hreflang_tags}\n'
+    return content.replace('</head>', hreflang_block + '</head>')
+
+
+@transform('fix-html-lang')
+def fix_html_lang(content, page):
+    """Set <html lang> to the page's locale."""
+    lang = LOCALE_LANG.get(page.locale)
+    if not lang:
+        return content
+    return HTML_LANG_PATTERN.sub(f'<html lang="{lang}"', content)
+
+
+@transform('add-canonical-script')
+def add_canonical_script(content, page):
+    """Load canonical.js before </head>."""
+    if 'canonical.js' in content or '</head>' not in content:
+        return content
+
+    script_tag = f'  <script src="{root_prefix(page)}assets/js/canonical.js" defer></script>\n'
+    return content.replace('</head>', f'{script_tag}</head>')
+
+
+def has_header_placeholder(content):
+    """Check if file has header-placeholder div (or the header baked in its place)"""
+    return 'id="header-placeholder"' in content or HEADER_START in content
+
+
+def has_header_loader_script(content):
+    """Check if file has header-loader.js script"""
+    return 'header-loader.js' in content
+
+
+@transform('fix-missing-headers', scope='site')
+def add_header_loader(content, page):
+    """Load header-loader.js on pages with a header placeholder but no loader."""
+    folder = page.rel.rpartition('/')[0]
+    if any(skip in folder for skip in HEADER_SKIP_FOLDERS):
+        return content
+    if has_header_loader_script(content) or not has_header_placeholder(content):
+        return content
+
+    script_tag = f'  <script src="{root_prefix(page)}assets/js/components/header-loader.js"></script>\n'
+
+    # With scripts right before </body>, insert in front of the last of them
+    scripts_before_body = SCRIPTS_BEFORE_BODY_PATTERN.search(content)
+    if scripts_before_body and SCRIPT_OPEN_PATTERN.search(content[:scripts_before_body.start()]):
+        insert_pos = content.rfind('<script', 0, content.rfind('</body>'))
+        if insert_pos > 0:
+            return content[:insert_pos] + script_tag + content[insert_pos:]
+
+    return BODY_CLOSE_PATTERN.sub(script_tag + r'\1', content)
+
+
+@transform('bake-layout')
+def bake_site_layout(content, page):
+    """Inline the header and footer for the page's locale and depth (site_layout.py)."""
+    return bake_layout(content, page.locale, page.depth, page.url_path)
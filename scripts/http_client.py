@@ -0,0 +1,172 @@
+"""
+Shared HTTP client for the Structon build scripts.
+Keeps connections to the CMS alive between requests and transparently
+decodes gzip/deflate responses.
+
+Usage:
+    from http_client import get_json
+    data = get_json('https://structon-production.up.railway.app/api/products')
+"""
+
+import gzip
+import json
+import zlib
+import threading
+import http.client
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT = 30
+MAX_IDLE_PER_HOST = 8
+USER_AGENT = 'Structon-Build/1.0'
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class HTTPError(Exception):
+    """Raised when the server answers with a 4xx/5xx status."""
+
+    def __init__(self, url, status, reason, body=b''):
+        super().__init__(f"HTTP {status} {reason} for {url}")
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+def decode_body(body, encoding):
+    """Decode a response body according to its Content-Encoding."""
+    encoding = (encoding or '').strip().lower()
+    if encoding in ('', 'identity'):
+        return body
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        # Servers disagree on whether deflate means zlib-wrapped or raw
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+
+class HTTPClient:
+    """Small keep-alive HTTP client with a connection pool per host.
+
+    Safe to share between threads: every request checks out its own
+    connection and returns it to the pool when the response is read.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_idle_per_host=MAX_IDLE_PER_HOST):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme, host):
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, timeout=self.timeout)
+        if scheme == 'http':
+            return http.client.HTTPConnection(host, timeout=self.timeout)
+        raise ValueError(f"Unsupported URL scheme: {scheme}")
+
+    def _acquire(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _release(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, url, method='GET', headers=None):
+        """Perform a request and return the decoded response body as bytes."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        request_headers = {
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'User-Agent': USER_AGENT,
+        }
+        request_headers.update(headers or {})
+
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request(method, path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    # The server dropped an idle connection; retry on a fresh one
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        body = decode_body(body, response.getheader('Content-Encoding'))
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, body)
+        return body
+
+    def get_json(self, url, headers=None):
+        """GET a URL and parse the response as JSON."""
+        request_headers = {'Accept': 'application/json'}
+        request_headers.update(headers or {})
+        return json.loads(self.request(url, headers=request_headers).decode('utf-8'))
+
+    def close(self):
+        """Close all idle pooled connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide shared client."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
+
+
+def get_json(url, headers=None):
+    """GET a URL with the shared client and parse the JSON response."""
+    return get_client().get_json(url, headers=headers)
@@ -0,0 +1,406 @@
+"""
+Message catalogs for rendering the locale pages from the Dutch source pages.
+Each be-nl page is compiled into a PageTemplate whose slots are its
+translatable strings (text between tags, title/alt/placeholder/aria-label
+attributes, the description/keywords/og/twitter meta content and the names
+and descriptions in JSON-LD) plus its locale markers: <html lang>, og:locale,
+the locale folder of canonical/og:url/JSON-LD URLs and links to pages whose
+slug differs per locale. A locale is rendered by filling those slots from its
+catalog in one pass. Tags are parsed into attributes, so attribute order does
+not matter.
+
+Catalogs live in web/_i18n/messages/<locale>.json as one context per page,
+{url path: {Dutch msgid: msgstr}}, so a message is translated on one page
+without touching the others. Only pages whose current locale page lines up
+with the source have a context; the others are not rendered. A msgstr equal
+to its msgid is untranslated text the page already shows in Dutch: it
+renders as is and is reported, it never stands in for a translation. An
+empty msgstr (a message the page does not have yet) keeps the page from
+being rendered. Strings without words to translate (model numbers, units,
+brand and machine model names) count as translated when they stay the same.
+
+The catalogs are backed by the structured web/_i18n/<locale>.json files: a
+string that appears there (e.g. nav.home "Home" -> "Accueil") translates
+without a catalog entry.
+
+Pages whose slug differs per locale (blog/de-juiste-graafbak-kiezen/ is
+blog/den-richtigen-baggerloeffel-waehlen/ in de-de) are read from the
+hreflang alternates of the source pages into a SlugTable.
+
+Usage:
+    from i18n_catalog import Catalog, SlugTable, compile_page
+
+    slugs = SlugTable.from_pages({url_path: be_nl_html})
+    source = compile_page(be_nl_html, url_path, slugs)
+    catalog = Catalog.load('be-fr')
+    html = source.render('be-fr', catalog, slugs)
+"""
+
+import re
+import json
+import posixpath
+from functools import lru_cache
+from pathlib import Path
+
+from brand_data import load_brands
+from output_writer import write_if_changed
+from template_engine import PageTemplate
+
+WEB_ROOT = Path(__file__).parent.parent / 'web'
+I18N_DIR = WEB_ROOT / '_i18n'
+CATALOG_DIR = I18N_DIR / 'messages'
+SOURCE_LOCALE = 'be-nl'
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+HTML_LANG = {
+    'be-nl': 'nl-BE',
+    'nl-nl': 'nl-NL',
+    'be-fr': 'fr-BE',
+    'de-de': 'de-DE'
+}
+OG_LOCALE = {
+    'be-nl': 'nl_BE',
+    'nl-nl': 'nl_NL',
+    'be-fr': 'fr_BE',
+    'de-de': 'de_DE'
+}
+
+# Script/style bodies and comments are copied verbatim (except JSON-LD); tags and text are inspected
+TOKEN_PATTERN = re.compile(r'<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->|<[^>]*>|[^<]+',
+                           re.DOTALL | re.IGNORECASE)
+TEXT_PATTERN = re.compile(r'^(\s*)(.*?)(\s*)$', re.DOTALL)
+WORD_PATTERN = re.compile(r'[^\W\d_]')
+WORDS_PATTERN = re.compile(r'[^\W\d_]+')
+NORMALIZE_PATTERN = re.compile(r'\W+')
+TAG_NAME_PATTERN = re.compile(r'<([\w-]+)')
+ATTRIBUTE_PATTERN = re.compile(r'\s([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+JSON_LD_PATTERN = re.compile(r'<script\b[^>]*\btype="application/ld\+json"[^>]*>', re.IGNORECASE)
+JSON_STRING_PATTERN = re.compile(r'"([^"\\]+)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+MESSAGE_ATTRIBUTES = {'title', 'alt', 'placeholder', 'aria-label'}
+MESSAGE_META = {'description', 'keywords', 'og:title', 'og:description', 'twitter:title', 'twitter:description'}
+# Words that stay the same in every language
+UNITS = {'mm', 'cm', 'm', 'kg', 't', 'l', 'kW'}
+ACRONYM_LENGTH = 4
+# Hrefs that never point to a page of the site
+EXTERNAL_PREFIXES = ('#', '/', 'mailto:', 'tel:', 'javascript:', 'data:')
+LOCALE_FOLDER = f'/{SOURCE_LOCALE}/'
+
+
+def is_message(text):
+    """Worth translating: contains at least one letter."""
+    return bool(WORD_PATTERN.search(text))
+
+
+@lru_cache(maxsize=None)
+def neutral_names():
+    """Brand and machine model names, the same in every language."""
+    names = set()
+    for brand in load_brands().values():
+        names.update(name for name in (brand['name'], brand['short_name']) if name)
+        names.update(model['name'] for model in brand['models'])
+    return frozenset(names)
+
+
+def is_neutral(msgid):
+    """Needs no translation: only units, short acronyms and numbers ('CW40', 'ZX130 - ZX160', '300 mm') or a brand/model name."""
+    if msgid in neutral_names():
+        return True
+    return all(word in UNITS or (word.isupper() and len(word) <= ACRONYM_LENGTH) for word in WORDS_PATTERN.findall(msgid))
+
+
+def is_translated(msgid, msgstr):
+    """A msgstr that is not empty and, unless the message is neutral, not the Dutch text itself."""
+    return bool(msgstr) and (msgstr != msgid or is_neutral(msgid))
+
+
+def get_attributes(tag):
+    """{name: (start, end, value)} of the quoted attributes of a tag, offsets into `tag`."""
+    attributes = {}
+    for match in ATTRIBUTE_PATTERN.finditer(tag):
+        group = 2 if match.group(2) is not None else 3
+        attributes.setdefault(match.group(1).lower(), (match.start(group), match.end(group), match.group(group)))
+    return attributes
+
+
+def page_folder(url_path):
+    """The folder of a page below its locale folder: 'blog/x/' -> 'blog/x', 'x.html' -> ''."""
+    return url_path.rstrip('/') if url_path.endswith('/') else posixpath.dirname(url_path)
+
+
+def resolve_href(href, url_path):
+    """(page path, '?query#fragment') a relative href on `url_path` points to, or None."""
+    if not href or href.startswith(EXTERNAL_PREFIXES) or '://' in href:
+        return None
+    split = min((href.index(char) for char in '?#' if char in href), default=len(href))
+    path, suffix = href[:split], href[split:]
+    if not path:
+        return None
+    resolved = posixpath.normpath(posixpath.join('/' + page_folder(url_path), path)).lstrip('/')
+    if resolved.startswith('..'):
+        return None
+    if path.endswith('/') and resolved:
+        resolved += '/'
+    return resolved, suffix
+
+
+class SlugTable:
+    """Source url path -> url path in a locale, for pages whose slug is translated."""
+
+    def __init__(self, paths=None):
+        self.paths = paths or {}
+
+    @classmethod
+    def from_pages(cls, source_html):
+        """Read the hreflang alternates of {url path: html} source pages."""
+        paths = {}
+        for url_path, html in source_html.items():
+            for tag in re.findall(r'<link\b[^>]*>', html, re.IGNORECASE):
+                attributes = get_attributes(tag)
+                if 'hreflang' not in attributes or attributes.get('rel', (0, 0, ''))[2] != 'alternate':
+                    continue
+                href = attributes.get('href', (0, 0, ''))[2]
+                for locale in LOCALES:
+                    if f'/{locale}/' in href:
+                        localized = href.split(f'/{locale}/', 1)[1]
+                        if localized != url_path:
+                            paths.setdefault(locale, {})[url_path] = localized
+        return cls(paths)
+
+    def path(self, locale, url_path):
+        return self.paths.get(locale, {}).get(url_path, url_path)
+
+    def is_translated(self, url_path):
+        """True if the page has a different slug in some locale."""
+        return any(url_path in paths for paths in self.paths.values())
+
+    def href(self, locale, url_path, target, suffix, original):
+        """The href from page `url_path` to `target` in `locale`, relative like `original`."""
+        page, linked = self.path(locale, url_path), self.path(locale, target)
+        if page == url_path and linked == target:
+            return original
+        relative = posixpath.relpath('/' + linked, '/' + page_folder(page))
+        if linked.endswith('/') or not linked:
+            relative = './' if relative == '.' else relative + '/'
+        return relative + suffix
+
+
+def find_slots(html, url_path='', slugs=None):
+    """Locate the translatable strings and locale markers of a page.
+
+    Returns sorted (start, end, kind, value) spans, where kind is 'message',
+    'url' (the path after the locale folder of an absolute URL), 'link'
+    ((target path, suffix, href) of a link to a page with translated slugs)
+    or the name of a locale marker slot.
+    """
+    slugs = slugs or SlugTable()
+    spans = []
+
+    def add_url(start, value):
+        if LOCALE_FOLDER in value:
+            offset = value.index(LOCALE_FOLDER) + 1
+            spans.append((start + offset, start + len(value), 'url', value[offset + len(SOURCE_LOCALE) + 1:]))
+
+    for token in TOKEN_PATTERN.finditer(html):
+        text = token.group()
+        start = token.start()
+        if not text.startswith('<'):
+            lead, core, _ = TEXT_PATTERN.match(text).groups()
+            if is_message(core):
+                spans.append((start + len(lead), start + len(lead) + len(core), 'message', core))
+            continue
+        opening = JSON_LD_PATTERN.match(text)
+        if opening:
+            for match in JSON_STRING_PATTERN.finditer(text, opening.end()):
+                key, value = match.group(1), match.group(2)
+                if key.startswith('@'):
+                    continue
+                if '://' in value:
+                    add_url(start + match.start(2), value)
+                elif is_message(value):
+                    spans.append((start + match.start(2), start + match.end(2), 'message', value))
+            continue
+        if text[:7].lower().startswith(('<script', '<style', '<!--', '</', '<!')):
+            continue
+
+        tag = TAG_NAME_PATTERN.match(text)
+        if not tag:
+            continue
+        tag = tag.group(1).lower()
+        attributes = get_attributes(text)
+        for name, (value_start, value_end, value) in attributes.items():
+            if name in MESSAGE_ATTRIBUTES and is_message(value):
+                spans.append((start + value_start, start + value_end, 'message', value))
+        if tag == 'html' and 'lang' in attributes:
+            value_start, value_end, value = attributes['lang']
+            spans.append((start + value_start, start + value_end, 'html_lang', value))
+        elif tag == 'meta' and 'content' in attributes:
+            key = (attributes.get('name') or attributes.get('property') or (0, 0, ''))[2]
+            value_start, value_end, value = attributes['content']
+            if key in MESSAGE_META and is_message(value):
+                spans.append((start + value_start, start + value_end, 'message', value))
+            elif key == 'og:locale':
+                spans.append((start + value_start, start + value_end, 'og_locale', value))
+            elif key == 'og:url':
+                add_url(start + value_start, value)
+        elif tag == 'link' and 'href' in attributes and attributes.get('rel', (0, 0, ''))[2] == 'canonical':
+            add_url(start + attributes['href'][0], attributes['href'][2])
+        elif tag == 'a' and 'href' in attributes:
+            value_start, value_end, value = attributes['href']
+            resolved = resolve_href(value, url_path)
+            if resolved and slugs.is_translated(resolved[0]):
+                spans.append((start + value_start, start + value_end, 'link', (*resolved, value)))
+    return sorted(spans, key=lambda span: span[:2])
+
+
+def extract_messages(html):
+    """The translatable strings of a page, in document order."""
+    return [value for _, _, kind, value in find_slots(html) if kind == 'message']
+
+
+class SourcePage:
+    """A Dutch page compiled into a template with one slot per message, URL and link."""
+
+    def __init__(self, template, url_path, msgids, urls, links):
+        self.template = template
+        self.url_path = url_path
+        self.msgids = msgids
+        self.urls = urls
+        self.links = links
+
+    def render(self, locale, catalog, slugs=None):
+        slugs = slugs or SlugTable()
+        values = {
+            'html_lang': HTML_LANG[locale],
+            'og_locale': OG_LOCALE[locale],
+        }
+        for index, msgid in enumerate(self.msgids):
+            values[f'msg_{index}'] = catalog.gettext(msgid, self.url_path)
+        for index, path in enumerate(self.urls):
+            values[f'url_{index}'] = f'{locale}/{slugs.path(locale, path)}'
+        for index, (target, suffix, href) in enumerate(self.links):
+            values[f'link_{index}'] = slugs.href(locale, self.url_path, target, suffix, href)
+        return self.template.render(values)
+
+
+def compile_page(html, url_path='', slugs=None):
+    """Compile the source page at `url_path` into a SourcePage."""
+    chunks, slots, msgids, urls, links = [], [], [], [], []
+    index_of = {}
+    position = 0
+    for start, end, kind, value in find_slots(html, url_path, slugs):
+        chunks.append(html[position:start])
+        if kind == 'message':
+            if value not in index_of:
+                index_of[value] = len(msgids)
+                msgids.append(value)
+            slots.append(f'msg_{index_of[value]}')
+        elif kind == 'url':
+            slots.append(f'url_{len(urls)}')
+            urls.append(value)
+        elif kind == 'link':
+            slots.append(f'link_{len(links)}')
+            links.append(value)
+        else:
+            slots.append(kind)
+        position = end
+    chunks.append(html[position:])
+    return SourcePage(PageTemplate(chunks=chunks, slots=slots), url_path, msgids, urls, links)
+
+
+def align_messages(source_html, translated_html):
+    """Pair the messages of a source page with those of its existing translation.
+
+    Pages are paired in document order when they have the same number of
+    messages and every language-neutral message meets itself (up to spacing
+    and punctuation, 'CW05:' -> 'CW05 :'). Returns a list of (msgid, msgstr)
+    or None if the pages do not line up.
+    """
+    source = extract_messages(source_html)
+    translated = extract_messages(translated_html)
+    if len(source) != len(translated):
+        return None
+    pairs = list(zip(source, translated))
+    for msgid, msgstr in pairs:
+        if is_neutral(msgid) and NORMALIZE_PATTERN.sub('', msgid) != NORMALIZE_PATTERN.sub('', msgstr):
+            return None
+    return pairs
+
+
+def flatten(data, prefix=''):
+    """{'nav': {'home': 'Home'}} -> {'nav.home': 'Home'} (strings only)."""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{key}.'))
+        elif isinstance(value, str):
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+def load_structured(locale):
+    try:
+        return flatten(json.loads((I18N_DIR / f'{locale}.json').read_text(encoding='utf-8')))
+    except FileNotFoundError:
+        return {}
+
+
+def structured_messages(locale):
+    """Dutch -> locale strings from the structured _i18n files, paired by key."""
+    source = load_structured(SOURCE_LOCALE)
+    target = load_structured(locale)
+    messages = {}
+    for key, msgid in source.items():
+        if key in target and is_message(msgid):
+            messages.setdefault(msgid, target[key])
+    return messages
+
+
+class Catalog:
+    """Per page Dutch msgid -> msgstr for one locale."""
+
+    def __init__(self, locale, pages=None, fallback=None, path=None):
+        self.locale = locale
+        self.pages = pages or {}
+        self.fallback = fallback or {}
+        self.path = Path(path) if path else CATALOG_DIR / f'{locale}.json'
+
+    @classmethod
+    def load(cls, locale, catalog_dir=CATALOG_DIR):
+        path = Path(catalog_dir) / f'{locale}.json'
+        try:
+            pages = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            pages = {}
+        return cls(locale, pages, structured_messages(locale), path)
+
+    @property
+    def is_source_language(self):
+        return HTML_LANG[self.locale].split('-')[0] == HTML_LANG[SOURCE_LOCALE].split('-')[0]
+
+    def messages(self, url_path):
+        return self.pages.get(url_path, {})
+
+    def lookup(self, msgid, url_path):
+        """The translation of `msgid` on the page `url_path`, or None if it has none."""
+        msgstr = self.messages(url_path).get(msgid)
+        if self.is_source_language:
+            return msgstr or msgid
+        if is_translated(msgid, msgstr):
+            return msgstr
+        return self.fallback.get(msgid) or None
+
+    def has(self, msgid, url_path):
+        """True if `msgid` renders in this locale's language on the page `url_path`."""
+        return self.lookup(msgid, url_path) is not None
+
+    def renders(self, msgid, url_path):
+        """True if the page `url_path` can be rendered with `msgid`: translated, or shown in Dutch already."""
+        return self.has(msgid, url_path) or self.messages(url_path).get(msgid) == msgid
+
+    def gettext(self, msgid, url_path):
+        """The translation of `msgid` on the page `url_path`, or the Dutch text if there is none."""
+        return self.lookup(msgid, url_path) or msgid
+
+    def save(self):
+        """Write the catalog file if it changed. Returns True if written."""
+        data = {url_path: dict(sorted(messages.items())) for url_path, messages in sorted(self.pages.items())}
+        return write_if_changed(self.path, json.dumps(data, indent=2, ensure_ascii=False) + '\n')
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Render the locale pages from the Dutch (be-nl) source pages and message catalogs.
+Replaces copying Dutch HTML and running the replace-based translate_* scripts
+over it: each source page is compiled once and every locale is rendered from
+it in one pass (see i18n_catalog.py).
+
+Catalog and product pages are left to generate_catalog_pages.py and
+sync_products.py, which already render every locale themselves. A baked
+header and footer (site_layout.py) is left out of the catalogs and baked
+again for each locale. Pages whose slug is translated (the blog posts) are
+written to their locale slug, and links to them follow it.
+
+Usage:
+    python localize-pages.py extract               # update web/_i18n/messages/*.json
+    python localize-pages.py render                # render every locale
+    python localize-pages.py render --locale be-fr # rebuild one locale in isolation
+    python localize-pages.py render --check        # report pages that would change
+
+Pages without a catalog context (their locale page does not line up with
+the source and is still maintained by the translate_* scripts) and pages
+with untranslated messages are skipped unless --force is given, so an
+incomplete catalog never replaces translated text with Dutch.
+"""
+
+import argparse
+import re
+
+from i18n_catalog import LOCALES, SOURCE_LOCALE, Catalog, SlugTable, align_messages, compile_page
+from output_writer import OutputWriter
+from site_inventory import SiteInventory
+from site_layout import bake_layout, is_baked, strip_layout
+
+NUMBER_PATTERN = re.compile(r'\d+')
+
+TARGET_LOCALES = [locale for locale in LOCALES if locale != SOURCE_LOCALE]
+
+def is_localized(url_path):
+    """Static pages only; category and product pages have their own generators."""
+    return not url_path.startswith('producten/') or url_path == 'producten/'
+
+def get_source_pages(inventory):
+    """{url path: page} of the source locale pages rendered by this script."""
+    return {page.url_path: page for page in inventory.pages(SOURCE_LOCALE) if is_localized(page.url_path)}
+
+class SourceSite:
+    """The compiled source pages and the slug table between them."""
+
+    def __init__(self, inventory):
+        pages = get_source_pages(inventory)
+        html = {url_path: page.read() for url_path, page in pages.items()}
+        self.html = {url_path: strip_layout(page_html) for url_path, page_html in html.items()}
+        self.slugs = SlugTable.from_pages(self.html)
+        self.pages = {url_path: compile_page(self.html[url_path], url_path, self.slugs) for url_path in pages}
+        # The header and footer are baked per locale, not translated
+        self.baked = {url_path: pages[url_path].depth for url_path, page_html in html.items() if is_baked(page_html)}
+
+    def render(self, url_path, locale, catalog):
+        """(url path in `locale`, html) of a source page."""
+        locale_path = self.slugs.path(locale, url_path)
+        html = self.pages[url_path].render(locale, catalog, self.slugs)
+        if url_path in self.baked:
+            html = bake_layout(html, locale, self.baked[url_path], locale_path)
+        return locale_path, html
+
+def seed_pairs(pairs):
+    """{msgid: msgstr} of a page's pairs; a msgid shown twice keeps its translated occurrence."""
+    seeded = {}
+    for msgid, msgstr in pairs:
+        if seeded.get(msgid, msgid) == msgid:
+            seeded[msgid] = msgstr
+    return seeded
+
+def page_translations(contexts):
+    """{msgid: msgstr} for the msgids every page that translates them translates the same way.
+
+    Translations that change a number ('December 2024' -> 'Januar 2026') are
+    page content, not a translation, and are never carried to another page.
+    """
+    translations = {}
+    for messages in contexts:
+        for msgid, msgstr in messages.items():
+            if msgstr and msgstr != msgid and NUMBER_PATTERN.findall(msgstr) == NUMBER_PATTERN.findall(msgid):
+                translations.setdefault(msgid, set()).add(msgstr)
+    return {msgid: msgstrs.pop() for msgid, msgstrs in translations.items() if len(msgstrs) == 1}
+
+def extract(inventory, locales):
+    """Collect the source messages into each locale catalog, one context per page.
+
+    A page gets a context once its current locale page lines up with the
+    source page; new messages are seeded by pairing the two in document
+    order. Text the locale page still shows in Dutch is seeded with the
+    translation the other pages agree on, if any. Existing entries are kept;
+    pages and messages the source no longer has are dropped.
+    """
+    site = SourceSite(inventory)
+
+    for locale in locales:
+        catalog = Catalog.load(locale)
+        targets = {page.url_path: page for page in inventory.pages(locale)}
+        seeds, unaligned = {}, []
+        for url_path in site.pages:
+            target = targets.get(site.slugs.path(locale, url_path))
+            pairs = align_messages(site.html[url_path], strip_layout(target.read())) if target else None
+            if pairs is None:
+                unaligned.append(url_path)
+            else:
+                seeds[url_path] = seed_pairs(pairs)
+        translations = page_translations([*catalog.pages.values(), *seeds.values()])
+
+        pages = {}
+        for url_path, source in site.pages.items():
+            if url_path not in catalog.pages and url_path not in seeds:
+                continue
+            known, seeded = catalog.messages(url_path), seeds.get(url_path, {})
+            messages = {}
+            for msgid in source.msgids:
+                msgstr = known.get(msgid) or seeded.get(msgid, '')
+                if msgstr == msgid and not catalog.is_source_language:
+                    msgstr = translations.get(msgid, msgstr)
+                if not catalog.is_source_language or (msgstr and msgstr != msgid):
+                    # Same language: only store what differs from the source
+                    messages[msgid] = msgstr
+            pages[url_path] = messages
+
+        dropped = len(set(catalog.pages) - set(pages))
+        catalog.pages = pages
+        written = catalog.save()
+        dutch = sum(1 for url_path, source in site.pages.items() if url_path in pages
+                    for msgid in source.msgids if not catalog.has(msgid, url_path))
+
+        print(f"  ✓ {catalog.path.name}: {len(pages)} of {len(site.pages)} pages, "
+              f"{dutch} messages shown as in /{SOURCE_LOCALE}/, {dropped} dropped{' (updated)' if written else ''}")
+        for url_path in unaligned:
+            if url_path not in pages:
+                print(f"    ! /{locale}/{url_path} does not line up with /{SOURCE_LOCALE}/{url_path}, left out")
+
+def render(inventory, locales, writer, check=False, force=False):
+    """Render the source pages of each locale's catalog. Returns the number of pages that differ."""
+    web_root = inventory.web_root
+    site = SourceSite(inventory)
+
+    changed = 0
+    for locale in locales:
+        catalog = Catalog.load(locale)
+        locale_changed = skipped = 0
+        for url_path, source in site.pages.items():
+            if url_path not in catalog.pages and not force:
+                skipped += 1
+                continue
+            missing = [msgid for msgid in source.msgids if not catalog.renders(msgid, url_path)]
+            if missing and not force:
+                print(f"    ! /{locale}/{url_path} skipped: {len(missing)} untranslated messages")
+                skipped += 1
+                continue
+            locale_path, html = site.render(url_path, locale, catalog)
+            path = web_root / locale / locale_path / 'index.html'
+            if check:
+                if not path.exists() or path.read_text(encoding='utf-8') != html:
+                    print(f"    ~ /{locale}/{locale_path}")
+                    locale_changed += 1
+            elif writer.write(path, html):
+                locale_changed += 1
+
+        changed += locale_changed
+        verb = 'would change' if check else 'updated'
+        print(f"  ✓ /{locale}/: {len(site.pages) - skipped} of {len(site.pages)} pages rendered, "
+              f"{locale_changed} {verb}, {skipped} skipped")
+    return changed
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Render locale pages from the Dutch source pages and message catalogs.')
+    parser.add_argument('command', choices=['extract', 'render'])
+    parser.add_argument('--locale', action='append', choices=TARGET_LOCALES,
+                        help='Only this locale (repeatable; default: all)')
+    parser.add_argument('--check', action='store_true', help='render: report pages that would change, write nothing')
+    parser.add_argument('--force', action='store_true', help='render: also write pages without a context or with untranslated messages')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    locales = args.locale or TARGET_LOCALES
+    inventory = SiteInventory.load()
+
+    if args.command == 'extract':
+        print(f"Extracting messages from /{SOURCE_LOCALE}/...")
+        extract(inventory, locales)
+    else:
+        print(f"Rendering locale pages from /{SOURCE_LOCALE}/...")
+        writer = OutputWriter()
+        changed = render(inventory, locales, writer, args.check, args.force)
+        if not args.check:
+            print(f"\nDone! {writer.summary()}")
+        elif changed:
+            raise SystemExit(1)
+
+    inventory.save()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Write-if-changed output layer for generated files.
+Skips writes whose bytes already match the file on disk, so reruns keep
+mtimes (and downstream caches and Pages artifacts) stable.
+
+Usage:
+    from output_writer import OutputWriter
+
+    writer = OutputWriter()
+    writer.write(path, html)
+    print(writer.summary())
+"""
+
+import hashlib
+from pathlib import Path
+
+
+def is_unchanged(path, data):
+    """True if `path` already holds exactly `data` (compares size first, then hash)."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        return False
+    return hashlib.sha256(existing).digest() == hashlib.sha256(data).digest()
+
+
+def write_if_changed(path, content, encoding='utf-8'):
+    """Write text or bytes to `path` unless identical. Returns True if written."""
+    path = Path(path)
+    data = content.encode(encoding) if isinstance(content, str) else content
+    if is_unchanged(path, data):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+class OutputWriter:
+    """Write-if-changed with written/skipped bookkeeping."""
+
+    def __init__(self, encoding='utf-8'):
+        self.encoding = encoding
+        self.written = []
+        self.removed = []
+        self.skipped = 0
+
+    def write(self, path, content):
+        """Write `content` to `path` unless identical. Returns True if written."""
+        if write_if_changed(path, content, self.encoding):
+            self.written.append(Path(path))
+            return True
+        self.skipped += 1
+        return False
+
+    def remove(self, path):
+        """Delete a generated file that is no longer produced. Returns True if it existed."""
+        path = Path(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        self.removed.append(path)
+        return True
+
+    def merge(self, written, skipped):
+        """Fold in the results of a writer that ran elsewhere (e.g. a worker process)."""
+        self.written.extend(Path(p) for p in written)
+        self.skipped += skipped
+
+    def summary(self):
+        summary = f"{len(self.written)} written, {self.skipped} unchanged"
+        if self.removed:
+            summary += f", {len(self.removed)} removed"
+        return summary
@@ -0,0 +1,128 @@
+"""
+Listing snapshot of the product catalog for the category pages.
+The product sync keeps a compact card (title, first image, specs) of every
+publishable product in product_listing.json, keyed like sync_state.json.
+generate_catalog_pages.py renders the first page of product cards, the
+product counts and the subcategory images from it, so category and
+subcategory pages list products without calling the API; static_api.py
+publishes it as static JSON for the browser scripts.
+
+Usage:
+    from product_listing import ProductListing
+
+    listing = ProductListing.load()
+    listing.record(product_key(product), product)
+    listing.save()
+    cards = listing.in_subcategory('slotenbakken')   # newest first
+"""
+
+import json
+from pathlib import Path
+
+from output_writer import write_if_changed
+
+LISTING_PATH = Path(__file__).parent / 'product_listing.json'
+LISTING_VERSION = 1
+# Matches ITEMS_PER_PAGE in web/assets/js/pagination.js
+PAGE_SIZE = 12
+CARD_FIELDS = (
+    'id', 'slug', 'title', 'category_slug', 'category_title', 'subcategory_slug', 'subcategory_title',
+    'weight', 'width', 'volume', 'attachment_type', 'excavator_weight_min', 'excavator_weight_max',
+    'brand_slug', 'stock', 'stock_quantity', 'is_new', 'is_featured', 'created_at', 'description',
+)
+
+
+def listing_card(product):
+    """The fields of `product` a listing card shows, filters or is searched on."""
+    card = {field: product[field] for field in CARD_FIELDS if product.get(field) not in (None, '')}
+    images = product.get('cloudinary_images') or []
+    if images and images[0].get('url'):
+        card['image'] = images[0]['url']
+    return card
+
+
+def card_path(card):
+    """URL path of the product page of a card (or product), relative to the locale root.
+
+    The one definition of product URLs: the product pages, listing cards,
+    related products, search index and static API all link through it.
+    """
+    path = f"producten/{card['category_slug']}/"
+    if card.get('subcategory_slug'):
+        path += f"{card['subcategory_slug']}/"
+    return f"{path}{card.get('slug')}/"
+
+
+def newest_first(cards):
+    """Cards in the listing's default order ('Nieuwste eerst')."""
+    return sorted(cards, key=lambda card: card.get('created_at') or '', reverse=True)
+
+
+class ProductListing:
+    """Listing cards of the publishable products, by product key."""
+
+    def __init__(self, path=LISTING_PATH, cards=None):
+        self.path = Path(path)
+        self.cards = cards or {}
+        # Card of every product recorded, forgotten or pruned since loading, as loaded (None if new)
+        self.changed = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=LISTING_PATH):
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != LISTING_VERSION:
+            return cls(path)
+        return cls(path, data.get('products', {}))
+
+    def __bool__(self):
+        return bool(self.cards)
+
+    def record(self, key, product):
+        """Store the card of a publishable product."""
+        card = listing_card(product)
+        if self.cards.get(key) != card:
+            self.changed.setdefault(key, self.cards.get(key))
+            self.cards[key] = card
+            self.dirty = True
+
+    def forget(self, key):
+        if key in self.cards:
+            self.changed.setdefault(key, self.cards.pop(key))
+            self.dirty = True
+
+    def prune(self, keep_keys):
+        """Drop the cards of products that no longer exist in the CMS."""
+        keep_keys = set(keep_keys)
+        for key in [key for key in self.cards if key not in keep_keys]:
+            self.forget(key)
+
+    def changed_cards(self):
+        """Old and new cards of the products that changed since loading."""
+        for key, old in self.changed.items():
+            if old is not None:
+                yield old
+            if key in self.cards:
+                yield self.cards[key]
+
+    def changed_categories(self):
+        """Slugs of the categories a changed product was or is in."""
+        return {card['category_slug'] for card in self.changed_cards()}
+
+    def in_category(self, category_slug):
+        return newest_first(card for card in self.cards.values() if card.get('category_slug') == category_slug)
+
+    def in_subcategory(self, subcategory_slug):
+        return newest_first(card for card in self.cards.values() if card.get('subcategory_slug') == subcategory_slug)
+
+    def save(self):
+        """Write the listing file if anything changed. Returns True if written."""
+        if not self.dirty:
+            return False
+        self.dirty = False
+        data = {'version': LISTING_VERSION, 'products': dict(sorted(self.cards.items()))}
+        return write_if_changed(self.path, json.dumps(data, indent=1, ensure_ascii=False) + '\n')
@@ -0,0 +1,278 @@
+"""
+Precompiled HTML templates for the static product detail pages.
+Each template is parsed once at import; generate_product_pages in
+sync_products.py binds the per-locale and per-depth values once and then
+only fills the product-specific slots.
+"""
+
+from template_engine import PageTemplate
+
+# Breadcrumb for products inside a subcategory (5 levels deep)
+BREADCRUMB_SUBCATEGORY = PageTemplate('''<a href="{{home_link}}">{{home_label}}</a><span>/</span>
+          <a href="{{products_link}}">{{products_label}}</a><span>/</span>
+          <a href="{{category_link}}">{{category_title}}</a><span>/</span>
+          <a href="{{subcategory_link}}">{{subcategory_title}}</a><span>/</span>
+          <span aria-current="page">{{title}}</span>''')
+
+# Breadcrumb for products directly under a category (4 levels deep)
+BREADCRUMB_CATEGORY = PageTemplate('''<a href="{{home_link}}">{{home_label}}</a><span>/</span>
+          <a href="{{products_link}}">{{products_label}}</a><span>/</span>
+          <a href="{{category_link}}">{{category_title}}</a><span>/</span>
+          <span aria-current="page">{{title}}</span>''')
+
+GALLERY_SECTION = PageTemplate('''
+          <div class="product-gallery animate-on-scroll">
+            <div class="product-thumbnails">
+              <div class="product-thumbnail active" data-image="{{image_url}}">
+                <img src="{{image_url}}" alt="{{title}} - View 1">
+              </div>
+              <div class="product-thumbnail" data-image="{{image_url}}">
+                <img src="{{image_url}}" alt="{{title}} - View 2">
+              </div>
+              <div class="product-thumbnail" data-image="{{image_url}}">
+                <img src="{{image_url}}" alt="{{title}} - View 3">
+              </div>
+            </div>
+            <div class="product-image-main">
+              <img src="{{image_url}}" alt="{{title}}" id="main-product-image">
+            </div>
+          </div>''')
+
+INFO_SECTION = PageTemplate('''
+          <div class="product-info-wrapper animate-on-scroll">
+            <div class="product-header">
+              <span class="product-category-label">{{category_title}} / {{subcategory_title}}</span>
+              <h1 class="product-title">{{title_upper}}</h1>
+              <p class="product-subtitle">{{description}}</p>
+            </div>
+
+            <div class="product-key-specs">
+              {{key_specs_html}}
+            </div>
+
+            <div class="product-purchase-card">
+              <div class="product-price-container" id="product-price-container" data-product-id="{{product_id}}" style="display: none;">
+                <div class="product-price-label">Prijs:</div>
+                <div class="product-price" id="product-price">
+                  <span class="price-loading">Prijs laden...</span>
+                </div>
+                <div class="stock-status {{stock_class}}">{{stock_text}}</div>
+              </div>
+              
+              <div class="product-cta-section">
+                <div class="product-quantity-wrapper">
+                  <div class="quantity-selector">
+                    <button type="button" class="quantity-btn minus" onclick="var i=this.nextElementSibling;i.value=Math.max(1,parseInt(i.value||1)-1)">-</button>
+                    <input type="number" id="quantity" name="quantity" value="1" min="1" max="99">
+                    <button type="button" class="quantity-btn plus" onclick="var i=this.previousElementSibling;i.value=Math.min(99,parseInt(i.value||1)+1)">+</button>
+                  </div>
+                  
+                  <div class="product-actions">
+                    <button class="btn-split btn-split-primary" id="add-to-quote" data-product='{{cart_data_json_attr}}'>
+                      <span class="btn-split-text">{{add_to_quote}}</span>
+                      <span class="btn-split-icon">
+                        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg>
+                      </span>
+                    </button>
+                  </div>
+                </div>
+                
+                <ul class="product-usps">
+                  <li>Voor 15:00 besteld, morgen verzonden</li>
+                  <li>Gratis verzending vanaf €500</li>
+                  <li>Geproduceerd in België (Hardox staal)</li>
+                </ul>
+              </div>
+            </div>
+
+            <div class="expert-box-sidebar">
+              <div class="expert-header">
+                <div class="expert-avatar">
+                  <svg width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                    <path d="M20 21v-2a4 4 0 0 0-4-4H8a4 4 0 0 0-4 4v2"></path>
+                    <circle cx="12" cy="7" r="4"></circle>
+                  </svg>
+                </div>
+                <div>
+                  <span class="expert-title">Hulp nodig bij uw keuze?</span>
+                  <span class="expert-subtitle">Onze experts helpen u graag verder.</span>
+                </div>
+              </div>
+              <a href="tel:+32469702138" class="expert-contact">
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                  <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path>
+                </svg>
+                +32 469 70 21 38
+              </a>
+            </div>
+          </div>''')
+
+# Locale- and product-independent marketing blocks
+DETAILS_SECTION = '''
+    <section class="section product-details-section fade-in">
+      <div class="container">
+        <div class="product-details-layout">
+          <div class="product-detail-card">
+            <div class="detail-card-icon">
+              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect><line x1="9" y1="9" x2="15" y2="9"></line><line x1="9" y1="15" x2="15" y2="15"></line></svg>
+            </div>
+            <h3>Technische Specificaties</h3>
+            <p>Alle kraanbakken worden vervaardigd uit hoogwaardig Hardox staal voor maximale sterkte en duurzaamheid. Perfect afgestemd op uw graafmachine.</p>
+          </div>
+          <div class="product-detail-card">
+            <div class="detail-card-icon">
+              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path><polyline points="3.27 6.96 12 12.01 20.73 6.96"></polyline><line x1="12" y1="22.08" x2="12" y2="12"></line></svg>
+            </div>
+            <h3>Op Maat Gemaakt</h3>
+            <p>Elke kraanbak wordt op maat geproduceerd in onze werkplaats in Beernem, België. Kwaliteit en precisie gegarandeerd.</p>
+          </div>
+          <div class="product-detail-card">
+            <div class="detail-card-icon">
+              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"></circle><polyline points="12 6 12 12 16 14"></polyline></svg>
+            </div>
+            <h3>Snelle Levering</h3>
+            <p>Afhalen in Beernem of levering op locatie. Neem contact op voor levertijden en mogelijkheden.</p>
+          </div>
+        </div>
+      </div>
+    </section>'''
+
+SPECS_TABLE_ROW = PageTemplate('''<tr>
+                  <th>{{label}}</th>
+                  <td>{{value}}</td>
+                </tr>''')
+
+STANDARD_SPEC_ROWS = [
+    SPECS_TABLE_ROW.render(label='Materiaal', value='Hardox 450 staal'),
+    SPECS_TABLE_ROW.render(label='Productie', value='Op maat gemaakt in België'),
+    SPECS_TABLE_ROW.render(label='Levertijd', value='2-3 weken'),
+    SPECS_TABLE_ROW.render(label='Garantie', value='12 maanden fabrieksgarantie'),
+]
+
+SPECS_SECTION = PageTemplate('''
+    <section class="section specifications-section">
+      <div class="container">
+        <div class="specifications-content">
+          <div class="specifications-description">
+            <h2 class="specifications-title">PRODUCTBESCHRIJVING</h2>
+            <p>Deze hoogwaardige kraanbak is speciaal ontworpen voor professionele graafwerkzaamheden. De robuuste constructie en doordachte vorm maken deze bak ideaal voor diverse toepassingen in de grond-, weg- en waterbouw.</p>
+            <p>Vervaardigd uit slijtvast Hardox staal voor maximale duurzaamheid en een lange levensduur, zelfs onder zware werkomstandigheden. De geoptimaliseerde geometrie zorgt voor uitstekende prestaties in verschillende grondsoorten.</p>
+          </div>
+          
+          <div class="specifications-table-wrapper">
+            <h3 class="specifications-subtitle">Technische Specificaties</h3>
+            <table class="specifications-table">
+              <tbody>
+                {{specs_table_html}}
+              </tbody>
+            </table>
+          </div>
+        </div>
+      </div>
+    </section>''')
+
+STICKY_CTA = PageTemplate('''
+    <div class="product-sticky-cta">
+      <button class="btn-split btn-split-primary" id="add-to-quote-sticky" data-product='{{cart_data_json_attr}}'>
+        <span class="btn-split-text">{{add_to_quote}}</span>
+        <span class="btn-split-icon">
+          <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg>
+        </span>
+      </button>
+    </div>''')
+
+# Related products, baked between RELATED_START / RELATED_END by related_products.py
+RELATED_START, RELATED_END = '<!-- related-products -->', '<!-- /related-products -->'
+
+RELATED_SECTION = PageTemplate('''
+    <section id="related-products-section" class="section-featured related-products-section">
+      <div class="container">
+        <div class="section-header">
+          <h2 class="section-title">{{label_related_products}}</h2>
+        </div>
+        <div id="related-products-grid" class="products-grid" data-prerendered="true">{{cards_html}}</div>
+      </div>
+    </section>
+    ''')
+
+RELATED_CARD = PageTemplate('''
+          <article class="product-card clean-card">
+            <a href="{{url}}" class="product-card-image">
+              <img src="{{image}}" alt="{{title}}" loading="lazy">
+            </a>
+            <div class="product-card-divider"></div>
+            <div class="product-card-content">
+              <div class="product-header">
+                <h3 class="product-card-title">
+                  <a href="{{url}}">{{title}}</a>
+                </h3>
+              </div>
+              {{specs_html}}
+              <div class="product-card-footer">
+                <a href="{{url}}" class="btn-split btn-split-sm" style="width: 100%;">
+                  <span class="btn-split-text">{{label_card_more_info}}</span>
+                  <span class="btn-split-icon">
+                    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg>
+                  </span>
+                </a>
+              </div>
+            </div>
+          </article>''')
+
+RELATED_SPECS = PageTemplate('''<p class="product-card-specs">{{specs}}</p>''')
+
+PRODUCT_PAGE = PageTemplate('''<!DOCTYPE html>
+<html lang="{{lang}}">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <meta name="description" content="{{meta_desc}}">
+  <title>{{title}} {{meta_suffix}}</title>
+  <link rel="preload" href="{{assets_prefix}}/css/fonts.css" as="style">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/fonts.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/global.css?v=8">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/components/mega-menu.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/components/quote-cart.css">
+  <link rel="stylesheet" href="{{assets_prefix}}/css/pages/product.css">
+  <link rel="icon" type="image/svg+xml" href="{{assets_prefix}}/images/static/favicon.svg">
+{{canonical}}
+{{hreflang_tags}}
+</head>
+<body>
+  {{site_header}}
+  <main style="padding-top: 0;">
+    <section class="page-hero" style="padding-top: var(--space-8);">
+      <div class="container">
+        <nav class="breadcrumb" aria-label="Kruimelpad">
+          {{breadcrumb_html}}
+        </nav>
+        <h1 class="hero-title">{{title_upper}}</h1>
+      </div>
+    </section>
+    
+    <!-- Product Main Section -->
+    <section class="section product-section">
+      <div class="container">
+        <div class="product-layout">
+          {{gallery_section}}
+          {{info_section}}
+        </div>
+      </div>
+    </section>
+    
+    {{details_section}}
+    {{specs_section}}
+    {{sticky_cta}}
+    <!-- related-products --><!-- /related-products -->
+    
+  </main>
+  {{site_footer}}
+  <script src="{{assets_prefix}}/js/components/header-loader.js"></script>
+  <script src="{{assets_prefix}}/js/components/footer-loader.js"></script>
+  <script type="module" src="{{assets_prefix}}/js/main.js?v=2"></script>
+  <script src="{{assets_prefix}}/js/components/login-modal.js?v=2"></script>
+  <script src="{{assets_prefix}}/js/services/quote-cart-service.js"></script>
+  <script src="{{assets_prefix}}/js/components/quote-cart-ui.js"></script>
+  <script src="{{assets_prefix}}/js/components/product-price.js"></script>
+</body>
+</html>''')
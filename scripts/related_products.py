@@ -0,0 +1,152 @@
+"""
+Related products for the product detail pages, ranked at build time.
+related-products.js used to parse the spec text of the page, fetch the
+products of the same subcategory and rank them on every page view. The
+product sync now ranks the listing snapshot (product_listing.py) and bakes
+the top RELATED_SIZE cards of a product between the RELATED_START /
+RELATED_END markers of its pages, so its related cards follow catalog
+changes without re-rendering the page itself. Products are only related
+within their category, so a sync re-ranks the categories with changed cards
+(and the products whose pages it re-rendered) and leaves the others alone.
+
+Similarity: same subcategory, else same category; overlap of the excavator
+weight ranges; closeness of width and volume; same attachment type. Ties go
+to the newest product.
+
+Usage:
+    from related_products import bake_related_products
+
+    bake_related_products(listing, writer, listing.changed_categories(), rendered_keys)
+"""
+
+import re
+from html import escape
+from pathlib import Path
+
+from catalog_data import LABELS
+from catalog_templates import PLACEHOLDER_PHOTOS, format_number, get_locale_template
+from product_listing import card_path
+from product_templates import RELATED_CARD, RELATED_END, RELATED_SECTION, RELATED_SPECS, RELATED_START
+
+WEB_ROOT = Path(__file__).parent.parent / 'web'
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+# Matches getRelatedProducts(currentProduct, 3) in related-products.js
+RELATED_SIZE = 3
+RELATED_PATTERN = re.compile(re.escape(RELATED_START) + '.*?' + re.escape(RELATED_END), re.DOTALL)
+
+SUBCATEGORY_SCORE = 100
+CATEGORY_SCORE = 50
+TONNAGE_SCORE = 30
+WIDTH_SCORE = 15
+VOLUME_SCORE = 15
+ATTACHMENT_SCORE = 10
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def closeness(a, b):
+    """1.0 for equal values, towards 0.0 the further apart; 0.0 if either is unknown."""
+    a, b = to_float(a), to_float(b)
+    if a <= 0 or b <= 0:
+        return 0.0
+    return min(a, b) / max(a, b)
+
+
+def tonnage_overlap(card, other):
+    """Share of the narrower excavator weight range that the two ranges have in common."""
+    low, high = to_float(card.get('excavator_weight_min')), to_float(card.get('excavator_weight_max'))
+    other_low, other_high = to_float(other.get('excavator_weight_min')), to_float(other.get('excavator_weight_max'))
+    if not (high and other_high):
+        return 0.0
+    common = min(high, other_high) - max(low, other_low)
+    if common < 0:
+        return 0.0
+    narrowest = min(high - low, other_high - other_low)
+    return common / narrowest if narrowest > 0 else 1.0
+
+
+def relevance(card, other):
+    score = 0.0
+    if card.get('subcategory_slug') and other.get('subcategory_slug') == card['subcategory_slug']:
+        score += SUBCATEGORY_SCORE
+    elif other.get('category_slug') == card.get('category_slug'):
+        score += CATEGORY_SCORE
+    score += TONNAGE_SCORE * tonnage_overlap(card, other)
+    score += WIDTH_SCORE * closeness(card.get('width'), other.get('width'))
+    score += VOLUME_SCORE * closeness(card.get('volume'), other.get('volume'))
+    if card.get('attachment_type') and other.get('attachment_type') == card['attachment_type']:
+        score += ATTACHMENT_SCORE
+    return score
+
+
+def rank_related(listing, categories=None, keys=(), size=RELATED_SIZE):
+    """{product key: up to `size` related cards, best first}, within the product's category.
+
+    Ranks the products of `categories` (every category if None) and the products `keys`.
+    """
+    by_category = {}
+    for key, card in listing.cards.items():
+        by_category.setdefault(card.get('category_slug'), []).append((key, card))
+
+    keys = set(keys)
+    related = {}
+    for category, entries in by_category.items():
+        ranked = entries if categories is None or category in categories else [
+            entry for entry in entries if entry[0] in keys]
+        if not ranked:
+            continue
+        # Newest first like the listing, so equal scores go to the newest product
+        entries.sort(key=lambda entry: entry[1].get('created_at') or '', reverse=True)
+        for key, card in ranked:
+            candidates = [(relevance(card, other), other) for other_key, other in entries if other_key != key]
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            related[key] = [other for _, other in candidates[:size]]
+    return related
+
+
+def get_related_card(card, locale, depth):
+    product_id = str(card.get('id', ''))
+    placeholder = PLACEHOLDER_PHOTOS[ord(product_id[0]) % len(PLACEHOLDER_PHOTOS) if product_id else 0]
+    specs = []
+    if card.get('width'):
+        specs.append(f"{format_number(card['width'])}mm")
+    if card.get('weight'):
+        specs.append(f"{format_number(card['weight'])} kg")
+    if card.get('excavator_weight_min') and card.get('excavator_weight_max'):
+        specs.append(f"{format_number(card['excavator_weight_min'])}-{format_number(card['excavator_weight_max'])}t")
+    return get_locale_template(RELATED_CARD, locale, LABELS[locale]).render(
+        url='../' * depth + card_path(card),
+        image=escape(card.get('image') or placeholder),
+        title=escape(card.get('title', '')),
+        specs_html=RELATED_SPECS.render(specs=escape(' | '.join(specs))) if specs else '',
+    )
+
+
+def get_related_html(related, locale, depth):
+    """The baked block: the markers around the related section (empty without related products)."""
+    if not related:
+        return RELATED_START + RELATED_END
+    cards_html = ''.join(get_related_card(card, locale, depth) for card in related)
+    section = get_locale_template(RELATED_SECTION, locale, LABELS[locale]).render(cards_html=cards_html)
+    return RELATED_START + section + RELATED_END
+
+
+def bake_related_products(listing, writer, categories=None, keys=(), web_root=WEB_ROOT):
+    """Bake the related products into the pages of `categories` (all if None) and of the products `keys`."""
+    for key, related in rank_related(listing, categories, keys).items():
+        path = card_path(listing.cards[key])
+        depth = path.count('/')
+        for locale in LOCALES:
+            page = Path(web_root) / locale / path / 'index.html'
+            try:
+                html = page.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                continue
+            block = get_related_html(related, locale, depth)
+            if RELATED_PATTERN.search(html):
+                writer.write(page, RELATED_PATTERN.sub(lambda _: block, html, count=1))
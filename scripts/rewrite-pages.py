@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Run the HTML rewrite pipeline over web/ in one pass.
+Replaces chaining fix-locale-paths.py, fix-absolute-links.py,
+add-hreflang-tags.py, fix-html-lang.py, add_canonical_script.py and
+fix-missing-headers.py: every page is read once, all enabled transforms are
+applied in order and the page is written only if it changed. The last
+transform, bake-layout, inlines the header and footer (site_layout.py).
+
+Usage:
+    python rewrite-pages.py                               # all transforms
+    python rewrite-pages.py --only fix-html-lang,add-hreflang
+    python rewrite-pages.py --skip fix-missing-headers --dry-run
+    python rewrite-pages.py --only bake-layout            # build stage before deploy
+    python rewrite-pages.py --list
+"""
+
+import os
+import argparse
+from collections import Counter
+
+import html_transforms  # registers the transforms
+from rewrite_pipeline import TRANSFORMS, run_pipeline
+
+def parse_names(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Apply the HTML rewrite transforms to web/ in one pass.')
+    parser.add_argument('--only', type=parse_names, help='Comma-separated transforms to run (default: all)')
+    parser.add_argument('--skip', type=parse_names, default=[], help='Comma-separated transforms to leave out')
+    parser.add_argument('--locale', action='append', choices=html_transforms.LOCALES,
+                        help='Only rewrite pages in this locale folder (repeatable)')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    parser.add_argument('--list', action='store_true', help='List the registered transforms and exit')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    if args.list:
+        for name, t in TRANSFORMS.items():
+            print(f"  {name:<22} [{t.scope}] {t.description}")
+        return
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    web_root = os.path.join(os.path.dirname(script_dir), 'web')
+
+    names = [name for name in (args.only or TRANSFORMS) if name not in args.skip]
+    print("Rewriting pages...")
+    print(f"Transforms: {', '.join(names)}")
+    print()
+
+    try:
+        changed = run_pipeline(names, web_root, locales=args.locale, dry_run=args.dry_run)
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+    for rel_path, applied in changed.items():
+        print(f"  ✓ {rel_path} ({', '.join(applied)})")
+
+    per_transform = Counter(name for applied in changed.values() for name in applied)
+    print()
+    for name in names:
+        print(f"  {name}: {per_transform[name]} files")
+    verb = 'would change' if args.dry_run else 'updated'
+    print(f"\nTotal files {verb}: {len(changed)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Plugin-style rewrite pipeline for the generated HTML pages under web/.
+Each rewrite (asset paths, absolute links, hreflang, html lang, ...) is a
+registered transform: a function that takes a page's text and its site
+inventory record and returns the new text. The runner reads every page once,
+applies the enabled transforms in registration order and writes only if the
+result differs.
+
+Usage:
+    from rewrite_pipeline import transform, run_pipeline
+
+    @transform('fix-html-lang')
+    def fix_html_lang(content, page):
+        return content.replace('<html lang="nl"', '<html lang="nl-BE"')
+
+    changed = run_pipeline(['fix-html-lang'])
+"""
+
+from site_inventory import SiteInventory, WEB_ROOT
+
+# Registered transforms, in the order they run
+TRANSFORMS = {}
+
+
+class Transform:
+    """A named rewrite over the text of one page.
+
+    `scope` is 'locale' for transforms that only apply to pages inside a
+    locale folder, or 'site' for every page under the web root.
+    """
+
+    def __init__(self, name, func, scope='locale', description=''):
+        self.name = name
+        self.func = func
+        self.scope = scope
+        self.description = description
+
+    def applies_to(self, page):
+        return self.scope == 'site' or page.locale is not None
+
+    def __call__(self, content, page):
+        return self.func(content, page)
+
+
+def transform(name, scope='locale'):
+    """Decorator registering `func(content, page) -> content` as a pipeline transform."""
+    def register(func):
+        if name in TRANSFORMS:
+            raise ValueError(f"Transform '{name}' is already registered")
+        description = (func.__doc__ or '').strip().split('\n')[0]
+        TRANSFORMS[name] = Transform(name, func, scope, description)
+        return func
+    return register
+
+
+def get_transforms(names=None):
+    """The registered transforms to run, in pipeline order (all of them if `names` is None)."""
+    if names is None:
+        return list(TRANSFORMS.values())
+    unknown = [name for name in names if name not in TRANSFORMS]
+    if unknown:
+        raise ValueError(f"Unknown transform(s): {', '.join(unknown)} (available: {', '.join(TRANSFORMS)})")
+    return [t for name, t in TRANSFORMS.items() if name in names]
+
+
+def apply_transforms(transforms, content, page):
+    """Run `transforms` over one page's text. Returns (new text, names of the transforms that changed it)."""
+    applied = []
+    for t in transforms:
+        result = t(content, page)
+        if result != content:
+            applied.append(t.name)
+            content = result
+    return content, applied
+
+
+def run_pipeline(names=None, web_root=WEB_ROOT, locales=None, dry_run=False):
+    """Apply the enabled transforms to every page under `web_root`.
+
+    Each page is read once and written at most once. Returns
+    {page rel path: [names of the transforms that changed it]} for the pages
+    that changed (and were written, unless `dry_run`).
+    """
+    transforms = get_transforms(names)
+    inventory = SiteInventory.load(web_root)
+    changed = {}
+
+    for page in inventory.pages():
+        if locales is not None and page.locale not in locales:
+            continue
+        enabled = [t for t in transforms if t.applies_to(page)]
+        if not enabled:
+            continue
+
+        content = page.read()
+        result, applied = apply_transforms(enabled, content, page)
+        if result != content:
+            if not dry_run:
+                page.write(result)
+            changed[page.rel] = applied
+
+    inventory.save()
+    return changed
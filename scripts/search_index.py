@@ -0,0 +1,133 @@
+"""
+Per-locale search index for typeahead, published with the static JSON API.
+Indexes the products of the listing snapshot (title and description), the
+categories and subcategories of catalog_data.py, the brands and machine
+models of brand-data.js and the blog post titles, so the browser can search
+without asking the CMS:
+
+    search/<locale>/docs.json      [{"type", "title", "url"}], a doc id is its position
+    search/<locale>/<char>.json    terms and trigrams starting with <char>
+
+A term shard is {"terms": {term: [doc ids]}, "trigrams": {trigram: [terms]}}
+with sorted keys, so a prefix is a range scan over the terms and a misspelt
+or partial word is found through the terms sharing most of its trigrams.
+Words are lowercased and stripped of accents; the browser (search-index.js)
+normalizes queries the same way.
+
+Usage:
+    from search_index import build_search_shards
+
+    shards = build_search_shards(listing)   # {shard name: data}
+"""
+
+import re
+import unicodedata
+from html import unescape
+from pathlib import Path
+
+from brand_data import load_brands
+from catalog_data import CATEGORIES, SUBCATEGORIES
+from product_listing import card_path, newest_first
+
+WEB_ROOT = Path(__file__).parent.parent / 'web'
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+SEARCH_VERSION = 1
+TITLE_PATTERN = re.compile(r'<title>(.*?)</title>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+# Words too common in the descriptions to narrow a search down
+STOPWORDS = {
+    'de', 'het', 'een', 'en', 'van', 'voor', 'met', 'op', 'in', 'te', 'is', 'zijn', 'of', 'door', 'bij', 'tot', 'uw', 'je',
+    'le', 'la', 'les', 'un', 'une', 'et', 'des', 'du', 'pour', 'avec', 'sur', 'dans', 'au', 'aux', 'est', 'votre',
+    'der', 'die', 'das', 'ein', 'eine', 'und', 'fur', 'mit', 'auf', 'im', 'zu', 'von', 'ist', 'ihr', 'ihre',
+}
+
+
+def normalize(text):
+    """Lowercase ASCII: 'Schnellwechsler für Bagger' -> 'schnellwechsler fur bagger'."""
+    decomposed = unicodedata.normalize('NFKD', unescape(TAG_PATTERN.sub(' ', str(text))))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def tokenize(*texts):
+    words = set()
+    for text in texts:
+        words.update(word for word in WORD_PATTERN.findall(normalize(text or ''))
+                     if word not in STOPWORDS and (len(word) > 1 or word.isdigit()))
+    return words
+
+
+def trigrams(word):
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+def product_docs(cards):
+    for card in newest_first(cards):
+        doc = {'type': 'product', 'title': card.get('title', ''), 'url': card_path(card)}
+        yield doc, tokenize(doc['title'], card.get('description'), card.get('attachment_type'))
+
+
+def catalog_docs(locale):
+    for slug, category in CATEGORIES.items():
+        title = category.get('title_translations', {}).get(locale, category['title'])
+        description = category.get('description_translations', {}).get(locale, category.get('description'))
+        yield {'type': 'category', 'title': title, 'url': f'producten/{slug}/'}, tokenize(title, description)
+    for slug, subcategory in SUBCATEGORIES.items():
+        title = subcategory.get('title_translations', {}).get(locale, subcategory['title'])
+        description = subcategory.get('description_translations', {}).get(locale, subcategory.get('description'))
+        url = f"producten/{subcategory['parent_category']}/{slug}/"
+        yield {'type': 'subcategory', 'title': title, 'url': url}, tokenize(title, description)
+
+
+def brand_docs(brands):
+    """A doc per brand and per machine model, all linking to the brand page."""
+    for slug, brand in brands.items():
+        url = f'kraanbakken/{slug}/'
+        yield {'type': 'brand', 'title': brand['name'], 'url': url}, tokenize(brand['name'], brand['short_name'])
+        for model in brand['models']:
+            title = f"{brand['name']} {model['name']}"
+            yield {'type': 'model', 'title': title, 'url': url}, tokenize(title, brand['short_name'], model['name'])
+
+
+def blog_docs(locale, web_root=WEB_ROOT):
+    for page in sorted((Path(web_root) / locale / 'blog').glob('*/index.html')):
+        match = TITLE_PATTERN.search(page.read_text(encoding='utf-8'))
+        if match:
+            title = unescape(match.group(1)).split(' | ')[0].strip()
+            yield {'type': 'blog', 'title': title, 'url': f'blog/{page.parent.name}/'}, tokenize(title)
+
+
+def locale_index(docs):
+    """(docs, {first char: shard}) for an iterable of (doc, words)."""
+    doc_list, postings = [], {}
+    for doc, words in docs:
+        for word in words:
+            postings.setdefault(word, []).append(len(doc_list))
+        doc_list.append(doc)
+
+    shards = {}
+    for word in sorted(postings):
+        shard = shards.setdefault(word[0], {'version': SEARCH_VERSION, 'terms': {}, 'trigrams': {}})
+        shard['terms'][word] = postings[word]
+    grams = {}
+    for word in postings:
+        for gram in trigrams(word):
+            grams.setdefault(gram, []).append(word)
+    for gram in sorted(grams):
+        shard = shards.setdefault(gram[0], {'version': SEARCH_VERSION, 'terms': {}, 'trigrams': {}})
+        shard['trigrams'][gram] = sorted(grams[gram])
+    return doc_list, shards
+
+
+def build_search_shards(listing, web_root=WEB_ROOT):
+    """{shard name: data} of the search index of every locale."""
+    brands = load_brands()
+    shards = {}
+    for locale in LOCALES:
+        docs = [*product_docs(listing.cards.values()), *catalog_docs(locale),
+                *brand_docs(brands), *blog_docs(locale, web_root)]
+        doc_list, term_shards = locale_index(docs)
+        shards[f'search/{locale}/docs'] = {'version': SEARCH_VERSION, 'docs': doc_list}
+        for char, shard in term_shards.items():
+            shards[f'search/{locale}/{char}'] = shard
+    return shards
@@ -0,0 +1,210 @@
+"""
+Cached inventory of the HTML pages under web/.
+Records path, locale, depth, URL path, size, mtime and content hash for every
+page, and keeps them in site_inventory.json between runs. A directory is only
+re-listed when its mtime moved and a page only re-hashed when its size or
+mtime moved, so chaining the fix-*/generate-* scripts costs one scan of the
+tree instead of one os.walk (and one full read) per script.
+
+Usage:
+    from site_inventory import SiteInventory
+
+    inventory = SiteInventory.load()
+    for page in inventory.pages('be-nl'):
+        html = page.read()
+        page.write(html.replace('old', 'new'))   # keeps the record current
+    inventory.save()
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+from output_writer import write_if_changed
+
+WEB_ROOT = Path(__file__).parent.parent / 'web'
+INVENTORY_PATH = Path(__file__).parent / 'site_inventory.json'
+INVENTORY_VERSION = 1
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+SKIP_DIRS = {'node_modules', '.git'}
+
+# Inventories already loaded by this process, by web root
+_loaded = {}
+
+
+def _join(rel_dir, name):
+    return f'{rel_dir}/{name}' if rel_dir else name
+
+
+def _is_under(rel, rel_dir):
+    return rel_dir == '' or rel == rel_dir or rel.startswith(rel_dir + '/')
+
+
+class Page:
+    """One HTML file in the site tree.
+
+    `rel` is the POSIX path from the web root (be-nl/contact/index.html).
+    `depth` and `url_path` are relative to the page's site root: the locale
+    folder for locale pages, the web root for everything else. A folder's
+    index.html has the folder URL (contact/); other files keep their name.
+    """
+
+    __slots__ = ('rel', 'path', 'locale', 'depth', 'url_path', 'size', 'mtime', 'hash')
+
+    def __init__(self, web_root, rel, size=None, mtime=None, hash=None):
+        self.rel = rel
+        self.path = Path(web_root) / rel
+        parts = rel.split('/')
+        self.locale = parts[0] if len(parts) > 1 and parts[0] in LOCALES else None
+        if self.locale:
+            parts = parts[1:]
+        self.depth = len(parts) - 1
+        folder = ''.join(part + '/' for part in parts[:-1])
+        self.url_path = folder if parts[-1] == 'index.html' else folder + parts[-1]
+        self.size = size
+        self.mtime = mtime
+        self.hash = hash
+
+    @property
+    def is_index(self):
+        return self.path.name == 'index.html'
+
+    def read(self):
+        """The page's text; also refreshes the recorded hash."""
+        data = self.path.read_bytes()
+        self._record(data)
+        return data.decode('utf-8')
+
+    def write(self, content):
+        """Write text (or bytes) to the page and record the new size, mtime and hash."""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        self.path.write_bytes(data)
+        self._record(data)
+
+    def digest(self):
+        """SHA-256 of the page's bytes, hashing the file only if it changed since the last run."""
+        if self.hash is None:
+            self.read()
+        return self.hash
+
+    def _record(self, data):
+        stat = self.path.stat()
+        self.size, self.mtime = stat.st_size, stat.st_mtime_ns
+        self.hash = hashlib.sha256(data).hexdigest()
+
+
+class SiteInventory:
+    """Every HTML page under a web root, kept current against the files on disk."""
+
+    def __init__(self, web_root=WEB_ROOT, path=INVENTORY_PATH):
+        self.web_root = Path(web_root)
+        self.path = Path(path)
+        self.dirs = {}
+        self._pages = {}
+
+    @classmethod
+    def load(cls, web_root=WEB_ROOT, path=INVENTORY_PATH):
+        """The inventory for `web_root`, read from the cache and brought up to date.
+
+        Within one process the same inventory is returned for the same web
+        root, so helper functions can call this freely.
+        """
+        key = Path(web_root).resolve()
+        if key in _loaded:
+            return _loaded[key]
+
+        inventory = cls(web_root, path)
+        try:
+            data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        if data.get('version') == INVENTORY_VERSION and data.get('root') == str(key):
+            inventory.dirs = data.get('dirs', {})
+            for rel, (size, mtime, digest) in data.get('pages', {}).items():
+                inventory._pages[rel] = Page(inventory.web_root, rel, size, mtime, digest)
+        inventory.refresh()
+        _loaded[key] = inventory
+        return inventory
+
+    def refresh(self):
+        """Re-list directories whose mtime moved and forget hashes of pages that changed."""
+        if not self.dirs:
+            self._scan('')
+        else:
+            for rel_dir, mtime in list(self.dirs.items()):
+                if rel_dir in self.dirs and self._dir_mtime(rel_dir) != mtime:
+                    self._scan(rel_dir)
+
+        for rel, page in list(self._pages.items()):
+            try:
+                stat = page.path.stat()
+            except FileNotFoundError:
+                del self._pages[rel]
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (page.size, page.mtime):
+                page.size, page.mtime, page.hash = stat.st_size, stat.st_mtime_ns, None
+
+    def _dir_mtime(self, rel_dir):
+        try:
+            return (self.web_root / rel_dir).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _forget(self, rel_dir):
+        """Drop a directory and everything recorded below it."""
+        for known in [d for d in self.dirs if _is_under(d, rel_dir)]:
+            del self.dirs[known]
+        for rel in [r for r in self._pages if _is_under(r, rel_dir)]:
+            del self._pages[rel]
+
+    def _scan(self, rel_dir):
+        """List one directory, picking up new pages and (recursively) new subdirectories."""
+        mtime = self._dir_mtime(rel_dir)
+        if mtime is None:
+            self._forget(rel_dir)
+            return
+        self.dirs[rel_dir] = mtime
+
+        subdirs, files = set(), set()
+        with os.scandir(self.web_root / rel_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.add(_join(rel_dir, entry.name))
+                elif entry.name.endswith('.html'):
+                    files.add(_join(rel_dir, entry.name))
+
+        for rel in files:
+            if rel not in self._pages:
+                self._pages[rel] = Page(self.web_root, rel)
+        for rel in [r for r in self._pages if r.rpartition('/')[0] == rel_dir and r not in files]:
+            del self._pages[rel]
+        for known in [d for d in self.dirs if d and d.rpartition('/')[0] == rel_dir and d not in subdirs]:
+            self._forget(known)
+        for subdir in sorted(subdirs):
+            if subdir not in self.dirs:
+                self._scan(subdir)
+
+    def pages(self, locale=None, under=None):
+        """Pages sorted by path, optionally limited to a locale and/or a folder below the web root."""
+        for rel in sorted(self._pages):
+            page = self._pages[rel]
+            if locale is not None and page.locale != locale:
+                continue
+            if under is not None and not _is_under(rel, under.strip('/')):
+                continue
+            yield page
+
+    def __len__(self):
+        return len(self._pages)
+
+    def save(self):
+        """Write the cache file if anything changed. Returns True if written."""
+        data = {
+            'version': INVENTORY_VERSION,
+            'root': str(self.web_root.resolve()),
+            'dirs': dict(sorted(self.dirs.items())),
+            'pages': {rel: [page.size, page.mtime, page.hash] for rel, page in sorted(self._pages.items())},
+        }
+        return write_if_changed(self.path, json.dumps(data, indent=1) + '\n')
@@ -0,0 +1,384 @@
+"""
+Build-time header and footer for the locale pages.
+The mega menu header and the footer are rendered from catalog_data
+CATEGORIES / SUBCATEGORIES and the web/_i18n/<locale>.json strings, compiled
+once per locale and path depth, and inlined in place of the
+header-placeholder / footer-placeholder divs. header-loader.js and
+footer-loader.js then only attach behaviour (mobile menu, scroll state,
+language and account dropdowns) instead of building the markup after load.
+
+Baked markup sits between marker comments, so a page can be re-baked when
+the menu changes or stripped back to its placeholders (strip_layout).
+
+Usage:
+    from site_layout import bake_layout
+
+    html = bake_layout(html, 'be-fr', depth=1, url_path='contact/')
+"""
+
+import re
+import json
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
+from catalog_data import CATEGORIES, SUBCATEGORIES
+from sync_state import content_hash
+from template_engine import PageTemplate
+
+WEB_ROOT = Path(__file__).parent.parent / 'web'
+I18N_DIR = WEB_ROOT / '_i18n'
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+LOGO_URL = 'https://res.cloudinary.com/dchrgzyb4/image/upload/v1764264700/Logo-transparant_neticz.png'
+
+# Tonnage links under each subcategory of the mega menu: (filter id, label);
+# the ids are the ones filters.js maps onto its excavator class checkboxes
+MENU_TONNAGES = {
+    'graafbakken': [('1-3t', '1 - 3 ton'), ('3-8t', '3 - 8 ton'), ('8-15t', '8 - 15 ton'),
+                    ('15-25t', '15 - 25 ton'), ('25-50t', '25 - 50 ton')],
+    'sloop-sorteergrijpers': [('1t-5t', '1t - 5t'), ('10t-20t', '10t - 20t'), ('20t-30t', '20t - 30t'),
+                              ('30t-40t', '30t - 40t'), ('40t-plus', '40t+')],
+}
+MENU_BRANDS = [('caterpillar', 'Caterpillar'), ('komatsu', 'Komatsu'), ('volvo', 'Volvo'), ('hitachi', 'Hitachi')]
+
+HEADER_START, HEADER_END = '<!-- site-header -->', '<!-- /site-header -->'
+FOOTER_START, FOOTER_END = '<!-- site-footer -->', '<!-- /site-footer -->'
+HEADER_PLACEHOLDER = '<div id="header-placeholder"></div>'
+FOOTER_PLACEHOLDER = '<div id="footer-placeholder"></div>'
+BAKED_HEADER_PATTERN = re.compile(re.escape(HEADER_START) + '.*?' + re.escape(HEADER_END), re.DOTALL)
+BAKED_FOOTER_PATTERN = re.compile(re.escape(FOOTER_START) + '.*?' + re.escape(FOOTER_END), re.DOTALL)
+HEADER_PATTERN = re.compile(r'<div id="header-placeholder">\s*</div>|' + BAKED_HEADER_PATTERN.pattern, re.DOTALL)
+FOOTER_PATTERN = re.compile(r'<div id="footer-placeholder">\s*</div>|' + BAKED_FOOTER_PATTERN.pattern, re.DOTALL)
+
+# Left as slots in the compiled locale templates, filled per depth / page
+BASE, HOME, ROOT, PAGE_PATH = '{{base}}', '{{home}}', '{{root}}', '{{page_path}}'
+
+ARROW_ICON = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg>'
+CHECK_ICON = '<svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="9 11 12 14 22 4"></polyline><path d="M21 12v7a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h11"></path></svg>'
+
+LANGUAGE_LINK = PageTemplate('<a href="{{href}}"{{active}}>{{name}}</a>')
+
+TONNAGE_LINK = PageTemplate('<a href="{{href}}" class="menu-tonnage-link"><span>•</span> <span>{{label}}</span></a>')
+
+MENU_COLUMN = PageTemplate('''
+                    <div class="menu-column">
+                      <a href="{{href}}" class="menu-column-title">{{title}}</a>
+                      <div class="menu-tonnage-list">
+                        {{links}}
+                      </div>
+                    </div>''')
+
+MENU_ITEM = PageTemplate('''
+          <div class="menu-item">
+            <a href="{{href}}">
+              {{title}} <span class="dropdown-arrow">▼</span>
+            </a>
+            <div class="menu-dropdown">
+              <div class="menu-dropdown-container">
+                <div class="menu-dropdown-content" style="width: 100%;">
+                  <div class="menu-dropdown-header">
+                    <h3 class="menu-dropdown-title">{{title}}</h3>
+                    <a href="{{href}}" class="menu-dropdown-view-all"><span>{{view_all}}</span></a>
+                  </div>
+                  <div class="menu-dropdown-grid">{{columns}}
+                  </div>
+                  <div class="menu-cta-box">
+                    <div class="menu-cta-content">
+                      <h4 class="menu-cta-title">{{help_needed}}</h4>
+                      <p class="menu-cta-text">{{help_text}}</p>
+                    </div>
+                    <a href="{{contact_href}}" class="btn-split">
+                      <span class="btn-split-text">{{contact_us}}</span>
+                      <span class="btn-split-icon">{{arrow_icon}}</span>
+                    </a>
+                  </div>
+                </div>
+              </div>
+            </div>
+          </div>''')
+
+MOBILE_CATEGORY_LINK = PageTemplate('''
+      <a href="{{href}}" class="nav-link">
+        {{icon}}
+        {{title}}
+      </a>''')
+
+MOBILE_COMPACT_LINK = PageTemplate('''
+      <a href="{{href}}" class="nav-link nav-link-compact">{{title}}</a>''')
+
+HEADER = PageTemplate('''<!-- site-header -->
+  <div class="header-wrapper" id="header-wrapper">
+    <div class="top-bar">
+      <div class="container">
+        <div class="language-switcher language-switcher--topbar">
+          <button class="lang-toggle" id="lang-toggle" aria-label="{{change_language}}">
+            <span class="lang-code">{{lang_code}}</span>
+            <span class="lang-arrow">▼</span>
+          </button>
+          <div class="lang-dropdown" id="lang-dropdown">
+            {{language_links}}
+          </div>
+        </div>
+        <nav class="top-nav">
+          <div class="account-menu-wrapper" id="account-menu-wrapper">
+            <a href="#" id="login-btn" class="login-trigger"><span>{{login}}</span></a>
+          </div>
+          <a href="{{base}}over-ons/">{{about}}</a>
+          <a href="{{base}}dealer/">{{dealer}}</a>
+          <a href="{{base}}blog/">{{blog}}</a>
+          <a href="{{base}}faq/">{{faq}}</a>
+          <a href="{{base}}contact/">{{contact}}</a>
+        </nav>
+      </div>
+    </div>
+    <nav class="main-nav">
+      <div class="container">
+        <a href="{{home}}" class="logo">
+          <img src="{{logo_url}}" alt="Structon Logo" class="logo-image">
+        </a>
+        <div class="menu">{{menu_items}}
+        </div>
+        <div class="nav-actions">
+          <a href="{{base}}producten/" class="cta-button">{{view_all}}</a>
+        </div>
+        <button class="menu-toggle" id="menu-toggle" aria-label="{{open_menu}}">
+          <span></span>
+          <span></span>
+          <span></span>
+        </button>
+      </div>
+    </nav>
+  </div>
+  <nav class="nav-mobile" id="nav-mobile" aria-label="{{mobile_nav}}">
+    <button class="nav-mobile-close" id="nav-mobile-close" aria-label="{{close_menu}}">×</button>
+    <div class="mobile-menu-section">
+      <a href="{{base}}producten/" class="nav-link nav-link-primary">
+        <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="3" y="3" width="7" height="7"></rect><rect x="14" y="3" width="7" height="7"></rect><rect x="14" y="14" width="7" height="7"></rect><rect x="3" y="14" width="7" height="7"></rect></svg>
+        {{all_products}}
+      </a>
+      <a href="{{base}}offerte-aanvragen/" class="nav-link nav-link-cta">
+        <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path><polyline points="14 2 14 8 20 8"></polyline><line x1="16" y1="13" x2="8" y2="13"></line><line x1="16" y1="17" x2="8" y2="17"></line><polyline points="10 9 9 9 8 9"></polyline></svg>
+        {{quote}}
+      </a>
+    </div>
+    <div class="mobile-menu-section">
+      <div class="menu-section-title">{{product_categories}}</div>{{mobile_categories}}
+      <a href="{{base}}producten/" class="nav-link-more">{{view_all}} →</a>
+    </div>
+    <div class="mobile-menu-section">
+      <div class="menu-section-title">{{brands}}</div>{{mobile_brands}}
+      <a href="{{base}}producten/" class="nav-link-more">{{all_brands}} →</a>
+    </div>
+    <div class="mobile-menu-section">
+      <div class="menu-section-title">{{company}}</div>
+      <a href="{{base}}over-ons/" class="nav-link nav-link-compact">{{about}}</a>
+      <a href="{{base}}contact/" class="nav-link nav-link-compact">{{contact}}</a>
+      <a href="{{base}}blog/" class="nav-link nav-link-compact">{{blog}}</a>
+      <a href="{{base}}faq/" class="nav-link nav-link-compact">{{faq}}</a>
+    </div>
+    <div class="mobile-menu-section">
+      <a href="#" class="btn btn-primary btn-block login-trigger">
+        <svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M20 21v-2a4 4 0 0 0-4-4H8a4 4 0 0 0-4 4v2"></path><circle cx="12" cy="7" r="4"></circle></svg>
+        {{login_register}}
+      </a>
+    </div>
+  </nav>
+  <!-- /site-header -->''')
+
+FOOTER = PageTemplate('''<!-- site-footer -->
+  <footer class="site-footer">
+    <div class="container">
+      <div class="footer-top">
+        <div class="footer-brand-col">
+          <a href="{{home}}" class="footer-logo">
+            <img src="{{logo_url}}" alt="Structon" width="120">
+          </a>
+          <p class="footer-tagline">
+            {{tagline}}
+          </p>
+        </div>
+        <div class="footer-sitemap-col">
+          <ul id="footer-sitemap" class="sitemap-grid">
+            <li class="sitemap-loading">{{nav_loading}}</li>
+          </ul>
+        </div>
+        <div class="footer-contact-col">
+          <h4 class="footer-heading">{{contact}}</h4>
+          <address class="footer-address">
+            <p><strong>Structon BV</strong></p>
+            <p>BE 1029978959</p>
+            <p>Sint jorisstraat 84B</p>
+            <p>8730 Beernem</p>
+            <p class="mt-2"><a href="mailto:info@structon.be">info@structon.be</a></p>
+          </address>
+        </div>
+      </div>
+      <div class="footer-bottom">
+        <div class="footer-legal">
+          <p>{{copyright}}</p>
+          <div class="legal-links">
+            <a href="{{base}}sitemap-pagina/">{{sitemap}}</a>
+            <span class="separator">&bull;</span>
+            <a href="{{base}}privacy/">{{privacy}}</a>
+            <span class="separator">&bull;</span>
+            <a href="{{base}}voorwaarden/">{{terms}}</a>
+          </div>
+        </div>
+        <div class="footer-creator">
+          <span>{{made_by}} <a href="https://grafixstudio.be/" target="_blank" rel="noopener">Grafix Studio</a></span>
+          <span class="creator-separator">&bull;</span>
+          <a href="https://structon-production.up.railway.app/cms/" class="cms-lock-link" target="_blank" rel="noopener" title="CMS Login">
+            <svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+              <rect x="3" y="11" width="18" height="11" rx="2" ry="2"></rect>
+              <path d="M7 11V7a5 5 0 0 1 10 0v4"></path>
+            </svg>
+          </a>
+        </div>
+      </div>
+    </div>
+  </footer>
+  <!-- /site-footer -->''')
+
+
+@lru_cache(maxsize=None)
+def get_strings(locale):
+    """The web/_i18n strings of a locale."""
+    return json.loads((I18N_DIR / f'{locale}.json').read_text(encoding='utf-8'))
+
+
+def layout_version():
+    """Hash of the data the baked markup is built from."""
+    return content_hash([
+        [get_strings(locale) for locale in LOCALES],
+        CATEGORIES, SUBCATEGORIES, MENU_TONNAGES, MENU_BRANDS,
+    ])
+
+
+def translated_title(entry, locale):
+    return escape(entry['title_translations'].get(locale, entry['title']), quote=False)
+
+
+def get_menu_items(locale, strings):
+    """The mega menu: one dropdown per category, one column per subcategory."""
+    layout = strings['layout']
+    items = []
+    for category_slug, category in CATEGORIES.items():
+        category_href = f'{BASE}producten/{category_slug}/'
+        columns = []
+        for subcat_slug in category.get('subcategories', []):
+            subcat = SUBCATEGORIES[subcat_slug]
+            subcat_title = translated_title(subcat, locale)
+            subcat_href = f'{category_href}{subcat_slug}/'
+            links = [TONNAGE_LINK.render(href=f'{subcat_href}?tonnage={tonnage}',
+                                         label=f"{subcat_title} {escape(layout['for_machines'], quote=False)} {label}")
+                     for tonnage, label in MENU_TONNAGES.get(category_slug, [])]
+            columns.append(MENU_COLUMN.render(href=subcat_href, title=subcat_title,
+                                              links='\n                        '.join(links)))
+        items.append(MENU_ITEM.render(
+            href=category_href,
+            title=translated_title(category, locale),
+            view_all=escape(layout['view_all'], quote=False),
+            columns=''.join(columns),
+            help_needed=escape(layout['help_needed'], quote=False),
+            help_text=escape(layout['help_text'].get(category_slug, layout['help_text']['overige']), quote=False),
+            contact_href=f'{BASE}contact/',
+            contact_us=escape(layout['contact_us'], quote=False),
+            arrow_icon=ARROW_ICON,
+        ))
+    return ''.join(items)
+
+
+def get_language_links(locale):
+    """Links to this page in every locale, relative to the web root."""
+    links = []
+    for other in LOCALES:
+        links.append(LANGUAGE_LINK.render(
+            href=f'{ROOT}{other}/{PAGE_PATH}',
+            active=' class="active"' if other == locale else '',
+            name=escape(get_strings(other)['name'], quote=False),
+        ))
+    return '\n            '.join(links)
+
+
+@lru_cache(maxsize=None)
+def compile_header(locale):
+    """The header of a locale, with only the path slots (base, home, root, page_path) left open."""
+    strings = get_strings(locale)
+    nav, layout = strings['nav'], strings['layout']
+    text = {key: escape(value, quote=False) for key, value in {**nav, **layout}.items() if isinstance(value, str)}
+    source = HEADER.render(
+        text,
+        base=BASE, home=HOME,
+        lang_code=strings['lang'].upper(),
+        change_language=escape(layout['change_language']),
+        open_menu=escape(layout['open_menu']),
+        close_menu=escape(layout['close_menu']),
+        mobile_nav=escape(layout['mobile_nav']),
+        language_links=get_language_links(locale),
+        logo_url=LOGO_URL,
+        menu_items=get_menu_items(locale, strings),
+        mobile_categories=''.join(
+            MOBILE_CATEGORY_LINK.render(href=f'{BASE}producten/{slug}/', icon=CHECK_ICON,
+                                        title=translated_title(category, locale))
+            for slug, category in CATEGORIES.items()),
+        mobile_brands=''.join(
+            MOBILE_COMPACT_LINK.render(href=f'{BASE}kraanbakken/{slug}/', title=name)
+            for slug, name in MENU_BRANDS),
+    )
+    return PageTemplate(source)
+
+
+@lru_cache(maxsize=None)
+def compile_footer(locale):
+    """The footer of a locale, with only the path slots (base, home) left open."""
+    strings = get_strings(locale)
+    text = {key: escape(value, quote=False) for key, value in strings['footer'].items()}
+    return PageTemplate(FOOTER.render(
+        text,
+        base=BASE, home=HOME,
+        logo_url=LOGO_URL,
+        nav_loading=escape(strings['layout']['nav_loading'], quote=False),
+        contact=escape(strings['nav']['contact'], quote=False),
+    ))
+
+
+def get_path_values(depth):
+    """Relative prefixes from a page `depth` levels below its locale folder."""
+    base = '../' * depth
+    return {'base': base, 'home': base or './', 'root': '../' * (depth + 1)}
+
+
+@lru_cache(maxsize=None)
+def get_header_template(locale, depth):
+    values = get_path_values(depth)
+    return compile_header(locale).bind(base=values['base'], home=values['home'], root=values['root'])
+
+
+@lru_cache(maxsize=None)
+def render_footer(locale, depth):
+    """The baked footer of a page `depth` levels below the locale folder."""
+    values = get_path_values(depth)
+    return compile_footer(locale).render(base=values['base'], home=values['home'])
+
+
+def render_header(locale, depth, url_path):
+    """The baked header of the page at /<locale>/<url_path>, `depth` levels below the locale folder."""
+    return get_header_template(locale, depth).render(page_path=url_path)
+
+
+def bake_layout(html, locale, depth, url_path):
+    """Inline the header and footer, replacing the placeholders or previously baked markup."""
+    header = render_header(locale, depth, url_path)
+    footer = render_footer(locale, depth)
+    html = HEADER_PATTERN.sub(lambda match: header, html, count=1)
+    return FOOTER_PATTERN.sub(lambda match: footer, html, count=1)
+
+
+def is_baked(html):
+    return HEADER_START in html or FOOTER_START in html
+
+
+def strip_layout(html):
+    """Turn baked header and footer markup back into the placeholders."""
+    html = BAKED_HEADER_PATTERN.sub(HEADER_PLACEHOLDER, html)
+    return BAKED_FOOTER_PATTERN.sub(FOOTER_PLACEHOLDER, html)
@@ -0,0 +1,391 @@
+"""
+Keyed sitemap store for the locale sitemaps (web/sitemap-<locale>.xml).
+Entries are keyed by <loc> and grouped into sections (static pages, catalog
+pages, product pages), so each generator can upsert or remove its own URLs
+without touching the others. Serialization is deterministic: sections in a
+fixed order, entries sorted by <loc>.
+
+With a LastmodLedger attached, <lastmod> follows the content of each page:
+it only moves when the page's hash changes, so reruns over unchanged pages
+leave the sitemaps byte-identical.
+
+Usage:
+    from sitemap_store import SitemapStore, LastmodLedger, url_entry
+
+    ledger = LastmodLedger.load()
+    store = SitemapStore.load(WEB_ROOT / 'sitemap-be-nl.xml', ledger)
+    store.upsert('products', url_entry('be-nl', 'producten/graafbakken/x/', TODAY), digest)
+    store.remove('https://structon.be/be-nl/producten/graafbakken/y/')
+    store.save(writer)
+    ledger.save()
+"""
+
+import re
+import gzip
+import json
+import hashlib
+from pathlib import Path
+
+from output_writer import OutputWriter
+
+BASE_URL = 'https://structon.be'
+LEDGER_PATH = Path(__file__).parent / 'sitemap_ledger.json'
+LEDGER_VERSION = 1
+
+# Protocol limits per sitemap file (the byte limit applies uncompressed)
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+# Format for sitemaps that do not exist yet; existing ones keep their format
+GZIP_SITEMAPS = False
+LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
+DEFAULT_LOCALE = 'be-nl'
+HREFLANG_MAP = {
+    'be-nl': 'nl-BE',
+    'nl-nl': 'nl-NL',
+    'be-fr': 'fr-BE',
+    'de-de': 'de-DE'
+}
+
+# Sections in serialization order, with the comment that introduces them
+SECTIONS = {
+    'pages': None,
+    'categories': 'Category & Subcategory Pages (Clean URLs)',
+    'products': 'Product Pages',
+}
+SECTION_BY_COMMENT = {comment: name for name, comment in SECTIONS.items() if comment}
+
+HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:xhtml="http://www.w3.org/1999/xhtml">
+'''
+FOOTER = '</urlset>'
+
+TOKEN_PATTERN = re.compile(r'<!--\s*(.*?)\s*-->|<url>(.*?)</url>', re.DOTALL)
+FIELD_PATTERN = re.compile(r'<(loc|lastmod|changefreq|priority)>(.*?)</\1>', re.DOTALL)
+ALTERNATE_PATTERN = re.compile(r'<xhtml:link rel="alternate" hreflang="([^"]+)" href="([^"]+)"/>')
+LASTMOD_PATTERN = re.compile(r'<lastmod>([^<]+)</lastmod>')
+
+
+def url_entry(locale, path, lastmod, changefreq='weekly', priority='0.7', base_url=BASE_URL, locales=LOCALES):
+    """Build a sitemap entry for `path` (relative to the locale root) with hreflang alternates."""
+    alternates = [(HREFLANG_MAP[loc], f'{base_url}/{loc}/{path}') for loc in locales]
+    alternates.append(('x-default', f'{base_url}/{DEFAULT_LOCALE}/{path}'))
+    return {
+        'loc': f'{base_url}/{locale}/{path}',
+        'lastmod': lastmod,
+        'changefreq': changefreq,
+        'priority': priority,
+        'alternates': alternates,
+    }
+
+
+def file_hash(path):
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def page_file(web_root, locale, path):
+    """The index.html that serves `path` (relative to the locale root)."""
+    return Path(web_root) / locale / path / 'index.html'
+
+
+def shard_path(path, number, compress=False):
+    """File of shard `number` (1-based) of the sitemap at `path`.
+
+    The first shard keeps the plain name (sitemap-be-nl.xml); further
+    shards are numbered (sitemap-be-nl-2.xml). Compressed shards add .gz.
+    """
+    path = Path(path)
+    stem = path.name[:-len('.xml')]
+    name = f'{stem}.xml' if number == 1 else f'{stem}-{number}.xml'
+    return path.with_name(name + ('.gz' if compress else ''))
+
+
+def existing_shards(path):
+    """Shard files of the sitemap at `path` currently on disk, in shard order."""
+    path = Path(path)
+    stem = re.escape(path.name[:-len('.xml')])
+    pattern = re.compile(rf'{stem}(?:-(\d+))?\.xml(\.gz)?')
+    shards = []
+    if path.parent.is_dir():
+        for candidate in path.parent.iterdir():
+            match = pattern.fullmatch(candidate.name)
+            if match:
+                shards.append((int(match.group(1) or 1), candidate.name, candidate))
+    return [candidate for _, _, candidate in sorted(shards)]
+
+
+def parse_entry(body):
+    """Parse the inside of a <url> element into an entry dict."""
+    entry = {'loc': None, 'lastmod': None, 'changefreq': None, 'priority': None}
+    for name, value in FIELD_PATTERN.findall(body):
+        entry[name] = value.strip()
+    entry['alternates'] = ALTERNATE_PATTERN.findall(body)
+    return entry
+
+
+def format_entry(entry):
+    """Serialize one entry as a <url> element."""
+    lines = ['  <url>', f"    <loc>{entry['loc']}</loc>"]
+    for name in ('lastmod', 'changefreq', 'priority'):
+        if entry.get(name):
+            lines.append(f'    <{name}>{entry[name]}</{name}>')
+    for hreflang, href in entry.get('alternates', []):
+        lines.append(f'    <xhtml:link rel="alternate" hreflang="{hreflang}" href="{href}"/>')
+    lines.append('  </url>')
+    return '\n'.join(lines)
+
+
+class LastmodLedger:
+    """Content hash and lastmod of every sitemap URL, persisted between runs."""
+
+    def __init__(self, path=LEDGER_PATH, urls=None):
+        self.path = Path(path)
+        self.urls = urls or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=LEDGER_PATH):
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != LEDGER_VERSION:
+            return cls(path)
+        return cls(path, data.get('urls', {}))
+
+    def lastmod(self, loc, digest, today, previous=None):
+        """The <lastmod> for `loc`: unchanged while its content hash is, otherwise `today`.
+
+        `previous` is the lastmod already in the sitemap; it seeds the ledger
+        for URLs it has not seen yet. Without a digest (page not on disk) the
+        previous lastmod is kept.
+        """
+        record = self.urls.get(loc)
+        if digest is None:
+            return (record or {}).get('lastmod') or previous or today
+        if record is None and previous:
+            record = {'hash': digest, 'lastmod': previous}
+            self.urls[loc] = record
+            self.dirty = True
+        if record and record.get('hash') == digest:
+            return record['lastmod']
+        self.urls[loc] = {'hash': digest, 'lastmod': today}
+        self.dirty = True
+        return today
+
+    def forget(self, loc):
+        if self.urls.pop(loc, None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Write the ledger if anything changed. Returns True if written."""
+        if not self.dirty:
+            return False
+        data = {'version': LEDGER_VERSION, 'urls': dict(sorted(self.urls.items()))}
+        self.path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+        self.dirty = False
+        return True
+
+
+class SitemapStore:
+    """The <url> entries of one sitemap file, keyed by <loc>."""
+
+    def __init__(self, path, entries=None, sections=None, ledger=None, compress=GZIP_SITEMAPS):
+        self.path = Path(path)
+        self.entries = entries or {}
+        self.sections = sections or {}
+        self.ledger = ledger
+        self.compress = compress
+
+    @classmethod
+    def load(cls, path, ledger=None):
+        """Parse every shard of a sitemap. Entries after a section comment belong to that section.
+
+        `path` names the first, uncompressed shard (web/sitemap-be-nl.xml);
+        the store keeps the format (plain or gzip) found on disk.
+        """
+        store = cls(path, ledger=ledger)
+        shards = existing_shards(store.path)
+        if shards:
+            store.compress = shards[0].name.endswith('.gz')
+
+        for shard in shards:
+            section = 'pages'
+            for match in TOKEN_PATTERN.finditer(read_sitemap(shard)):
+                comment, body = match.groups()
+                if body is None:
+                    section = SECTION_BY_COMMENT.get(comment, section)
+                    continue
+                entry = parse_entry(body)
+                if entry['loc']:
+                    store.entries[entry['loc']] = entry
+                    store.sections[entry['loc']] = section
+        return store
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, loc):
+        return loc in self.entries
+
+    def get(self, loc):
+        return self.entries.get(loc)
+
+    def section_of(self, loc):
+        return self.sections.get(loc)
+
+    def locs(self, section):
+        """All <loc>s in a section."""
+        return {loc for loc, name in self.sections.items() if name == section}
+
+    def lastmod(self):
+        """Newest <lastmod> of any entry (for the sitemap index)."""
+        return max((entry['lastmod'] for entry in self.entries.values() if entry.get('lastmod')), default=None)
+
+    def upsert(self, section, entry, digest=None):
+        """Insert or replace an entry, moving it into `section`. Returns True if anything changed.
+
+        With a ledger, the entry's lastmod is taken as "today" and only used
+        if `digest` (the page's content hash) differs from the recorded one.
+        """
+        if section not in SECTIONS:
+            raise ValueError(f"Unknown sitemap section: {section}")
+        loc = entry['loc']
+        if self.ledger is not None:
+            previous = (self.entries.get(loc) or {}).get('lastmod')
+            entry = {**entry, 'lastmod': self.ledger.lastmod(loc, digest, entry['lastmod'], previous)}
+        if self.entries.get(loc) == entry and self.sections.get(loc) == section:
+            return False
+        self.entries[loc] = entry
+        self.sections[loc] = section
+        return True
+
+    def remove(self, loc):
+        """Drop an entry. Returns True if it existed."""
+        if self.ledger is not None:
+            self.ledger.forget(loc)
+        self.sections.pop(loc, None)
+        return self.entries.pop(loc, None) is not None
+
+    def replace_section(self, section, entries):
+        """Make `section` hold exactly `entries`: upsert them and remove every other entry in it.
+
+        `entries` yields entries or (entry, digest) pairs. Returns the number
+        of entries added, changed or removed.
+        """
+        keep = set()
+        changes = 0
+        for item in entries:
+            entry, digest = item if isinstance(item, tuple) else (item, None)
+            keep.add(entry['loc'])
+            changes += self.upsert(section, entry, digest)
+        for loc in self.locs(section) - keep:
+            changes += self.remove(loc)
+        return changes
+
+    def iter_entries(self):
+        """Yield (section, entry) in serialization order: fixed section order, sorted by <loc>."""
+        for section in SECTIONS:
+            for loc in sorted(self.locs(section)):
+                yield section, self.entries[loc]
+
+    def serialize_shards(self, max_urls=MAX_URLS, max_bytes=MAX_BYTES):
+        """Yield the XML of each shard, starting a new one before either limit is reached.
+
+        A shard that continues a section repeats its comment, so every shard
+        can be loaded on its own. There is always at least one shard.
+        """
+        overhead = len(HEADER.encode('utf-8')) + len(FOOTER.encode('utf-8')) + 1
+        parts, size, count, current = [], overhead, 0, 'pages'
+        for section, entry in self.iter_entries():
+            text = format_entry(entry) + '\n'
+            cost = len(text.encode('utf-8')) + 1
+            if count and (count >= max_urls or size + cost > max_bytes):
+                yield '\n'.join([HEADER, *parts, FOOTER])
+                parts, size, count, current = [], overhead, 0, 'pages'
+            if section != current and SECTIONS[section]:
+                comment = f'  <!-- {SECTIONS[section]} -->'
+                parts.append(comment)
+                size += len(comment.encode('utf-8')) + 1
+            current = section
+            parts.append(text)
+            size += cost
+            count += 1
+        yield '\n'.join([HEADER, *parts, FOOTER])
+
+    def serialize(self):
+        """Render the whole sitemap as a single document (ignoring the shard limits)."""
+        return next(self.serialize_shards(max_urls=float('inf'), max_bytes=float('inf')))
+
+    def save(self, writer=None):
+        """Write every shard whose bytes changed and delete shards that are no longer needed.
+
+        Returns True if any file was written or removed.
+        """
+        writer = writer or OutputWriter()
+        changed = False
+        paths = []
+        for number, text in enumerate(self.serialize_shards(), 1):
+            path = shard_path(self.path, number, self.compress)
+            data = text.encode('utf-8')
+            if self.compress:
+                # mtime=0 keeps the gzip bytes identical between runs
+                data = gzip.compress(data, mtime=0)
+            changed |= writer.write(path, data)
+            paths.append(path)
+        for stale in set(existing_shards(self.path)) - set(paths):
+            changed |= writer.remove(stale)
+        return changed
+
+
+def sitemap_exists(path):
+    """True if the sitemap at `path` exists in any form (plain or gzip)."""
+    return bool(existing_shards(path))
+
+
+def read_sitemap(path):
+    """Text of one sitemap file, decompressing .gz files."""
+    data = Path(path).read_bytes()
+    if str(path).endswith('.gz'):
+        data = gzip.decompress(data)
+    return data.decode('utf-8')
+
+
+def generate_sitemap_index(sitemaps):
+    """Sitemap index XML for a list of (url, lastmod) pairs."""
+    xml_lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+        ''
+    ]
+
+    for loc, lastmod in sitemaps:
+        xml_lines.append('  <sitemap>')
+        xml_lines.append(f'    <loc>{loc}</loc>')
+        xml_lines.append(f'    <lastmod>{lastmod}</lastmod>')
+        xml_lines.append('  </sitemap>')
+        xml_lines.append('')
+
+    xml_lines.append('</sitemapindex>')
+
+    return '\n'.join(xml_lines)
+
+
+def update_sitemap_index(web_root, locales=LOCALES, today=None, base_url=BASE_URL, writer=None):
+    """Regenerate web/sitemap.xml over every shard of every locale sitemap.
+
+    Each shard is listed with the newest <lastmod> it contains. Returns True if written.
+    """
+    web_root = Path(web_root)
+    sitemaps = []
+    for locale in locales:
+        for path in existing_shards(web_root / f'sitemap-{locale}.xml'):
+            stamps = LASTMOD_PATTERN.findall(read_sitemap(path))
+            sitemaps.append((f'{base_url}/{path.name}', max(stamps, default=None) or today))
+    writer = writer or OutputWriter()
+    return writer.write(web_root / 'sitemap.xml', generate_sitemap_index(sitemaps))
@@ -0,0 +1,255 @@
+"""
+Static JSON mirror of the public product queries.
+The browser scripts used to ask the CMS for the same read-only lists on every
+page view. The product sync now publishes them from the listing snapshot
+(product_listing.py) as JSON shards under web/api/v1/, served by the Pages CDN:
+
+    manifest.json                  {"shards": {name: {"hash", "total"}}}
+    categories/<slug>.json         products of a category, newest first
+    subcategories/<slug>.json      products of a subcategory, newest first
+    featured.json                  featured products (the newest ones if none are featured)
+    latest.json                    the newest products
+    sitemap.json                   category > subcategory > product tree
+    facets/<scope>/<slug>.json     facet index of a category or subcategory shard
+    search/<locale>/...            search index (see search_index.py)
+    compat/<brand>.json            machine model -> compatible products (see compatibility_index.py)
+
+Product shards are {"version", "total", "products"} with products shaped like
+the items of /api/products. Clients read the manifest first and request a
+shard with ?v=<hash>, so a shard URL changes whenever its content does.
+
+A facet index holds, for every value of the sidebar filters (volume, excavator
+class, width, attachment), a bitset of the matching product ordinals (their
+positions in the product shard) and its count. Bitsets are base64 bytes, bit
+n of byte n >> 3 set for ordinal n, so any filter combination is a few
+bitwise ORs (within a filter) and ANDs (across filters) in the browser.
+
+Usage:
+    from static_api import shard_names, write_static_api
+
+    write_static_api(listing, writer)
+    write_static_api(listing, writer, shard_names(listing.changed_cards()))   # only the shards listing these cards
+
+    python scripts/static_api.py   # republish from product_listing.json, e.g. after a new blog post
+"""
+
+import json
+from base64 import b64encode
+from pathlib import Path
+
+from catalog_data import CATEGORIES, SUBCATEGORIES
+from compatibility_index import build_compatibility_shards
+from output_writer import OutputWriter
+from product_listing import ProductListing, newest_first
+from search_index import build_search_shards
+from sync_state import content_hash
+
+WEB_ROOT = Path(__file__).parent.parent / 'web'
+API_VERSION = 1
+STATIC_API_DIR = WEB_ROOT / 'api' / f'v{API_VERSION}'
+LATEST_SIZE = 50
+FEATURED_SIZE = 12
+# Excavator class checkbox value (kg) -> tonnage range, as labelled in the sidebar
+TONNAGE_BUCKETS = {1500: (1, 3), 4000: (3, 8), 12000: (8, 15), 20000: (15, 25), 30000: (25, 50)}
+
+
+def api_product(card):
+    """A listing card in the shape of an /api/products item; descriptions only feed the search index."""
+    product = {field: value for field, value in card.items() if field not in ('image', 'description')}
+    product['cloudinary_images'] = [{'url': card['image']}] if card.get('image') else []
+    if 'stock' not in product and 'stock_quantity' in product:
+        product['stock'] = product['stock_quantity']
+    return product
+
+
+def product_shard(cards):
+    return {'version': API_VERSION, 'total': len(cards), 'products': [api_product(card) for card in cards]}
+
+
+def get_title(slug, cards, field, known):
+    """Title of a (sub)category: the CMS title on its products, else catalog_data.py, else the slug."""
+    for card in cards:
+        if card.get(field):
+            return card[field]
+    return known.get(slug, {}).get('title', slug)
+
+
+def sitemap_tree(cards):
+    """Categories in catalog_data.py order (then any others), each with its subcategories and products."""
+    by_category = {}
+    for card in cards:
+        by_category.setdefault(card['category_slug'], []).append(card)
+    order = [slug for slug in CATEGORIES if slug in by_category]
+    order += sorted(slug for slug in by_category if slug not in CATEGORIES)
+
+    categories = []
+    for category_slug in order:
+        category_cards = by_category[category_slug]
+        by_subcategory = {}
+        for card in category_cards:
+            by_subcategory.setdefault(card.get('subcategory_slug'), []).append(card)
+        known_order = CATEGORIES.get(category_slug, {}).get('subcategories', [])
+        subcategory_order = [slug for slug in known_order if slug in by_subcategory]
+        subcategory_order += sorted(slug for slug in by_subcategory if slug and slug not in known_order)
+
+        categories.append({
+            'slug': category_slug,
+            'title': get_title(category_slug, category_cards, 'category_title', CATEGORIES),
+            'subcategories': [{
+                'slug': slug,
+                'title': get_title(slug, by_subcategory[slug], 'subcategory_title', SUBCATEGORIES),
+                'products': [tree_product(card) for card in by_subcategory[slug]],
+            } for slug in subcategory_order],
+            'products': [tree_product(card) for card in by_subcategory.get(None, [])],
+        })
+    return {'version': API_VERSION, 'categories': categories}
+
+
+def tree_product(card):
+    return {'id': card.get('id'), 'slug': card.get('slug'), 'title': card.get('title', '')}
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def facet_key(value):
+    """'300.0', 300.0 and 300 all index as '300'."""
+    number = to_float(value)
+    return str(int(number)) if number.is_integer() else str(number)
+
+
+def facet_values(card):
+    """(facet, value) pairs a card matches; like the CMS query, a product without a volume matches no volume range."""
+    if card.get('volume') not in (None, ''):
+        yield 'volume', facet_key(card['volume'])
+    if card.get('width'):
+        yield 'width', facet_key(card['width'])
+    if card.get('attachment_type'):
+        yield 'attachment', str(card['attachment_type'])
+    low, high = to_float(card.get('excavator_weight_min')), to_float(card.get('excavator_weight_max'))
+    for bucket, (bucket_low, bucket_high) in TONNAGE_BUCKETS.items():
+        if (low or high) and low <= bucket_high and high >= bucket_low:
+            yield 'excavator', str(bucket)
+
+
+def encode_bits(ordinals, size):
+    bits = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        bits[ordinal >> 3] |= 1 << (ordinal & 7)
+    return b64encode(bytes(bits)).decode('ascii')
+
+
+def facet_index(cards):
+    """Bitsets and counts per facet value over `cards`, in product shard order."""
+    facets = {'volume': {}, 'excavator': {}, 'width': {}, 'attachment': {}}
+    for ordinal, card in enumerate(cards):
+        for facet, value in facet_values(card):
+            facets[facet].setdefault(value, []).append(ordinal)
+    return {
+        'version': API_VERSION,
+        'size': len(cards),
+        'facets': {
+            facet: {value: {'bits': encode_bits(ordinals, len(cards)), 'count': len(ordinals)}
+                    for value, ordinals in sorted(values.items())}
+            for facet, values in facets.items()
+        },
+    }
+
+
+def shard_names(cards):
+    """Names of the product lists (and their facet indexes) that can hold any of `cards`."""
+    names = {'featured', 'latest'}
+    for card in cards:
+        scopes = [('categories', card['category_slug'])]
+        if card.get('subcategory_slug'):
+            scopes.append(('subcategories', card['subcategory_slug']))
+        for scope, slug in scopes:
+            names.update((f'{scope}/{slug}', f'facets/{scope}/{slug}'))
+    return names
+
+
+def build_shards(listing, names=None):
+    """{shard name: data} for every shard of the mirror, or only the product and facet shards `names`."""
+    cards = newest_first(listing.cards.values())
+    by_category, by_subcategory = {}, {}
+    for card in cards:
+        by_category.setdefault(card['category_slug'], []).append(card)
+        if card.get('subcategory_slug'):
+            by_subcategory.setdefault(card['subcategory_slug'], []).append(card)
+
+    def wanted(name):
+        return names is None or name in names
+
+    shards = {}
+    if wanted('featured'):
+        featured = [card for card in cards if card.get('is_featured')] or cards
+        shards['featured'] = product_shard(featured[:FEATURED_SIZE])
+    if wanted('latest'):
+        shards['latest'] = product_shard(cards[:LATEST_SIZE])
+    for scope, groups in (('categories', by_category), ('subcategories', by_subcategory)):
+        for slug, group in groups.items():
+            if wanted(f'{scope}/{slug}'):
+                shards[f'{scope}/{slug}'] = product_shard(group)
+            if wanted(f'facets/{scope}/{slug}'):
+                shards[f'facets/{scope}/{slug}'] = facet_index(group)
+    if names is None:
+        # Catalog-wide indexes
+        shards['sitemap'] = sitemap_tree(sorted(cards, key=lambda card: card.get('title', '')))
+        shards.update(build_search_shards(listing))
+        shards.update(build_compatibility_shards(listing))
+    return shards
+
+
+def load_manifest(api_dir=STATIC_API_DIR):
+    try:
+        return json.loads((Path(api_dir) / 'manifest.json').read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_static_api(listing, writer, names=None, api_dir=STATIC_API_DIR):
+    """Write the shards and manifest, removing shards of (sub)categories that emptied out.
+
+    With `names` (see shard_names) only those shards are rewritten and the rest of the
+    manifest is kept; the catalog-wide indexes then wait for the next full publish.
+    """
+    api_dir = Path(api_dir)
+    shards = build_shards(listing, names)
+    previous = load_manifest(api_dir).get('shards', {})
+    manifest = {'version': API_VERSION, 'shards': {} if names is None else dict(previous)}
+    for name, data in sorted(shards.items()):
+        content = json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n'
+        writer.write(api_dir / f'{name}.json', content)
+        entry = {'hash': content_hash(data)[:12]}
+        if 'total' in data:
+            entry['total'] = data['total']
+        manifest['shards'][name] = entry
+
+    stale = set(previous) - set(shards)
+    if names is not None:
+        stale &= set(names)
+    for name in stale:
+        writer.remove(api_dir / f'{name}.json')
+        manifest['shards'].pop(name, None)
+    manifest['shards'] = dict(sorted(manifest['shards'].items()))
+    writer.write(api_dir / 'manifest.json', json.dumps(manifest, indent=1, ensure_ascii=False) + '\n')
+    return manifest
+
+
+def main():
+    print("🚀 Structon Static API")
+    print("=" * 50)
+
+    listing = ProductListing.load()
+    print(f"📦 Listing snapshot: {len(listing.cards)} products")
+    writer = OutputWriter()
+    manifest = write_static_api(listing, writer)
+    print(f"\n🎉 Done! {len(manifest['shards'])} shards, {writer.summary()}.")
+
+
+if __name__ == '__main__':
+    main()
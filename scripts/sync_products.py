@@ -4,23 +4,65 @@ Structon Product Sync Script
 Fetches all products from CMS API and generates static product detail pages.
 
 Usage:
-    python scripts/sync_products.py
+    python scripts/sync_products.py [--fetch-concurrency N] [--jobs N] [--full] [--stage]
+    python scripts/sync_products.py --delta
+    python scripts/sync_products.py --product <slug|id>
 
 This script can be run manually or via GitHub Actions on every push.
+Only products whose CMS data (or the page template) changed since the last
+run are re-rendered; see scripts/sync_state.json. Every sync also updates the
+listing snapshot (scripts/product_listing.json), re-renders the category
+pages whose product cards changed, bakes the related products into the
+product pages (see related_products.py) and publishes the static JSON API
+under web/api/ (see static_api.py). With --product only that product's
+pages and sitemap entries, the category pages and related products of its
+category and the static API product lists holding it are refreshed (e.g. from
+a CMS save hook); the search, compatibility and sitemap shards follow on the
+next full or delta sync.
+With --delta only products updated since the last run are fetched; run a full
+sync now and then, since category renames do not bump product timestamps.
 """
 
 import os
 import json
-import urllib.request
+import inspect
+import argparse
+import subprocess
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import date
+from functools import lru_cache
+from urllib.parse import urlencode
+
+import generate_catalog_pages
+import product_templates
+import site_layout
+import template_engine
+from http_client import get_json, HTTPError
+from output_writer import OutputWriter
+from product_listing import ProductListing, LISTING_PATH, card_path
+from related_products import bake_related_products
+from sitemap_store import (
+    SitemapStore, LastmodLedger, url_entry, file_hash, page_file, sitemap_exists, update_sitemap_index,
+)
+from static_api import shard_names, write_static_api
+from sync_state import SyncState, content_hash, template_version, product_key
 
 # Configuration
 API_BASE = 'https://structon-production.up.railway.app/api'
-WEB_ROOT = Path(__file__).parent.parent / 'web'
+REPO_ROOT = Path(__file__).parent.parent
+WEB_ROOT = REPO_ROOT / 'web'
+SYNC_STATE_PATH = Path(__file__).parent / 'sync_state.json'
+SITEMAP_LEDGER_PATH = Path(__file__).parent / 'sitemap_ledger.json'
 LOCALES = ['be-nl', 'nl-nl', 'be-fr', 'de-de']
 BASE_URL = 'https://structon.be'
 TODAY = date.today().isoformat()
+PAGE_SIZE = 100
+FETCH_CONCURRENCY = 4
+RENDER_JOBS = 1
+RENDER_SHARD_SIZE = 25
 
 # Locale-specific labels
 LABELS = {
@@ -31,38 +73,156 @@ LABELS = {
 }
 
 
-def fetch_all_products():
-    """Fetch all products from CMS API."""
-    products = []
-    offset = 0
-    limit = 100
+def fetch_products_page(offset, limit=PAGE_SIZE, params=None):
+    """Fetch a single page of products from CMS API."""
+    query = urlencode({'limit': limit, 'offset': offset, **(params or {})})
+    url = f"{API_BASE}/products?{query}"
+    print(f"  Fetching: {url}")
+    return get_json(url)
+
+
+def fetch_product(product_id):
+    """Fetch a single product by id or slug. Returns None if it does not exist."""
+    url = f"{API_BASE}/products/{product_id}"
+    print(f"  Fetching: {url}")
+    try:
+        return get_json(url).get('product')
+    except HTTPError as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+def fetch_active_ids():
+    """Fetch the ids of all active products (cheap deletion check)."""
+    url = f"{API_BASE}/products/ids"
+    print(f"  Fetching: {url}")
+    return set(get_json(url).get('ids', []))
+
+
+class CatalogStream:
+    """Iterate over every product matching `params`, one page at a time.
     
-    while True:
-        url = f"{API_BASE}/products?limit={limit}&offset={offset}"
-        print(f"  Fetching: {url}")
-        
+    The first page tells us the catalog `total`; after that at most
+    `concurrency` pages are in flight, so memory stays bounded however
+    large the catalog is. Products are yielded in catalog order. After
+    iterating, `complete` is False if a page failed and only a prefix was
+    yielded, and `newest` is the highest `updated_at` seen.
+    """
+    
+    def __init__(self, concurrency=FETCH_CONCURRENCY, params=None):
+        self.concurrency = max(1, concurrency)
+        self.params = params
+        self.complete = False
+        self.count = 0
+        self.newest = None
+    
+    def fetch_page(self, offset):
+        return fetch_products_page(offset, params=self.params).get('products', [])
+    
+    def pages(self):
         try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                data = json.loads(response.read().decode())
-                batch = data.get('products', [])
-                
-                if not batch:
-                    break
-                    
-                products.extend(batch)
-                offset += limit
-                
-                if len(batch) < limit:
-                    break
+            data = fetch_products_page(0, params=self.params)
         except Exception as e:
             print(f"  ❌ Error fetching products: {e}")
-            break
+            return
+        
+        batch = data.get('products', [])
+        total = data.get('total')
+        yield batch
+        
+        if total is None:
+            # Older API without a total: walk the pages one at a time
+            offset = len(batch)
+            while len(batch) == PAGE_SIZE:
+                try:
+                    batch = self.fetch_page(offset)
+                except Exception as e:
+                    print(f"  ❌ Error fetching products: {e}")
+                    return
+                if not batch:
+                    break
+                yield batch
+                offset += PAGE_SIZE
+            self.complete = True
+            return
+        
+        offsets = iter(range(PAGE_SIZE, int(total), PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending = deque(pool.submit(self.fetch_page, offset) for offset in islice(offsets, self.concurrency))
+            while pending:
+                try:
+                    batch = pending.popleft().result()
+                except Exception as e:
+                    print(f"  ❌ Error fetching products: {e}")
+                    for future in pending:
+                        future.cancel()
+                    return
+                offset = next(offsets, None)
+                if offset is not None:
+                    pending.append(pool.submit(self.fetch_page, offset))
+                yield batch
+        self.complete = True
     
+    def __iter__(self):
+        for batch in self.pages():
+            for product in batch:
+                self.count += 1
+                stamp = product.get('updated_at')
+                if stamp and (self.newest is None or stamp > self.newest):
+                    self.newest = stamp
+                yield product
+
+
+class ChangedStream(CatalogStream):
+    """Iterate over the products updated after `since`, oldest change first.
+    
+    Pages follow each other by key instead of by offset: each page asks for
+    the products after the (updated_at, id) of the previous page's last one.
+    A product edited during the walk moves to the end of the order; with
+    offsets the rows behind it would shift down and one of them be skipped,
+    while a keyset walk just meets the edited product again at the end.
+    Pages are fetched one at a time, as each depends on the previous one.
+    """
+    
+    def __init__(self, since):
+        super().__init__(1, {'updated_since': since, 'sort': 'updated_asc'})
+    
+    def pages(self):
+        params = self.params
+        while True:
+            try:
+                batch = fetch_products_page(0, params=params).get('products', [])
+            except Exception as e:
+                print(f"  ❌ Error fetching products: {e}")
+                return
+            if batch:
+                yield batch
+            if len(batch) < PAGE_SIZE:
+                break
+            last = batch[-1]
+            if params.get('after_id') == last['id'] and params['updated_since'] == last['updated_at']:
+                print("  ❌ Error fetching products: the API ignores after_id")
+                return
+            params = {**self.params, 'updated_since': last['updated_at'], 'after_id': last['id']}
+        self.complete = True
+
+
+def fetch_catalog(concurrency=FETCH_CONCURRENCY, params=None):
+    """Fetch every product matching `params` into a list. Returns (products, complete)."""
+    stream = CatalogStream(concurrency, params)
+    products = list(stream)
+    return products, stream.complete
+
+
+def fetch_all_products(concurrency=FETCH_CONCURRENCY):
+    """Fetch all products from CMS API."""
+    products, _ = fetch_catalog(concurrency)
     return products
 
 
-def get_hreflang_tags(locale, path_suffix):
-    """Generate hreflang tags."""
+def get_hreflang_tags(path_suffix):
+    """Generate hreflang tags (the same for every locale of a page)."""
     tags = []
     locale_map = {'be-nl': 'nl-BE', 'nl-nl': 'nl-NL', 'be-fr': 'fr-BE', 'de-de': 'de-DE'}
     for loc in LOCALES:
@@ -94,10 +254,65 @@ def generate_key_specs_html(product, labels):
     return html
 
 
-def generate_product_page(product, locale):
-    """Generate HTML for a product detail page."""
+def get_page_depth(nested):
+    """Folder depth of a product page below its locale folder."""
+    return 4 if nested else 3
+
+
+@lru_cache(maxsize=None)
+def get_page_templates(locale, nested):
+    """Templates with every locale- and depth-dependent slot already bound.
+    
+    `nested` is True for products inside a subcategory (one level deeper).
+    Compiled once per (locale, depth) and reused for every product.
+    """
     labels = LABELS[locale]
+    if nested:
+        assets_prefix = '../../../../../assets'
+        breadcrumb = product_templates.BREADCRUMB_SUBCATEGORY.bind(
+            home_link='../../../../index.html', products_link='../../../index.html',
+            category_link='../../', subcategory_link='../',
+            home_label=labels['home'], products_label=labels['products'],
+        )
+    else:
+        assets_prefix = '../../../../assets'
+        breadcrumb = product_templates.BREADCRUMB_CATEGORY.bind(
+            home_link='../../../index.html', products_link='../../index.html',
+            category_link='../',
+            home_label=labels['home'], products_label=labels['products'],
+        )
+    page = product_templates.PRODUCT_PAGE.bind(
+        lang=locale.replace('-', '_'),
+        meta_suffix=labels['meta_suffix'],
+        assets_prefix=assets_prefix,
+        details_section=product_templates.DETAILS_SECTION,
+        site_footer=site_layout.render_footer(locale, get_page_depth(nested)),
+    )
+    return {
+        'page': page,
+        'breadcrumb': breadcrumb,
+        'info': product_templates.INFO_SECTION.bind(add_to_quote=labels['add_to_quote']),
+        'sticky_cta': product_templates.STICKY_CTA.bind(add_to_quote=labels['add_to_quote']),
+    }
+
+
+def get_label_groups(locales=LOCALES):
+    """Map each locale to the first locale with identical labels.
     
+    Label-dependent fragments are rendered once per group, so locales that
+    share their labels (be-nl and nl-nl) share that work too.
+    """
+    groups = {}
+    for locale in locales:
+        groups[locale] = next(other for other in locales if LABELS[other] == LABELS[locale])
+    return groups
+
+
+LABEL_GROUPS = get_label_groups()
+
+
+def get_product_fragments(product):
+    """Locale-independent parts of a product page, computed once per product."""
     title = product.get('title', 'Product')
     slug = product.get('slug', '')
     description = product.get('description', '')
@@ -117,120 +332,26 @@ def generate_product_page(product, locale):
     attachment = product.get('attachment_type', '')
     excavator_min = product.get('excavator_weight_min')
     excavator_max = product.get('excavator_weight_max')
-    stock = product.get('stock_quantity', 0)
     
     # Build path - product is at deepest level
     if subcategory_slug:
         path_suffix = f'producten/{category_slug}/{subcategory_slug}/{slug}/'
-        assets_prefix = '../../../../../assets'
-        home_link = '../../../../index.html'
-        products_link = '../../../index.html'
-        category_link = '../../'
-        subcategory_link = '../'
-        breadcrumb_html = f'''<a href="{home_link}">{labels['home']}</a><span>/</span>
-          <a href="{products_link}">{labels['products']}</a><span>/</span>
-          <a href="{category_link}">{category_title}</a><span>/</span>
-          <a href="{subcategory_link}">{subcategory_title}</a><span>/</span>
-          <span aria-current="page">{title}</span>'''
     else:
         path_suffix = f'producten/{category_slug}/{slug}/'
-        assets_prefix = '../../../../assets'
-        home_link = '../../../index.html'
-        products_link = '../../index.html'
-        category_link = '../'
-        breadcrumb_html = f'''<a href="{home_link}">{labels['home']}</a><span>/</span>
-          <a href="{products_link}">{labels['products']}</a><span>/</span>
-          <a href="{category_link}">{category_title}</a><span>/</span>
-          <span aria-current="page">{title}</span>'''
-    
-    hreflang_tags = get_hreflang_tags(locale, path_suffix)
-    canonical = f'  <link rel="canonical" href="{BASE_URL}/{locale}/{path_suffix}">'
-    
-    # Meta description
-    meta_desc = product.get('seo_description') or description[:155] or f'{title} - Professionele kraanbak van Structon'
-    
-    # Specs HTML - Grid format
-    specs_items = []
-    if width:
-        specs_items.append(f'''<div class="spec-item">
-                <div class="spec-label">{labels["width"]}</div>
-                <div class="spec-value">{width} mm</div>
-              </div>''')
-    if volume:
-        specs_items.append(f'''<div class="spec-item">
-                <div class="spec-label">{labels["volume"]}</div>
-                <div class="spec-value">{volume} L</div>
-              </div>''')
-    if weight:
-        specs_items.append(f'''<div class="spec-item">
-                <div class="spec-label">{labels["weight"]}</div>
-                <div class="spec-value">{weight} kg</div>
-              </div>''')
-    if attachment:
-        specs_items.append(f'''<div class="spec-item">
-                <div class="spec-label">{labels["attachment"]}</div>
-                <div class="spec-value">{attachment}</div>
-              </div>''')
-    if excavator_min and excavator_max:
-        specs_items.append(f'''<div class="spec-item">
-                <div class="spec-label">{labels["excavator"]}</div>
-                <div class="spec-value">{excavator_min} - {excavator_max} ton</div>
-              </div>''')
-    specs_html = '\n              '.join(specs_items)
     
-    # Build specifications table rows
-    specs_table_rows = []
+    # Specification table rows as (labels key or literal label, value)
+    spec_rows = []
     if width:
-        specs_table_rows.append(f'''<tr>
-                  <th>{labels["width"]}</th>
-                  <td>{width} mm</td>
-                </tr>''')
+        spec_rows.append(('width', f'{width} mm'))
     if volume:
-        specs_table_rows.append(f'''<tr>
-                  <th>{labels["volume"]}</th>
-                  <td>{volume} L</td>
-                </tr>''')
+        spec_rows.append(('volume', f'{volume} L'))
     if weight:
-        specs_table_rows.append(f'''<tr>
-                  <th>{labels["weight"]}</th>
-                  <td>{weight} kg</td>
-                </tr>''')
+        spec_rows.append(('weight', f'{weight} kg'))
     if attachment:
-        specs_table_rows.append(f'''<tr>
-                  <th>{labels["attachment"]}</th>
-                  <td>{attachment}</td>
-                </tr>''')
+        spec_rows.append(('attachment', attachment))
     if excavator_min and excavator_max:
-        specs_table_rows.append(f'''<tr>
-                  <th>Graafmachine klasse</th>
-                  <td>{excavator_min} - {excavator_max} ton</td>
-                </tr>''')
-    
-    # Add standard rows
-    specs_table_rows.append('''<tr>
-                  <th>Materiaal</th>
-                  <td>Hardox 450 staal</td>
-                </tr>''')
-    specs_table_rows.append('''<tr>
-                  <th>Productie</th>
-                  <td>Op maat gemaakt in België</td>
-                </tr>''')
-    specs_table_rows.append('''<tr>
-                  <th>Levertijd</th>
-                  <td>2-3 weken</td>
-                </tr>''')
-    specs_table_rows.append('''<tr>
-                  <th>Garantie</th>
-                  <td>12 maanden fabrieksgarantie</td>
-                </tr>''')
-    
-    specs_table_html = '\n                '.join(specs_table_rows)
-    
-    # Stock status
-    stock_class = 'in-stock' if stock > 0 else 'out-of-stock'
-    stock_text = labels['stock'] if stock > 0 else labels['out_of_stock']
+        spec_rows.append((None, f'{excavator_min} - {excavator_max} ton'))
     
-    # Prepare cart data for add-to-quote button
     # Prepare cart data for add-to-quote button
     cart_data = {
         'id': product.get('id', ''),
@@ -254,331 +375,481 @@ def generate_product_page(product, locale):
     if excavator_min and excavator_max:
         cart_data['specs']['excavator'] = f"{excavator_min}-{excavator_max}t"
     
+    return {
+        'title': title,
+        'title_upper': title.upper(),
+        'description': description,
+        'category_title': category_title,
+        'subcategory_title': subcategory_title,
+        'nested': bool(subcategory_slug),
+        'path_suffix': path_suffix,
+        'hreflang_tags': get_hreflang_tags(path_suffix),
+        'meta_desc': product.get('seo_description') or description[:155] or f'{title} - Professionele kraanbak van Structon',
+        'in_stock': product.get('stock_quantity', 0) > 0,
+        'spec_rows': spec_rows,
+        'product_id': cart_data['id'],
+        'cart_data_json_attr': json.dumps(cart_data).replace('"', '&quot;'),
+        'gallery_section': product_templates.GALLERY_SECTION.render(image_url=image_url, title=title),
+    }
+
+
+def get_labelled_fragments(product, fragments, locale):
+    """Parts of a product page that depend on the locale's labels only."""
+    labels = LABELS[locale]
+    templates = get_page_templates(locale, fragments['nested'])
+    
+    breadcrumb_html = templates['breadcrumb'].render(
+        category_title=fragments['category_title'],
+        subcategory_title=fragments['subcategory_title'],
+        title=fragments['title'],
+    )
+    
+    # Build specifications table rows
+    row = product_templates.SPECS_TABLE_ROW
+    specs_table_rows = [
+        row.render(label=labels[key] if key else 'Graafmachine klasse', value=value)
+        for key, value in fragments['spec_rows']
+    ]
+    specs_table_rows.extend(product_templates.STANDARD_SPEC_ROWS)
+    specs_table_html = '\n                '.join(specs_table_rows)
+    
+    # Stock status
+    stock_class = 'in-stock' if fragments['in_stock'] else 'out-of-stock'
+    stock_text = labels['stock'] if fragments['in_stock'] else labels['out_of_stock']
+    
+    info_section = templates['info'].render(
+        category_title=fragments['category_title'],
+        subcategory_title=fragments['subcategory_title'],
+        title_upper=fragments['title_upper'],
+        description=fragments['description'],
+        key_specs_html=generate_key_specs_html(product, labels),
+        product_id=fragments['product_id'],
+        stock_class=stock_class,
+        stock_text=stock_text,
+        cart_data_json_attr=fragments['cart_data_json_attr'],
+    )
+    
+    return {
+        'breadcrumb_html': breadcrumb_html,
+        'info_section': info_section,
+        'specs_section': product_templates.SPECS_SECTION.render(specs_table_html=specs_table_html),
+        'sticky_cta': templates['sticky_cta'].render(cart_data_json_attr=fragments['cart_data_json_attr']),
+    }
+
+
+def generate_product_pages(product, locales=LOCALES):
+    """Generate the HTML of a product detail page for each locale. Returns {locale: html}.
+    
+    Locale-independent fragments are built once per product and label-dependent
+    ones once per group of locales with identical labels.
+    """
+    fragments = get_product_fragments(product)
+    labelled = {}
+    pages = {}
+    for locale in locales:
+        group = LABEL_GROUPS[locale]
+        if group not in labelled:
+            labelled[group] = get_labelled_fragments(product, fragments, group)
+        
+        pages[locale] = get_page_templates(locale, fragments['nested'])['page'].render(
+            meta_desc=fragments['meta_desc'],
+            title=fragments['title'],
+            canonical=f'  <link rel="canonical" href="{BASE_URL}/{locale}/{fragments["path_suffix"]}">',
+            hreflang_tags=fragments['hreflang_tags'],
+            title_upper=fragments['title_upper'],
+            gallery_section=fragments['gallery_section'],
+            site_header=site_layout.render_header(locale, get_page_depth(fragments['nested']), fragments['path_suffix']),
+            **labelled[group],
+        )
+    return pages
+
+
+def generate_product_page(product, locale):
+    """Generate HTML for a product detail page."""
+    return generate_product_pages(product, [locale])[locale]
+
 
-    # Prepare data for new template structure
-    key_specs_html = generate_key_specs_html(product, labels)
-    
-    import json
-    cart_data_json_attr = json.dumps(cart_data).replace('"', '&quot;')
-    
-    # Gallery
-    gallery_section = f'''
-          <div class="product-gallery animate-on-scroll">
-            <div class="product-thumbnails">
-              <div class="product-thumbnail active" data-image="{image_url}">
-                <img src="{image_url}" alt="{title} - View 1">
-              </div>
-              <div class="product-thumbnail" data-image="{image_url}">
-                <img src="{image_url}" alt="{title} - View 2">
-              </div>
-              <div class="product-thumbnail" data-image="{image_url}">
-                <img src="{image_url}" alt="{title} - View 3">
-              </div>
-            </div>
-            <div class="product-image-main">
-              <img src="{image_url}" alt="{title}" id="main-product-image">
-            </div>
-          </div>'''
-
-    # Info Column
-    info_section = f'''
-          <div class="product-info-wrapper animate-on-scroll">
-            <div class="product-header">
-              <span class="product-category-label">{category_title} / {subcategory_title}</span>
-              <h1 class="product-title">{title.upper()}</h1>
-              <p class="product-subtitle">{description}</p>
-            </div>
-
-            <div class="product-key-specs">
-              {key_specs_html}
-            </div>
-
-            <div class="product-purchase-card">
-              <div class="product-price-container" id="product-price-container" data-product-id="{cart_data['id']}" style="display: none;">
-                <div class="product-price-label">Prijs:</div>
-                <div class="product-price" id="product-price">
-                  <span class="price-loading">Prijs laden...</span>
-                </div>
-                <div class="stock-status {stock_class}">{stock_text}</div>
-              </div>
-              
-              <div class="product-cta-section">
-                <div class="product-quantity-wrapper">
-                  <div class="quantity-selector">
-                    <button type="button" class="quantity-btn minus" onclick="var i=this.nextElementSibling;i.value=Math.max(1,parseInt(i.value||1)-1)">-</button>
-                    <input type="number" id="quantity" name="quantity" value="1" min="1" max="99">
-                    <button type="button" class="quantity-btn plus" onclick="var i=this.previousElementSibling;i.value=Math.min(99,parseInt(i.value||1)+1)">+</button>
-                  </div>
-                  
-                  <div class="product-actions">
-                    <button class="btn-split btn-split-primary" id="add-to-quote" data-product='{cart_data_json_attr}'>
-                      <span class="btn-split-text">{labels['add_to_quote']}</span>
-                      <span class="btn-split-icon">
-                        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg>
-                      </span>
-                    </button>
-                  </div>
-                </div>
-                
-                <ul class="product-usps">
-                  <li>Voor 15:00 besteld, morgen verzonden</li>
-                  <li>Gratis verzending vanaf €500</li>
-                  <li>Geproduceerd in België (Hardox staal)</li>
-                </ul>
-              </div>
-            </div>
-
-            <div class="expert-box-sidebar">
-              <div class="expert-header">
-                <div class="expert-avatar">
-                  <svg width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                    <path d="M20 21v-2a4 4 0 0 0-4-4H8a4 4 0 0 0-4 4v2"></path>
-                    <circle cx="12" cy="7" r="4"></circle>
-                  </svg>
-                </div>
-                <div>
-                  <span class="expert-title">Hulp nodig bij uw keuze?</span>
-                  <span class="expert-subtitle">Onze experts helpen u graag verder.</span>
-                </div>
-              </div>
-              <a href="tel:+32469702138" class="expert-contact">
-                <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                  <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path>
-                </svg>
-                +32 469 70 21 38
-              </a>
-            </div>
-          </div>'''
-    
-    # Extra Sections
-    details_section = '''
-    <section class="section product-details-section fade-in">
-      <div class="container">
-        <div class="product-details-layout">
-          <div class="product-detail-card">
-            <div class="detail-card-icon">
-              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect><line x1="9" y1="9" x2="15" y2="9"></line><line x1="9" y1="15" x2="15" y2="15"></line></svg>
-            </div>
-            <h3>Technische Specificaties</h3>
-            <p>Alle kraanbakken worden vervaardigd uit hoogwaardig Hardox staal voor maximale sterkte en duurzaamheid. Perfect afgestemd op uw graafmachine.</p>
-          </div>
-          <div class="product-detail-card">
-            <div class="detail-card-icon">
-              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path><polyline points="3.27 6.96 12 12.01 20.73 6.96"></polyline><line x1="12" y1="22.08" x2="12" y2="12"></line></svg>
-            </div>
-            <h3>Op Maat Gemaakt</h3>
-            <p>Elke kraanbak wordt op maat geproduceerd in onze werkplaats in Beernem, België. Kwaliteit en precisie gegarandeerd.</p>
-          </div>
-          <div class="product-detail-card">
-            <div class="detail-card-icon">
-              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"></circle><polyline points="12 6 12 12 16 14"></polyline></svg>
-            </div>
-            <h3>Snelle Levering</h3>
-            <p>Afhalen in Beernem of levering op locatie. Neem contact op voor levertijden en mogelijkheden.</p>
-          </div>
-        </div>
-      </div>
-    </section>'''
-
-    specs_section = f'''
-    <section class="section specifications-section">
-      <div class="container">
-        <div class="specifications-content">
-          <div class="specifications-description">
-            <h2 class="specifications-title">PRODUCTBESCHRIJVING</h2>
-            <p>Deze hoogwaardige kraanbak is speciaal ontworpen voor professionele graafwerkzaamheden. De robuuste constructie en doordachte vorm maken deze bak ideaal voor diverse toepassingen in de grond-, weg- en waterbouw.</p>
-            <p>Vervaardigd uit slijtvast Hardox staal voor maximale duurzaamheid en een lange levensduur, zelfs onder zware werkomstandigheden. De geoptimaliseerde geometrie zorgt voor uitstekende prestaties in verschillende grondsoorten.</p>
-          </div>
-          
-          <div class="specifications-table-wrapper">
-            <h3 class="specifications-subtitle">Technische Specificaties</h3>
-            <table class="specifications-table">
-              <tbody>
-                {specs_table_html}
-              </tbody>
-            </table>
-          </div>
-        </div>
-      </div>
-    </section>'''
-
-    sticky_cta = f'''
-    <div class="product-sticky-cta">
-      <button class="btn-split btn-split-primary" id="add-to-quote-sticky" data-product='{cart_data_json_attr}'>
-        <span class="btn-split-text">{labels['add_to_quote']}</span>
-        <span class="btn-split-icon">
-          <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="5" y1="12" x2="19" y2="12"></line><polyline points="12 5 19 12 12 19"></polyline></svg>
-        </span>
-      </button>
-    </div>'''
-
-
-    return f'''<!DOCTYPE html>
-<html lang="{locale.replace('-', '_')}">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <meta name="description" content="{meta_desc}">
-  <title>{title} {labels['meta_suffix']}</title>
-  <link rel="preload" href="{assets_prefix}/css/fonts.css" as="style">
-  <link rel="stylesheet" href="{assets_prefix}/css/fonts.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/global.css?v=8">
-  <link rel="stylesheet" href="{assets_prefix}/css/components/mega-menu.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/components/quote-cart.css">
-  <link rel="stylesheet" href="{assets_prefix}/css/pages/product.css">
-  <link rel="icon" type="image/svg+xml" href="{assets_prefix}/images/static/favicon.svg">
-{canonical}
-{hreflang_tags}
-</head>
-<body>
-  <div id="header-placeholder"></div>
-  <main style="padding-top: 0;">
-    <section class="page-hero" style="padding-top: var(--space-8);">
-      <div class="container">
-        <nav class="breadcrumb" aria-label="Kruimelpad">
-          {breadcrumb_html}
-        </nav>
-        <h1 class="hero-title">{title.upper()}</h1>
-      </div>
-    </section>
-    
-    <!-- Product Main Section -->
-    <section class="section product-section">
-      <div class="container">
-        <div class="product-layout">
-          {gallery_section}
-          {info_section}
-        </div>
-      </div>
-    </section>
-    
-    {details_section}
-    {specs_section}
-    {sticky_cta}
-    
-  </main>
-  <div id="footer-placeholder"></div>
-  <script src="{assets_prefix}/js/components/header-loader.js"></script>
-  <script src="{assets_prefix}/js/components/footer-loader.js"></script>
-  <script type="module" src="{assets_prefix}/js/main.js?v=2"></script>
-  <script src="{assets_prefix}/js/components/login-modal.js?v=2"></script>
-  <script src="{assets_prefix}/js/services/quote-cart-service.js"></script>
-  <script src="{assets_prefix}/js/components/quote-cart-ui.js"></script>
-  <script src="{assets_prefix}/js/components/product-price.js"></script>
-</body>
-</html>'''
-
-
-def sync_products():
-    """Main sync function."""
+# Changing the page template, labels or baked header/footer invalidates every rendered page
+TEMPLATE_VERSION = template_version(
+    [inspect.getsource(f) for f in (
+        get_hreflang_tags, generate_key_specs_html, get_page_depth, get_page_templates, get_product_fragments,
+        get_labelled_fragments, generate_product_pages,
+    )]
+    + [inspect.getsource(product_templates), inspect.getsource(template_engine), inspect.getsource(site_layout)],
+    LABELS, BASE_URL, LOCALES, site_layout.layout_version(),
+)
+
+
+def is_publishable(product):
+    """Active products with enough data to build a URL get a page."""
+    return product.get('is_active', True) and product.get('slug') and product.get('category_slug')
+
+
+def get_product_path(product):
+    """URL path of a product page, relative to the locale root (the same as its listing card's)."""
+    return card_path(product)
+
+
+def select_changed(products, state, seen, stats, listing, rendered):
+    """Normalize stage: yield the publishable products whose pages are out of date.
+    
+    Every publishable product's key and URL path is recorded in `seen`
+    (in catalog order) for pruning and the sitemaps, and its card in
+    `listing`; the keys of the yielded products go to `rendered`. The
+    product dicts themselves are not kept.
+    """
+    for product in products:
+        if not is_publishable(product):
+            continue
+        key = product_key(product)
+        path = get_product_path(product)
+        seen[key] = path
+        listing.record(key, product)
+        digest = content_hash(product)
+        if state.is_current(key, digest, WEB_ROOT):
+            stats['unchanged'] += 1
+            continue
+        stats['changed'] += 1
+        rendered.append(key)
+        state.record(key, digest, [f'{locale}/{path}index.html' for locale in LOCALES])
+        yield product
+
+
+def write_product_pages(web_root, product, writer):
+    """Render and write every locale page of one product."""
+    path = get_product_path(product)
+    for locale, html in generate_product_pages(product).items():
+        writer.write(Path(web_root) / locale / path / 'index.html', html)
+
+
+def render_shard(web_root, products):
+    """Render and write every locale page of a batch of products. Runs inside a worker process."""
+    writer = OutputWriter()
+    for product in products:
+        write_product_pages(web_root, product, writer)
+    return [str(p) for p in writer.written], writer.skipped
+
+
+def iter_shards(items, size):
+    """Group an iterable into lists of at most `size` items."""
+    items = iter(items)
+    while True:
+        shard = list(islice(items, size))
+        if not shard:
+            return
+        yield shard
+
+
+def render_pages(products, jobs=RENDER_JOBS, writer=None):
+    """Render every locale page of each product as it streams in, over `jobs` processes."""
+    writer = writer or OutputWriter()
+    if jobs <= 1:
+        for product in products:
+            write_product_pages(WEB_ROOT, product, writer)
+        return writer
+    
+    # Keep a couple of shards per worker queued so the pool stays busy
+    # without buffering the whole catalog
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for shard in iter_shards(products, RENDER_SHARD_SIZE):
+            pending.append(pool.submit(render_shard, WEB_ROOT, shard))
+            if len(pending) >= jobs * 2:
+                writer.merge(*pending.popleft().result())
+        while pending:
+            writer.merge(*pending.popleft().result())
+    return writer
+
+
+def publish_listing(listing, rendered=(), catalog_wide=True):
+    """Save the listing snapshot and publish it: the category pages, the related products
+    of the product pages and the static JSON API.
+    
+    Runs after the product pages are rendered. The category pages and related products
+    of the categories with changed cards are rewritten, and the related products of the
+    freshly rendered pages of the products `rendered`. Without `catalog_wide` only the
+    static API shards listing a changed card are republished (the --product fast path);
+    the search, compatibility and sitemap shards then follow on the next full or delta sync.
+    Returns the files written or removed.
+    """
+    categories = listing.changed_categories()
+    names = None if catalog_wide else shard_names(listing.changed_cards())
+    changed = listing.save()
+    writer = OutputWriter()
+    print("\n📂 Publishing the product listing...")
+    if changed:
+        generate_catalog_pages.write_catalog_pages(writer, listing, verbose=False, categories=categories)
+    bake_related_products(listing, writer, categories, rendered)
+    write_static_api(listing, writer, names)
+    print(f"  ✅ Category pages, related products and static API: {writer.summary()}")
+    written = writer.written + writer.removed
+    if changed:
+        written.append(LISTING_PATH)
+    return written
+
+
+def stage_paths(paths):
+    """Stage the given files in git so the auto-commit only picks up real changes."""
+    paths = [str(p) for p in paths]
+    for i in range(0, len(paths), 500):
+        subprocess.run(['git', 'add', '--', *paths[i:i + 500]], cwd=REPO_ROOT, check=False)
+
+
+def sync_products(fetch_concurrency=FETCH_CONCURRENCY, full=False, stage=False, jobs=RENDER_JOBS):
+    """Main sync function: fetch → normalize → render → write → sitemaps, streamed per product.
+    
+    Returns False if no products were found or the catalog fetch was incomplete.
+    """
     print("🔄 Structon Product Sync")
     print("=" * 40)
     
-    # Fetch products
-    print("\n📥 Fetching products from CMS...")
-    products = fetch_all_products()
-    print(f"  Found {len(products)} products")
+    state = SyncState(SYNC_STATE_PATH, TEMPLATE_VERSION) if full else SyncState.load(SYNC_STATE_PATH, TEMPLATE_VERSION)
+    listing = ProductListing.load(LISTING_PATH)
+    stream = CatalogStream(fetch_concurrency)
+    seen = {}
+    rendered = []
+    stats = Counter()
+    
+    print(f"\n📥 Fetching and rendering products ({len(LOCALES)} locales, {jobs} jobs)...")
+    writer = render_pages(select_changed(stream, state, seen, stats, listing, rendered), jobs)
+    print(f"  Found {stream.count} products")
     
-    if not products:
+    if not stream.count:
         print("  ⚠️ No products found, exiting")
-        return
+        return False
+    print(f"  {stats['changed']} changed, {stats['unchanged']} unchanged")
     
-    # Generate pages
-    pages_created = 0
-    for locale in LOCALES:
-        print(f"\n📁 Processing locale: {locale}")
-        
-        for product in products:
-            if not product.get('is_active', True):
-                continue
-                
-            slug = product.get('slug')
-            category_slug = product.get('category_slug')
-            subcategory_slug = product.get('subcategory_slug')
-            
-            if not slug or not category_slug:
-                continue
-            
-            # Determine path
-            if subcategory_slug:
-                product_dir = WEB_ROOT / locale / 'producten' / category_slug / subcategory_slug / slug
-            else:
-                product_dir = WEB_ROOT / locale / 'producten' / category_slug / slug
-            
-            product_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Generate HTML
-            html = generate_product_page(product, locale)
-            (product_dir / 'index.html').write_text(html, encoding='utf-8')
-            pages_created += 1
-        
-        print(f"  ✅ Created {len([p for p in products if p.get('is_active', True)])} product pages")
+    if stream.complete:
+        state.prune(seen)
+        state.move_cursor(stream.newest)
+        listing.prune(seen)
+    written = list(writer.written)
+    if state.save():
+        written.append(SYNC_STATE_PATH)
     
-    print(f"\n🎉 Done! Created {pages_created} product pages total")
-    return products
+    written += publish_listing(listing, rendered)
+    if stream.complete:
+        # The product section is replaced wholesale, so only from the complete catalog
+        written += update_sitemaps_with_paths(seen.values())
+    else:
+        print("\n⚠️ Catalog fetch incomplete, sitemaps left unchanged")
+    if stage and written:
+        stage_paths(written)
+    
+    print(f"\n🎉 Done! Product pages: {writer.summary()}")
+    return stream.complete
 
 
-def update_sitemaps_with_products(products):
-    """Add product URLs to sitemaps."""
+def get_sitemap_url_entry(locale, path):
+    """Sitemap entry for a product page, with hreflang alternates."""
+    return url_entry(locale, path, TODAY, changefreq='weekly', priority='0.7', base_url=BASE_URL, locales=LOCALES)
+
+
+def get_sitemap_digest(locale, path):
+    """Content hash of a rendered product page, which drives its <lastmod>."""
+    return file_hash(page_file(WEB_ROOT, locale, path))
+
+
+def update_sitemaps_with_paths(paths):
+    """Sitemap sink: make the product section of each locale sitemap hold exactly `paths`.
+    
+    Returns the sitemap (and ledger) files written.
+    """
     print("\n🗺️ Updating sitemaps with product URLs...")
+    paths = list(paths)
     
+    writer = OutputWriter()
+    ledger = LastmodLedger.load(SITEMAP_LEDGER_PATH)
     for locale in LOCALES:
         sitemap_path = WEB_ROOT / f'sitemap-{locale}.xml'
-        if not sitemap_path.exists():
+        if not sitemap_exists(sitemap_path):
             continue
         
-        content = sitemap_path.read_text(encoding='utf-8')
-        
-        # Check if products section already exists
-        if '<!-- Product Pages -->' in content:
-            # Remove old product section
-            start = content.find('<!-- Product Pages -->')
-            end = content.find('</urlset>')
-            content = content[:start] + '</urlset>'
-        
-        # Generate product URLs
-        product_urls = ['\n  <!-- Product Pages -->']
-        locale_map = {'be-nl': 'nl-BE', 'nl-nl': 'nl-NL', 'be-fr': 'fr-BE', 'de-de': 'de-DE'}
-        
-        for product in products:
-            if not product.get('is_active', True):
-                continue
-            
-            slug = product.get('slug')
-            category_slug = product.get('category_slug')
-            subcategory_slug = product.get('subcategory_slug')
-            
-            if not slug or not category_slug:
-                continue
-            
-            if subcategory_slug:
-                path = f'producten/{category_slug}/{subcategory_slug}/{slug}/'
-            else:
-                path = f'producten/{category_slug}/{slug}/'
-            
-            loc = f'{BASE_URL}/{locale}/{path}'
-            
-            hreflangs = []
-            for loc_code in LOCALES:
-                alt_url = f"{BASE_URL}/{loc_code}/{path}"
-                hreflangs.append(f'    <xhtml:link rel="alternate" hreflang="{locale_map[loc_code]}" href="{alt_url}"/>')
-            hreflangs.append(f'    <xhtml:link rel="alternate" hreflang="x-default" href="{BASE_URL}/be-nl/{path}"/>')
-            
-            product_urls.append(f'''  <url>
-    <loc>{loc}</loc>
-    <lastmod>{TODAY}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.7</priority>
-{chr(10).join(hreflangs)}
-  </url>''')
-        
-        # Insert before </urlset>
-        new_content = content.replace('</urlset>', '\n'.join(product_urls) + '\n</urlset>')
-        sitemap_path.write_text(new_content, encoding='utf-8')
-        print(f"  ✅ Updated sitemap-{locale}.xml")
+        store = SitemapStore.load(sitemap_path, ledger)
+        changes = store.replace_section('products', (
+            (get_sitemap_url_entry(locale, path), get_sitemap_digest(locale, path)) for path in paths
+        ))
+        if store.save(writer):
+            print(f"  ✅ Updated sitemap-{locale}.xml ({changes} product URLs changed)")
+        else:
+            print(f"  ℹ️ sitemap-{locale}.xml unchanged")
+    update_sitemap_index(WEB_ROOT, LOCALES, TODAY, BASE_URL, writer)
+    
+    written = writer.written + writer.removed
+    if ledger.save():
+        written.append(SITEMAP_LEDGER_PATH)
+    return written
+
+
+def update_sitemaps_with_products(products):
+    """Add product URLs to sitemaps. Returns the sitemap files written."""
+    return update_sitemaps_with_paths(get_product_path(p) for p in products if is_publishable(p))
+
+
+def patch_sitemap_entries(locale, paths=(), remove_paths=(), writer=None, ledger=None):
+    """Upsert/remove product entries in a locale sitemap, leaving the rest untouched."""
+    sitemap_path = WEB_ROOT / f'sitemap-{locale}.xml'
+    if not sitemap_exists(sitemap_path):
+        return False
+    
+    store = SitemapStore.load(sitemap_path, ledger)
+    for old_path in remove_paths:
+        store.remove(f'{BASE_URL}/{locale}/{old_path}')
+    for path in paths:
+        store.upsert('products', get_sitemap_url_entry(locale, path), get_sitemap_digest(locale, path))
+    return store.save(writer)
+
+
+def entry_paths(entry):
+    """URL paths (relative to the locale root) recorded for a sync state entry."""
+    return {p.split('/', 1)[1][:-len('index.html')] for p in entry.get('paths', [])}
+
+
+def sync_single_product(product_id, stage=False):
+    """Refresh one product's locale pages and sitemap entries."""
+    print(f"🔄 Structon Product Sync: {product_id}")
+    
+    product = fetch_product(product_id)
+    if product is None:
+        print("  ❌ Product not found")
+        return False
+    
+    key = product_key(product)
+    state = SyncState.load(SYNC_STATE_PATH, TEMPLATE_VERSION)
+    listing = ProductListing.load(LISTING_PATH)
+    old_paths = entry_paths(state.products.get(key, {}))
+    
+    writer = OutputWriter()
+    path = None
+    if is_publishable(product):
+        path = get_product_path(product)
+        for locale, html in generate_product_pages(product).items():
+            writer.write(WEB_ROOT / locale / path / 'index.html', html)
+        state.record(key, content_hash(product), [f'{locale}/{path}index.html' for locale in LOCALES])
+        if listing:
+            listing.record(key, product)
+    else:
+        print("  ⚠️ Product is inactive, removing it from the sitemaps")
+        old_paths.add(get_product_path(product))
+        state.forget(key)
+        listing.forget(key)
+    
+    ledger = LastmodLedger.load(SITEMAP_LEDGER_PATH)
+    for locale in LOCALES:
+        patch_sitemap_entries(locale, [path] if path else [], old_paths - {path}, writer, ledger)
+    update_sitemap_index(WEB_ROOT, LOCALES, TODAY, BASE_URL, writer)
+    
+    written = writer.written + writer.removed
+    if state.save():
+        written.append(SYNC_STATE_PATH)
+    if ledger.save():
+        written.append(SITEMAP_LEDGER_PATH)
+    if listing:
+        # Only a full sync starts the listing snapshot
+        written += publish_listing(listing, [key] if path else [], catalog_wide=False)
+    if stage and written:
+        stage_paths(written)
+    
+    print(f"  ✅ {writer.summary()}")
+    return True
+
+
+def sync_products_delta(fetch_concurrency=FETCH_CONCURRENCY, stage=False, jobs=RENDER_JOBS):
+    """Fetch only products changed since the last sync's cursor and patch their pages and sitemap entries.
+    
+    Falls back to a full sync when there is no usable cursor (first run or template change).
+    """
+    print("🔄 Structon Product Sync (delta)")
+    print("=" * 40)
+    
+    state = SyncState.load(SYNC_STATE_PATH, TEMPLATE_VERSION)
+    listing = ProductListing.load(LISTING_PATH)
+    if not state.cursor or not state.products or not listing:
+        print("  ℹ️ No sync cursor or listing snapshot yet, running a full sync")
+        return sync_products(fetch_concurrency=fetch_concurrency, stage=stage, jobs=jobs)
+    
+    print(f"\n📥 Fetching products changed since {state.cursor}...")
+    try:
+        active_ids = fetch_active_ids()
+    except Exception as e:
+        print(f"  ❌ Error fetching product ids: {e}")
+        return False
+    stream = ChangedStream(state.cursor)
+    # A product edited during the walk comes by twice; keep its latest version
+    products = list({product_key(product): product for product in stream}.values())
+    complete = stream.complete
+    print(f"  {len(products)} changed, {len(active_ids)} active products")
+    
+    upserts = set()
+    removals = set()
+    publishable = []
+    for product in products:
+        key = product_key(product)
+        removals |= entry_paths(state.products.get(key, {}))
+        if not is_publishable(product):
+            state.forget(key)
+            listing.forget(key)
+            continue
+        path = get_product_path(product)
+        state.record(key, content_hash(product), [f'{locale}/{path}index.html' for locale in LOCALES])
+        listing.record(key, product)
+        upserts.add(path)
+        publishable.append(product)
+    writer = render_pages(publishable, jobs)
+    
+    # Products that disappeared from the active list were deleted or deactivated
+    removed = state.prune(active_ids)
+    listing.prune(active_ids)
+    for entry in removed.values():
+        removals |= entry_paths(entry)
+    if removed:
+        print(f"  🗑️ {len(removed)} products removed")
+    
+    ledger = LastmodLedger.load(SITEMAP_LEDGER_PATH)
+    for locale in LOCALES:
+        patch_sitemap_entries(locale, sorted(upserts), removals - upserts, writer, ledger)
+    update_sitemap_index(WEB_ROOT, LOCALES, TODAY, BASE_URL, writer)
+    
+    if complete:
+        state.advance_cursor(products)
+    written = writer.written + writer.removed
+    if state.save():
+        written.append(SYNC_STATE_PATH)
+    if ledger.save():
+        written.append(SITEMAP_LEDGER_PATH)
+    written += publish_listing(listing, [product_key(product) for product in publishable])
+    if stage and written:
+        stage_paths(written)
+    
+    print(f"\n🎉 Done! {writer.summary()}")
+    return complete
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Sync product pages from the Structon CMS.')
+    parser.add_argument('--fetch-concurrency', type=int, default=FETCH_CONCURRENCY,
+                        help=f'Number of product pages fetched in parallel (default: {FETCH_CONCURRENCY})')
+    parser.add_argument('--jobs', type=int, default=RENDER_JOBS,
+                        help=f'Number of processes rendering pages (default: {RENDER_JOBS})')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the sync state and re-render every product page')
+    parser.add_argument('--stage', action='store_true',
+                        help='git add the files written by this run')
+    parser.add_argument('--product', metavar='SLUG_OR_ID',
+                        help='Only refresh this product (pages and sitemap entries)')
+    parser.add_argument('--delta', action='store_true',
+                        help='Only fetch products changed since the last sync (falls back to a full sync)')
+    parser.add_argument('--api-base', default=API_BASE,
+                        help=f'CMS API base URL (default: {API_BASE})')
+    return parser.parse_args()
 
 
 if __name__ == '__main__':
-    products = sync_products()
-    if products:
-        update_sitemaps_with_products(products)
+    args = parse_args()
+    API_BASE = args.api_base.rstrip('/')
+    if args.product:
+        raise SystemExit(0 if sync_single_product(args.product, stage=args.stage) else 1)
+    if args.delta:
+        raise SystemExit(0 if sync_products_delta(fetch_concurrency=args.fetch_concurrency, stage=args.stage, jobs=args.jobs) else 1)
+    
+    raise SystemExit(0 if sync_products(fetch_concurrency=args.fetch_concurrency, full=args.full, stage=args.stage, jobs=args.jobs) else 1)
@@ -0,0 +1,116 @@
+"""
+Persistent state for incremental product syncs.
+Records a content hash per product plus a hash of the page templates, so a
+sync only re-renders products whose inputs changed since the last run.
+"""
+
+import json
+import hashlib
+from pathlib import Path
+
+STATE_VERSION = 1
+
+
+def content_hash(data):
+    """Stable SHA-256 of any JSON-serialisable value."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def template_version(sources, *extra):
+    """Hash template source code plus any extra data (e.g. labels)."""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.encode('utf-8'))
+    digest.update(content_hash(extra).encode('ascii'))
+    return digest.hexdigest()
+
+
+def product_key(product):
+    """Identify a product across runs, preferring the CMS id over the slug."""
+    return str(product.get('id') or product.get('slug'))
+
+
+class SyncState:
+    """Content hashes of the products rendered by previous syncs."""
+
+    def __init__(self, path, template_hash, products=None, cursor=None):
+        self.path = Path(path)
+        self.template_hash = template_hash
+        self.products = products or {}
+        # Highest CMS `updated_at` seen so far, for delta syncs
+        self.cursor = cursor
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path, template_hash):
+        """Load state from disk; a template change invalidates all product hashes."""
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path, template_hash)
+
+        if data.get('version') != STATE_VERSION:
+            return cls(path, template_hash)
+
+        state = cls(path, template_hash)
+        if data.get('template_hash') == template_hash:
+            state.products = data.get('products', {})
+            state.cursor = data.get('cursor')
+        else:
+            state.dirty = True
+        return state
+
+    def is_current(self, key, digest, root=None):
+        """True if the product was rendered from identical inputs and its pages still exist."""
+        entry = self.products.get(key)
+        if not entry or entry.get('hash') != digest:
+            return False
+        if root is not None:
+            return all((Path(root) / rel).exists() for rel in entry.get('paths', []))
+        return True
+
+    def record(self, key, digest, paths):
+        """Remember the hash and output paths of a freshly rendered product."""
+        self.products[key] = {'hash': digest, 'paths': sorted(str(p) for p in paths)}
+        self.dirty = True
+
+    def advance_cursor(self, products):
+        """Move the delta cursor to the newest `updated_at` among `products`."""
+        self.move_cursor(max((p['updated_at'] for p in products if p.get('updated_at')), default=None))
+
+    def move_cursor(self, stamp):
+        """Move the delta cursor forward to `stamp` (never backwards)."""
+        if stamp and (not self.cursor or stamp > self.cursor):
+            self.cursor = stamp
+            self.dirty = True
+
+    def forget(self, key):
+        """Drop a single product from the state."""
+        if self.products.pop(key, None) is not None:
+            self.dirty = True
+
+    def prune(self, keep_keys):
+        """Forget products that no longer exist in the CMS. Returns the removed entries."""
+        keep_keys = set(keep_keys)
+        removed = {key: entry for key, entry in self.products.items() if key not in keep_keys}
+        for key in removed:
+            del self.products[key]
+        if removed:
+            self.dirty = True
+        return removed
+
+    def save(self):
+        """Write the state file if anything changed."""
+        if not self.dirty:
+            return False
+        data = {
+            'version': STATE_VERSION,
+            'template_hash': self.template_hash,
+            'cursor': self.cursor,
+            'products': dict(sorted(self.products.items())),
+        }
+        self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        self.dirty = False
+        return True
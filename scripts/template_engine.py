@@ -0,0 +1,64 @@
+"""
+Precompiled page templates for the Structon static site generators.
+A template is parsed once into static chunks and named {{slots}}; rendering
+is a single join. Locale-invariant values can be bound ahead of time, which
+folds them into the static chunks so they are not re-assembled per page.
+
+Usage:
+    from template_engine import PageTemplate
+
+    PAGE = PageTemplate('<html lang="{{lang}}"><title>{{title}}</title></html>')
+    nl_page = PAGE.bind(lang='nl-BE')       # compile once per locale
+    html = nl_page.render(title='Slotenbak 600mm')
+"""
+
+import re
+
+SLOT_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+class PageTemplate:
+    """A template compiled into static chunks interleaved with named slots."""
+
+    def __init__(self, source=None, chunks=None, slots=None):
+        if source is not None:
+            parts = SLOT_PATTERN.split(source)
+            chunks, slots = parts[0::2], parts[1::2]
+        self.chunks = list(chunks)
+        self.slots = list(slots)
+        self.source = source if source is not None else self._describe()
+
+    def _describe(self):
+        parts = [self.chunks[0]]
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            parts.append('{{' + slot + '}}')
+            parts.append(chunk)
+        return ''.join(parts)
+
+    @property
+    def slot_names(self):
+        return set(self.slots)
+
+    def bind(self, **values):
+        """Return a new template with the given slots filled in and merged into the static chunks."""
+        chunks = [self.chunks[0]]
+        slots = []
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            if slot in values:
+                chunks[-1] += str(values[slot]) + chunk
+            else:
+                slots.append(slot)
+                chunks.append(chunk)
+        return PageTemplate(chunks=chunks, slots=slots)
+
+    def render(self, values=None, **kwargs):
+        """Fill every remaining slot and return the page as a string."""
+        if values is None:
+            values = kwargs
+        elif kwargs:
+            values = {**values, **kwargs}
+        parts = [self.chunks[0]]
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            parts.append(str(values[slot]))
+            parts.append(chunk)
+        return ''.join(parts)
@@ -0,0 +1,80 @@
+"""
+Rendering a locale page from a source page and a per-page catalog
+(i18n_catalog.py).
+
+    python -m pytest scripts/tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from i18n_catalog import Catalog, SlugTable, align_messages, compile_page
+
+BLOG = '''<html lang="nl-BE"><head>
+<meta content="Lees onze blog." name="description"/>
+<link href="https://example.com/be-nl/blog/" rel="canonical"/>
+<meta property="og:locale" content="nl_BE"/>
+</head><body>
+<h1>Stel uw vraag</h1>
+<a href="de-juiste-graafbak-kiezen/">Lees meer</a> <a href="../contact/">CW40</a>
+</body></html>'''
+
+POST = '''<html lang="nl-BE"><head>
+<link href="https://example.com/de-de/blog/den-richtigen-baggerloeffel-waehlen/" hreflang="de-DE" rel="alternate"/>
+</head><body><a href="../">Stel uw vraag</a></body></html>'''
+
+
+class LocalizePageTest(unittest.TestCase):
+    def setUp(self):
+        self.slugs = SlugTable.from_pages({'blog/': BLOG, 'blog/de-juiste-graafbak-kiezen/': POST})
+        self.source = compile_page(BLOG, 'blog/', self.slugs)
+
+    def catalog(self, pages):
+        return Catalog('de-de', pages, fallback={}, path='/dev/null')
+
+    def test_attributes_in_any_order(self):
+        catalog = self.catalog({'blog/': {'Lees onze blog.': 'Lesen Sie unseren Blog.'}})
+        html = self.source.render('de-de', catalog, self.slugs)
+        self.assertIn('<meta content="Lesen Sie unseren Blog." name="description"/>', html)
+        self.assertIn('<link href="https://example.com/de-de/blog/" rel="canonical"/>', html)
+        self.assertIn('<html lang="de-DE">', html)
+        self.assertIn('content="de_DE"', html)
+
+    def test_links_follow_the_locale_slug(self):
+        html = self.source.render('de-de', self.catalog({}), self.slugs)
+        self.assertIn('<a href="den-richtigen-baggerloeffel-waehlen/">', html)
+        self.assertIn('<a href="../contact/">', html)
+        self.assertEqual(self.slugs.path('de-de', 'blog/de-juiste-graafbak-kiezen/'),
+                         'blog/den-richtigen-baggerloeffel-waehlen/')
+
+    def test_identity_and_empty_are_untranslated(self):
+        catalog = self.catalog({'blog/': {'Stel uw vraag': 'Stel uw vraag', 'Lees meer': '', 'CW40': 'CW40'}})
+        self.assertFalse(catalog.has('Stel uw vraag', 'blog/'))
+        self.assertFalse(catalog.has('Lees meer', 'blog/'))
+        self.assertTrue(catalog.has('CW40', 'blog/'))
+
+    def test_messages_are_translated_per_page(self):
+        catalog = self.catalog({
+            'blog/': {'Stel uw vraag': 'Stellen Sie Ihre Frage'},
+            'contact/': {'Stel uw vraag': 'Stel uw vraag'},
+        })
+        self.assertEqual(catalog.gettext('Stel uw vraag', 'blog/'), 'Stellen Sie Ihre Frage')
+        self.assertFalse(catalog.has('Stel uw vraag', 'contact/'))
+        self.assertFalse(catalog.has('Stel uw vraag', 'faq/'))
+
+    def test_identity_renders_but_empty_does_not(self):
+        catalog = self.catalog({'blog/': {'Stel uw vraag': 'Stel uw vraag', 'Lees meer': ''}})
+        self.assertTrue(catalog.renders('Stel uw vraag', 'blog/'))
+        self.assertFalse(catalog.renders('Lees meer', 'blog/'))
+        self.assertFalse(catalog.renders('Stel uw vraag', 'faq/'))
+
+    def test_misaligned_pages_do_not_pair(self):
+        self.assertIsNotNone(align_messages(BLOG, BLOG.replace('Lees meer', 'Mehr lesen')))
+        self.assertIsNone(align_messages(BLOG, BLOG.replace('>CW40<', '>Kontakt<')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""
+Delta sync (sync_products.py --delta) against a local stand-in for the CMS API.
+The stand-in serves /api/products?updated_since=...&after_id=... (keyset
+pages in updated_asc order) and /api/products/ids from an in-memory catalog;
+the sync writes its pages, state and sitemaps into a temporary folder.
+
+    python -m pytest scripts/tests
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sync_products
+from product_listing import ProductListing
+from sync_state import SyncState, content_hash, product_key
+
+PAGE_SIZE = 2
+
+
+def make_product(number, updated_at):
+    return {
+        'id': f'00000000-0000-0000-0000-{number:012d}',
+        'slug': f'slotenbak-{number}',
+        'title': f'Slotenbak {number}',
+        'category_slug': 'graafbakken',
+        'subcategory_slug': 'slotenbakken',
+        'width': 300 + number,
+        'excavator_weight_min': 1,
+        'excavator_weight_max': 3,
+        'stock_quantity': 1,
+        'created_at': '2024-01-01T00:00:00.000Z',
+        'updated_at': updated_at,
+    }
+
+
+class StandInCMS:
+    """In-memory catalog behind /api/products and /api/products/ids."""
+
+    def __init__(self, products):
+        self.products = {product['id']: product for product in products}
+        self.requests = []
+        # Called with the number of product page requests served so far
+        self.on_page = None
+        self.fail_page = None
+
+    def changed(self, query):
+        since, after_id = query['updated_since'][0], query.get('after_id', [None])[0]
+        order = sorted(self.products.values(), key=lambda product: (product['updated_at'], product['id']))
+        if after_id:
+            matches = [p for p in order if (p['updated_at'], p['id']) > (since, after_id)]
+        else:
+            matches = [p for p in order if p['updated_at'] > since]
+        return matches
+
+    def handle(self, path, query):
+        if path == '/api/products/ids':
+            return 200, {'ids': sorted(self.products), 'total': len(self.products)}
+        if path == '/api/products':
+            self.requests.append(query)
+            page = len(self.requests)
+            if page == self.fail_page:
+                return 500, {'error': 'Internal server error'}
+            matches = self.changed(query)
+            offset = int(query.get('offset', ['0'])[0])
+            limit = min(int(query['limit'][0]), PAGE_SIZE)
+            response = {'products': matches[offset:offset + limit], 'total': len(matches)}
+            if self.on_page:
+                self.on_page(page)
+            return 200, response
+        return 404, {'error': 'Not found'}
+
+    def __enter__(self):
+        cms = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                status, data = cms.handle(url.path, parse_qs(url.query))
+                body = json.dumps(data).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.api_base = f'http://127.0.0.1:{self.server.server_port}/api'
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class DeltaSyncTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.state_path = self.tmp / 'sync_state.json'
+        self.listing_path = self.tmp / 'product_listing.json'
+        self.web_root = self.tmp / 'web'
+        self.publish_listing = mock.Mock(return_value=[])
+        for name, value in {
+            'WEB_ROOT': self.web_root,
+            'SYNC_STATE_PATH': self.state_path,
+            'SITEMAP_LEDGER_PATH': self.tmp / 'sitemap_ledger.json',
+            'LISTING_PATH': self.listing_path,
+            'PAGE_SIZE': PAGE_SIZE,
+            'publish_listing': self.publish_listing,
+        }.items():
+            patcher = mock.patch.object(sync_products, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def sync_previously(self, products, cursor):
+        """State and listing as left by an earlier sync of `products`."""
+        state = SyncState(self.state_path, sync_products.TEMPLATE_VERSION, cursor=cursor)
+        listing = ProductListing(self.listing_path)
+        for product in products:
+            path = sync_products.get_product_path(product)
+            state.record(product_key(product), content_hash(product),
+                         [f'{locale}/{path}index.html' for locale in sync_products.LOCALES])
+            listing.record(product_key(product), product)
+        state.save()
+        listing.save()
+
+    def run_delta(self, cms):
+        with mock.patch.object(sync_products, 'API_BASE', cms.api_base):
+            return sync_products.sync_products_delta()
+
+    def saved_state(self):
+        return SyncState.load(self.state_path, sync_products.TEMPLATE_VERSION)
+
+    def page_exists(self, product):
+        return (self.web_root / 'be-nl' / sync_products.get_product_path(product) / 'index.html').exists()
+
+    def test_cursor_advances_past_the_changed_products(self):
+        old = make_product(1, '2024-01-01T00:00:00.000Z')
+        changed = [make_product(number, f'2024-02-0{number}T00:00:00.000Z') for number in (2, 3, 4)]
+        self.sync_previously([old], cursor=old['updated_at'])
+
+        with StandInCMS([old, *changed]) as cms:
+            self.assertTrue(self.run_delta(cms))
+
+        self.assertEqual(self.saved_state().cursor, '2024-02-04T00:00:00.000Z')
+        self.assertTrue(all(self.page_exists(product) for product in changed))
+        self.assertFalse(self.page_exists(old))
+        # Pages follow each other by key
+        self.assertEqual(cms.requests[1]['after_id'], [changed[1]['id']])
+
+    def test_product_edited_during_the_walk_is_not_skipped(self):
+        products = [make_product(number, f'2024-02-0{number}T00:00:00.000Z') for number in (1, 2, 3, 4, 5)]
+        self.sync_previously(products[:1], cursor='2024-01-01T00:00:00.000Z')
+
+        with StandInCMS(products) as cms:
+            def edit_first(page):
+                # Moves product 1 behind the others, which shifted them with offsets
+                if page == 1:
+                    cms.products[products[0]['id']] = {**products[0], 'updated_at': '2024-03-01T00:00:00.000Z'}
+            cms.on_page = edit_first
+            self.assertTrue(self.run_delta(cms))
+
+        self.assertTrue(all(self.page_exists(product) for product in products))
+        self.assertEqual(self.saved_state().cursor, '2024-03-01T00:00:00.000Z')
+
+    def test_product_missing_from_ids_is_removed(self):
+        kept = make_product(1, '2024-01-01T00:00:00.000Z')
+        deleted = make_product(2, '2024-01-01T00:00:00.000Z')
+        self.sync_previously([kept, deleted], cursor='2024-01-01T00:00:00.000Z')
+
+        with StandInCMS([kept]) as cms:
+            self.assertTrue(self.run_delta(cms))
+
+        state = self.saved_state()
+        self.assertIn(product_key(kept), state.products)
+        self.assertNotIn(product_key(deleted), state.products)
+        listing = self.publish_listing.call_args[0][0]
+        self.assertNotIn(product_key(deleted), listing.cards)
+
+    def test_incomplete_walk_leaves_the_cursor(self):
+        cursor = '2024-01-01T00:00:00.000Z'
+        old = make_product(1, cursor)
+        changed = [make_product(number, f'2024-02-0{number}T00:00:00.000Z') for number in (2, 3, 4, 5)]
+        self.sync_previously([old], cursor=cursor)
+
+        with StandInCMS([old, *changed]) as cms:
+            cms.fail_page = 2
+            self.assertFalse(self.run_delta(cms))
+
+        state = self.saved_state()
+        self.assertEqual(state.cursor, cursor)
+        # The products of the first page are still synced
+        self.assertIn(product_key(changed[0]), state.products)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,23 @@
 """
 Translate content in locale folders.
 Replaces Dutch text with French/German translations in HTML files.
+Each dictionary is compiled once by translation_engine (markup context:
+element text and quoted attribute values) and applied in a single scan.
+Translated segments are kept in translation_memory.json, so reruns only
+process pages and lines the current dictionaries have not seen yet; --full
+rereads every page and drops the segments no page contains any more.
+
+Usage:
+    python scripts/translate-content.py [--full]
 """
 
 import os
-import re
+import argparse
+from collections import Counter
+
+from site_inventory import SiteInventory
+from translation_engine import get_engine, match_report
+from translation_memory import TranslationMemory
 
 # Translation dictionaries
 TRANSLATIONS = {
@@ -164,74 +177,70 @@ TRANSLATIONS = {
     }
 }
 
-def translate_file(filepath, translations):
+def translate_file(page, session, matched):
     """Translate content in a single HTML file."""
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original = content
+    # Already translated (or untouched) under the current dictionary
+    if session.is_done(page.digest()):
+        return False
     
-    # Sort translations by length (longest first) to avoid partial replacements
-    sorted_translations = sorted(translations.items(), key=lambda x: len(x[0]), reverse=True)
+    content = page.read()
+    translated, found = session.translate(content)
+    matched.update(found)
     
-    for dutch, translated in sorted_translations:
-        # Use word boundaries where possible
-        content = content.replace(f'>{dutch}<', f'>{translated}<')
-        content = content.replace(f'>{dutch} ', f'>{translated} ')
-        content = content.replace(f' {dutch}<', f' {translated}<')
-        content = content.replace(f'"{dutch}"', f'"{translated}"')
-        content = content.replace(f"'{dutch}'", f"'{translated}'")
-        content = content.replace(f'placeholder="{dutch}"', f'placeholder="{translated}"')
-        content = content.replace(f'aria-label="{dutch}"', f'aria-label="{translated}"')
-        content = content.replace(f'title="{dutch}"', f'title="{translated}"')
-    
-    if content != original:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
-    
-    return False
+    changed = translated != content
+    if changed:
+        page.write(translated)
+    session.mark_done(page.digest())
+    return changed
 
-def translate_locale(web_root, locale):
+def translate_locale(web_root, locale, memory, full=False):
     """Translate all HTML files in a locale folder."""
     
     if locale not in TRANSLATIONS:
         print(f"  No translations available for {locale}")
         return 0
     
-    translations = TRANSLATIONS[locale]
+    engine = get_engine(TRANSLATIONS[locale], context='markup')
     locale_folder = os.path.join(web_root, locale)
     
     if not os.path.exists(locale_folder):
         print(f"  Locale folder not found: {locale}")
         return 0
     
+    session = memory.session(f'translate-content/{locale}', engine, full)
     translated_count = 0
+    matched = Counter()
     
-    for root, dirs, files in os.walk(locale_folder):
-        for filename in files:
-            if filename.endswith('.html'):
-                filepath = os.path.join(root, filename)
-                if translate_file(filepath, translations):
-                    rel_path = os.path.relpath(filepath, web_root)
-                    translated_count += 1
+    for page in SiteInventory.load(web_root).pages(locale):
+        if translate_file(page, session, matched):
+            translated_count += 1
     
+    print(match_report(engine, matched))
+    print(f"  Translation memory: {session.hits} cached segments reused, {session.scanned} lines scanned")
     return translated_count
 
 def main():
+    parser = argparse.ArgumentParser(description='Translate the Dutch text left in the locale folders.')
+    parser.add_argument('--full', action='store_true',
+                        help='Reread every page and drop unused segments from the translation memory')
+    args = parser.parse_args()
+    
     script_dir = os.path.dirname(os.path.abspath(__file__))
     web_root = os.path.join(os.path.dirname(script_dir), 'web')
     
     print("Translating locale content...")
     print()
     
+    memory = TranslationMemory.load()
     for locale in ['be-fr', 'de-de']:
         print(f"Translating /{locale}/...")
-        count = translate_locale(web_root, locale)
+        count = translate_locale(web_root, locale, memory, args.full)
         print(f"  ✓ {count} files updated")
         print()
     
+    memory.save()
+    SiteInventory.load(web_root).save()
     print("Done!")
 
 if __name__ == '__main__':
@@ -0,0 +1,118 @@
+"""
+Multi-pattern translation engine for the translate_* scripts.
+A locale's TRANSLATIONS dictionary is compiled once into a single pattern:
+the Dutch source strings are merged into a trie (the goto graph of an
+Aho-Corasick automaton) and emitted as one regular expression, so a file is
+translated in a single left-to-right scan by the C regex engine instead of
+one str.replace pass per dictionary entry. At every position the longest
+entry that fits the context rule wins and the scan continues after it, so
+translated text is never re-translated.
+
+Context rules decide where an entry may match:
+    anywhere   plain substring (the old str.replace scripts)
+    markup     element text and quoted attribute values: >x<, >x , x<, "x", 'x'
+    word       whole words only (\\b boundaries)
+
+Usage:
+    from translation_engine import get_engine
+
+    engine = get_engine(TRANSLATIONS['be-fr'], context='markup')
+    html, matched = engine.translate(html)   # matched: Counter of Dutch entries
+    print(match_report(engine, matched))     # after adding up the Counters of a run
+"""
+
+import re
+from collections import Counter
+
+# (lookbehind, lookahead) pairs around an entry, per context rule
+CONTEXT_RULES = {
+    'anywhere': [('', '')],
+    'markup': [
+        ('(?<=>)', '(?=[< ])'),
+        ('(?<= )', '(?=<)'),
+        ('(?<=")', '(?=")'),
+        ("(?<=')", "(?=')"),
+    ],
+    'word': [(r'\b', r'\b')],
+}
+
+# Compiled engines by dictionary, see get_engine()
+_engines = {}
+
+
+def build_trie(keys):
+    """Merge `keys` into a nested dict trie; '' marks the end of a key."""
+    root = {}
+    for key in keys:
+        node = root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return root
+
+
+def trie_pattern(node, terminal):
+    """Regex for a trie node that prefers the longest key, then checks `terminal` where a key ends."""
+    branches = [re.escape(char) + trie_pattern(child, terminal)
+                for char, child in sorted(node.items()) if char]
+    if '' in node:
+        # Tried last, so longer keys through this node win
+        branches.append(terminal)
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+class TranslationEngine:
+    """One translation dictionary compiled into a single longest-match pattern."""
+
+    def __init__(self, translations, context='anywhere', ignore_case=False):
+        if context not in CONTEXT_RULES:
+            raise ValueError(f"Unknown context rule '{context}' (available: {', '.join(CONTEXT_RULES)})")
+        self.context = context
+        self.ignore_case = ignore_case
+        self.translations = {}
+        for source, target in translations.items():
+            if not source:
+                continue
+            key = source.lower() if ignore_case else source
+            # First entry wins, as with the old sequential replaces
+            self.translations.setdefault(key, (source, target))
+
+        if self.translations:
+            trie = build_trie(self.translations)
+            pattern = '|'.join(before + trie_pattern(trie, after) for before, after in CONTEXT_RULES[context])
+        else:
+            pattern = r'(?!)'
+        self.pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def entry(self, found):
+        """The (source, target) dictionary entry for a matched string."""
+        return self.translations[found.lower() if self.ignore_case else found]
+
+    def translate(self, text):
+        """Translate `text` in one scan. Returns (translated text, Counter of matched source entries)."""
+        matched = Counter()
+
+        def replace(match):
+            source, target = self.entry(match.group())
+            matched[source] += 1
+            return target
+
+        return self.pattern.sub(replace, text), matched
+
+    def __len__(self):
+        return len(self.translations)
+
+
+def get_engine(translations, context='anywhere', ignore_case=False):
+    """The compiled engine for a (module-level) translation dictionary, built once per process."""
+    key = (id(translations), context, ignore_case)
+    if key not in _engines:
+        _engines[key] = (translations, TranslationEngine(translations, context, ignore_case))
+    return _engines[key][1]
+
+
+def match_report(engine, matched):
+    """'  12 of 40 entries matched (57 replacements)' for the matched Counter of a run."""
+    return f"  {len(matched)} of {len(engine)} entries matched ({sum(matched.values())} replacements)"
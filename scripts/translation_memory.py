@@ -0,0 +1,199 @@
+"""
+Persistent translation memory for translate-content.py.
+Source segments (lines of HTML; dictionary entries never span lines) are
+stored with their translation under the dictionary version that produced
+them, in translation_memory.json. A rerun reuses cached segments and only
+scans the rest, and pages whose content is a translation this memory already
+produced (or a page the dictionary leaves unchanged) are skipped unread.
+
+After a dictionary tweak, cached segments that contain none of the added,
+removed or changed entries carry over to the new version, so retranslating
+the site costs work proportional to the segments the tweak can affect.
+
+A run that reads every page (the first under a new dictionary version, or
+one with `full=True`) drops the segments none of the pages contain any
+more, so the memory does not grow with every edit of the site. The file is
+a local cache like site_inventory.json and is not committed.
+
+Usage:
+    from translation_memory import TranslationMemory
+
+    memory = TranslationMemory.load()
+    session = memory.session('translate-content/be-fr', engine)   # full=True: reread every page
+    for page in pages:
+        if session.is_done(page.digest()):
+            continue
+        html, matched = session.translate(page.read())
+        ...
+        session.mark_done(page.digest())
+    memory.save()
+"""
+
+import json
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from pathlib import Path
+
+from output_writer import write_if_changed
+from sync_state import content_hash
+from translation_engine import TranslationEngine
+
+MEMORY_PATH = Path(__file__).parent / 'translation_memory.json'
+MEMORY_VERSION = 1
+
+
+def dictionary_version(engine):
+    """Hash of everything that decides an engine's output."""
+    return content_hash([engine.context, engine.ignore_case, sorted(engine.translations.values())])
+
+
+def changed_entries(old_entries, new_entries):
+    """Source strings added, removed or retranslated between two {source: target} snapshots."""
+    return sorted(source for source in set(old_entries) | set(new_entries)
+                  if old_entries.get(source) != new_entries.get(source))
+
+
+class MemorySession:
+    """The memory of one named dictionary (e.g. 'translate-content/be-fr') during a run."""
+
+    def __init__(self, engine, data, full=False):
+        self.engine = engine
+        self.version = dictionary_version(engine)
+        self.rules = [engine.context, engine.ignore_case]
+        self.entries = dict(engine.translations.values())
+        self.segments = {}
+        self.done = set()
+        self.seen = set()
+        # Cached or scanned segments of the pages read this run
+        self.used = set()
+        self.skipped = 0
+        self.hits = 0
+        self.scanned = 0
+        # Line segments are only exact if no entry spans a line break
+        self.segmented = not any('\n' in source for source in self.entries)
+
+        if data.get('version') == self.version:
+            self.segments = data.get('segments', {})
+            if not full:
+                self.done = set(data.get('done', []))
+        elif data.get('rules') == self.rules and data.get('entries') is not None:
+            self._carry_over(data)
+
+    def _carry_over(self, data):
+        """Keep the segments of a previous dictionary version that no changed entry can touch."""
+        changed = changed_entries(data['entries'], self.entries)
+        probe = TranslationEngine(dict.fromkeys(changed, ''), 'anywhere', self.engine.ignore_case)
+        self.segments = {source: cached for source, cached in data.get('segments', {}).items()
+                         if not probe.pattern.search(source)}
+
+    def is_done(self, digest):
+        """True if a page with this content hash needs no translation under the current dictionary."""
+        if digest in self.done:
+            self.seen.add(digest)
+            self.skipped += 1
+            return True
+        return False
+
+    def mark_done(self, digest):
+        self.seen.add(digest)
+
+    def translate(self, text):
+        """Translate `text`, reusing cached segments. Returns (translated text, Counter of matched entries)."""
+        if not self.segmented:
+            return self.engine.translate(text)
+
+        lines = text.split('\n')
+        matched = Counter()
+        pending = []
+        for index, line in enumerate(lines):
+            cached = self.segments.get(line)
+            if cached is None:
+                pending.append(index)
+                continue
+            self.hits += 1
+            self.used.add(line)
+            lines[index] = cached[0]
+            matched.update(cached[1])
+
+        if pending:
+            self.scanned += len(pending)
+            for index, (translated, found) in self._scan([lines[i] for i in pending]).items():
+                source = lines[pending[index]]
+                self.segments[source] = [translated, dict(found)]
+                self.used.add(source)
+                lines[pending[index]] = translated
+                matched.update(found)
+
+        return '\n'.join(lines), matched
+
+    def _scan(self, lines):
+        """Translate uncached lines in one engine scan. Returns {index: (translated, matched)} for lines with matches."""
+        batch = '\n'.join(lines)
+        starts = [0, *accumulate(len(line) + 1 for line in lines)]
+        matches = {}
+        for match in self.engine.pattern.finditer(batch):
+            matches.setdefault(bisect_right(starts, match.start()) - 1, []).append(match)
+
+        results = {}
+        for index, line_matches in matches.items():
+            line, offset = lines[index], starts[index]
+            parts, position, found = [], 0, Counter()
+            for match in line_matches:
+                source, target = self.engine.entry(match.group())
+                parts.append(line[position:match.start() - offset])
+                parts.append(target)
+                position = match.end() - offset
+                found[source] += 1
+            parts.append(line[position:])
+            results[index] = (''.join(parts), found)
+        return results
+
+    def to_json(self):
+        segments = self.segments
+        if self.seen and not self.skipped:
+            # Every page was read, so unused segments belong to content that is gone
+            segments = {source: cached for source, cached in segments.items() if source in self.used}
+        return {
+            'version': self.version,
+            'rules': self.rules,
+            'entries': dict(sorted(self.entries.items())),
+            'segments': dict(sorted(segments.items())),
+            'done': sorted(self.seen),
+        }
+
+
+class TranslationMemory:
+    """Translation memories of all dictionaries, stored in one JSON file."""
+
+    def __init__(self, path=MEMORY_PATH, dictionaries=None):
+        self.path = Path(path)
+        self.dictionaries = dictionaries or {}
+        self.sessions = {}
+
+    @classmethod
+    def load(cls, path=MEMORY_PATH):
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != MEMORY_VERSION:
+            return cls(path)
+        return cls(path, data.get('dictionaries', {}))
+
+    def session(self, name, engine, full=False):
+        """Open the memory of dictionary `name` for `engine` (one session per name and run).
+
+        With `full`, no page counts as done, so every page is read and unused segments are dropped.
+        """
+        if name not in self.sessions:
+            self.sessions[name] = MemorySession(engine, self.dictionaries.get(name, {}), full)
+        return self.sessions[name]
+
+    def save(self):
+        """Write the memory file if anything changed. Returns True if written."""
+        for name, session in self.sessions.items():
+            self.dictionaries[name] = session.to_json()
+        data = {'version': MEMORY_VERSION, 'dictionaries': dict(sorted(self.dictionaries.items()))}
+        return write_if_changed(self.path, json.dumps(data, indent=1, ensure_ascii=False) + '\n')
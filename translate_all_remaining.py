@@ -4,8 +4,13 @@ Comprehensive translation script for all remaining Dutch content
 """
 import os
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine, match_report
+
 # Comprehensive translation dictionaries
 TRANSLATIONS = {
     'be-fr': {
@@ -162,23 +167,24 @@ TRANSLATIONS = {
     }
 }
 
-def translate_content(content, locale):
+def translate_content(content, locale, matched):
     """Apply translations to content"""
     translations = TRANSLATIONS.get(locale, {})
     
-    for dutch, translation in translations.items():
-        content = content.replace(dutch, translation)
+    # One longest-match scan over the compiled dictionary
+    content, found = get_engine(translations).translate(content)
+    matched.update(found)
     
     return content
 
-def process_file(file_path, locale):
+def process_file(file_path, locale, matched):
     """Process a single file"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         original_content = content
-        content = translate_content(content, locale)
+        content = translate_content(content, locale, matched)
         
         if content != original_content:
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -191,7 +197,7 @@ def process_file(file_path, locale):
 
 def main():
     """Main function"""
-    base_path = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_path = Path(__file__).parent / 'web'
     
     total_updated = 0
     
@@ -207,11 +213,13 @@ def main():
         
         print(f"Found {len(html_files)} HTML files to process\n")
         
+        matched = Counter()
         for html_file in html_files:
             rel_path = html_file.relative_to(base_path)
-            if process_file(html_file, locale):
+            if process_file(html_file, locale, matched):
                 print(f"  ✓ Updated {rel_path}")
                 total_updated += 1
+        print(match_report(get_engine(TRANSLATIONS.get(locale, {})), matched))
     
     print(f"\n{'='*60}")
     print(f"Translation complete! Updated {total_updated} files.")
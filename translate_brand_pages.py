@@ -4,8 +4,12 @@ Script to translate Dutch content in brand pages to French and German
 """
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine
+
 # Translation dictionaries
 TRANSLATIONS = {
     'be-fr': {
@@ -124,15 +128,14 @@ def translate_file(file_path, locale):
     original_content = content
     translations = TRANSLATIONS.get(locale, {})
     
-    # Apply translations
-    for dutch, translation in translations.items():
-        content = content.replace(dutch, translation)
+    # Apply translations in one longest-match scan
+    content, matched = get_engine(translations).translate(content)
     
     # Only write if content changed
     if content != original_content:
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
-        print(f"  ✓ Updated {file_path}")
+        print(f"  ✓ Updated {file_path} ({sum(matched.values())} replacements, {len(matched)} entries)")
         return True
     else:
         print(f"  - No changes needed for {file_path}")
@@ -140,7 +143,7 @@ def translate_file(file_path, locale):
 
 def main():
     """Main function"""
-    base_path = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_path = Path(__file__).parent / 'web'
     
     # Brand names to process
     brands = [
@@ -5,8 +5,13 @@ Translate Brand USP texts in be-fr and de-de brand pages
 
 import os
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine, match_report
+
 # Translation dictionaries for USP texts
 translations_fr = {
     'Op maat gemaakt in België': 'Fabriqué sur mesure en Belgique',
@@ -30,7 +35,7 @@ translations_de = {
     'Lokale productie betekent korte levertijden zonder in te boeten op kwaliteit.': 'Lokale Produktion bedeutet kurze Lieferzeiten ohne Qualitätseinbußen.'
 }
 
-def translate_brand_usps(filepath, translations):
+def translate_brand_usps(filepath, translations, matched):
     """Translate USP texts in brand HTML file"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -38,12 +43,9 @@ def translate_brand_usps(filepath, translations):
         
         original_content = content
         
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_translations = sorted(translations.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for dutch, translation in sorted_translations:
-            # Replace in HTML content
-            content = content.replace(dutch, translation)
+        # One longest-match scan over the compiled dictionary
+        content, found = get_engine(translations).translate(content)
+        matched.update(found)
         
         if content != original_content:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -55,39 +57,43 @@ def translate_brand_usps(filepath, translations):
         return False
 
 def main():
-    base_dir = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_dir = Path(__file__).parent / 'web'
     
     # Process be-fr brand pages
     print("Processing be-fr brand pages...")
     be_fr_dir = base_dir / 'be-fr' / 'kraanbakken'
     fr_count = 0
+    matched = Counter()
     
     if be_fr_dir.exists():
         for brand_dir in be_fr_dir.iterdir():
             if brand_dir.is_dir():
                 html_file = brand_dir / 'index.html'
                 if html_file.exists():
-                    if translate_brand_usps(html_file, translations_fr):
+                    if translate_brand_usps(html_file, translations_fr, matched):
                         fr_count += 1
                         print(f"  ✓ {html_file.relative_to(base_dir)}")
     
     print(f"\nTranslated {fr_count} be-fr brand pages")
+    print(match_report(get_engine(translations_fr), matched))
     
     # Process de-de brand pages
     print("\nProcessing de-de brand pages...")
     de_de_dir = base_dir / 'de-de' / 'kraanbakken'
     de_count = 0
+    matched = Counter()
     
     if de_de_dir.exists():
         for brand_dir in de_de_dir.iterdir():
             if brand_dir.is_dir():
                 html_file = brand_dir / 'index.html'
                 if html_file.exists():
-                    if translate_brand_usps(html_file, translations_de):
+                    if translate_brand_usps(html_file, translations_de, matched):
                         de_count += 1
                         print(f"  ✓ {html_file.relative_to(base_dir)}")
     
     print(f"\nTranslated {de_count} de-de brand pages")
+    print(match_report(get_engine(translations_de), matched))
     print(f"\nTotal: {fr_count + de_count} brand pages updated")
 
 if __name__ == '__main__':
@@ -5,8 +5,13 @@ Translate Category Pages (graafbakken, overige, sloop-sorteergrijpers) for be-fr
 
 import os
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine, match_report
+
 # Category translations
 category_translations = {
     'be-fr': {
@@ -27,7 +32,7 @@ category_translations = {
     }
 }
 
-def translate_category_page(filepath, locale):
+def translate_category_page(filepath, locale, matched):
     """Translate category page title and subtitle"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -36,11 +41,9 @@ def translate_category_page(filepath, locale):
         original_content = content
         translations = category_translations.get(locale, {})
         
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_translations = sorted(translations.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for dutch, translation in sorted_translations:
-            content = content.replace(dutch, translation)
+        # One longest-match scan over the compiled dictionary
+        content, found = get_engine(translations).translate(content)
+        matched.update(found)
         
         if content != original_content:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -52,7 +55,7 @@ def translate_category_page(filepath, locale):
         return False
 
 def main():
-    base_dir = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_dir = Path(__file__).parent / 'web'
     
     categories = [
         'producten/graafbakken',
@@ -67,17 +70,19 @@ def main():
     for locale in locales:
         print(f"\nProcessing {locale} category pages...")
         locale_dir = base_dir / locale
+        matched = Counter()
         
         for category in categories:
             category_file = locale_dir / category / 'index.html'
             if category_file.exists():
-                if translate_category_page(category_file, locale):
+                if translate_category_page(category_file, locale, matched):
                     total_updated += 1
                     print(f"  ✓ {category_file.relative_to(base_dir)}")
                 else:
                     print(f"  - No changes for {category_file.relative_to(base_dir)}")
             else:
                 print(f"  ✗ Not found: {category_file.relative_to(base_dir)}")
+        print(match_report(get_engine(category_translations.get(locale, {})), matched))
     
     print(f"\n✅ Total: {total_updated} category pages updated")
 
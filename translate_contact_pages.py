@@ -5,8 +5,13 @@ Translate Contact Pages for be-fr and de-de
 
 import os
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine, match_report
+
 # French translations
 translations_fr = {
     'Stel uw vraag': 'Posez votre question',
@@ -129,7 +134,7 @@ translations_de = {
     'Veelgestelde vragen': 'Häufig gestellte Fragen'
 }
 
-def translate_contact_page(filepath, translations):
+def translate_contact_page(filepath, translations, matched):
     """Translate contact page"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -137,11 +142,9 @@ def translate_contact_page(filepath, translations):
         
         original_content = content
         
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_translations = sorted(translations.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for dutch, translation in sorted_translations:
-            content = content.replace(dutch, translation)
+        # One longest-match scan over the compiled dictionary
+        content, found = get_engine(translations).translate(content)
+        matched.update(found)
         
         if content != original_content:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -153,25 +156,29 @@ def translate_contact_page(filepath, translations):
         return False
 
 def main():
-    base_dir = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_dir = Path(__file__).parent / 'web'
     
     # Process be-fr contact page
     print("Processing be-fr contact page...")
     be_fr_contact = base_dir / 'be-fr' / 'contact' / 'index.html'
     if be_fr_contact.exists():
-        if translate_contact_page(be_fr_contact, translations_fr):
+        matched = Counter()
+        if translate_contact_page(be_fr_contact, translations_fr, matched):
             print(f"  ✓ {be_fr_contact.relative_to(base_dir)}")
         else:
             print(f"  - No changes needed for {be_fr_contact.relative_to(base_dir)}")
+        print(match_report(get_engine(translations_fr), matched))
     
     # Process de-de contact page
     print("\nProcessing de-de contact page...")
     de_de_contact = base_dir / 'de-de' / 'contact' / 'index.html'
     if de_de_contact.exists():
-        if translate_contact_page(de_de_contact, translations_de):
+        matched = Counter()
+        if translate_contact_page(de_de_contact, translations_de, matched):
             print(f"  ✓ {de_de_contact.relative_to(base_dir)}")
         else:
             print(f"  - No changes needed for {de_de_contact.relative_to(base_dir)}")
+        print(match_report(get_engine(translations_de), matched))
     
     print("\n✅ Contact pages translation completed")
 
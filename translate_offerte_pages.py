@@ -5,8 +5,13 @@ Translate Offerte-aanvragen (Quote Request) Pages for be-fr and de-de
 
 import os
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from translation_engine import get_engine, match_report
+
 # French translations
 translations_fr = {
     # Team section
@@ -161,7 +166,7 @@ translations_de = {
     'E-Mail': 'E-Mail'
 }
 
-def translate_offerte_page(filepath, translations):
+def translate_offerte_page(filepath, translations, matched):
     """Translate offerte-aanvragen page"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
@@ -169,11 +174,9 @@ def translate_offerte_page(filepath, translations):
         
         original_content = content
         
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_translations = sorted(translations.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for dutch, translation in sorted_translations:
-            content = content.replace(dutch, translation)
+        # One longest-match scan over the compiled dictionary
+        content, found = get_engine(translations).translate(content)
+        matched.update(found)
         
         if content != original_content:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -185,25 +188,29 @@ def translate_offerte_page(filepath, translations):
         return False
 
 def main():
-    base_dir = Path('/Users/larsleenders/Downloads/Structon/web')
+    base_dir = Path(__file__).parent / 'web'
     
     # Process be-fr offerte page
     print("Processing be-fr offerte-aanvragen page...")
     be_fr_offerte = base_dir / 'be-fr' / 'offerte-aanvragen' / 'index.html'
     if be_fr_offerte.exists():
-        if translate_offerte_page(be_fr_offerte, translations_fr):
+        matched = Counter()
+        if translate_offerte_page(be_fr_offerte, translations_fr, matched):
             print(f"  ✓ {be_fr_offerte.relative_to(base_dir)}")
         else:
             print(f"  - No changes needed for {be_fr_offerte.relative_to(base_dir)}")
+        print(match_report(get_engine(translations_fr), matched))
     
     # Process de-de offerte page
     print("\nProcessing de-de offerte-aanvragen page...")
     de_de_offerte = base_dir / 'de-de' / 'offerte-aanvragen' / 'index.html'
     if de_de_offerte.exists():
-        if translate_offerte_page(de_de_offerte, translations_de):
+        matched = Counter()
+        if translate_offerte_page(de_de_offerte, translations_de, matched):
             print(f"  ✓ {de_de_offerte.relative_to(base_dir)}")
         else:
             print(f"  - No changes needed for {de_de_offerte.relative_to(base_dir)}")
+        print(match_report(get_engine(translations_de), matched))
     
     print("\n✅ Offerte-aanvragen pages translation completed")
 
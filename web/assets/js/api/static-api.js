@@ -0,0 +1,77 @@
+/**
+ * Structon Static API
+ * Reads the static JSON mirror of the public product queries
+ * (web/api/v1/, written by scripts/static_api.py on every product sync).
+ * Shards are served by the Pages CDN instead of the CMS; every helper
+ * resolves to null when the mirror is unavailable, so callers can fall
+ * back to the CMS API.
+ */
+
+const STATIC_API_VERSION = 1;
+const basePath = window.location.pathname.includes('/Structon/') ? '/Structon' : '';
+export const STATIC_API_BASE = `${basePath}/api/v${STATIC_API_VERSION}`;
+
+const EMPTY_SHARD = { total: 0, products: [] };
+
+let manifestPromise = null;
+const shardCache = new Map();
+
+function fetchJson(url, options) {
+  return fetch(url, options)
+    .then(response => response.ok ? response.json() : null)
+    .catch(() => null);
+}
+
+/**
+ * Load the manifest ({ shards: { name: { hash, total } } }) once per page
+ */
+function loadManifest() {
+  if (!manifestPromise) {
+    // Revalidate: the manifest is the only file whose URL does not change
+    manifestPromise = fetchJson(`${STATIC_API_BASE}/manifest.json`, { cache: 'no-cache' });
+  }
+  return manifestPromise;
+}
+
+/**
+ * Get a shard by name (e.g. 'subcategories/slotenbakken')
+ * @param {string} name - Shard name as listed in the manifest
+ * @param {*} missing - Result when the mirror exists but has no such shard
+ */
+export async function getShard(name, missing = null) {
+  const manifest = await loadManifest();
+  if (!manifest?.shards) return null;
+
+  const entry = manifest.shards[name];
+  if (!entry) return missing;
+
+  if (!shardCache.has(name)) {
+    shardCache.set(name, fetchJson(`${STATIC_API_BASE}/${name}.json?v=${entry.hash}`));
+  }
+  return shardCache.get(name);
+}
+
+/**
+ * Product lists, shaped like the products API ({ total, products })
+ */
+export const staticProducts = {
+  getByCategory(slug) {
+    return getShard(`categories/${slug}`, EMPTY_SHARD);
+  },
+
+  getBySubcategory(slug) {
+    return getShard(`subcategories/${slug}`, EMPTY_SHARD);
+  },
+
+  getFeatured() {
+    return getShard('featured');
+  },
+
+  getLatest() {
+    return getShard('latest');
+  },
+
+  getSitemapTree() {
+    return getShard('sitemap');
+  }
+};
@@ -13,6 +13,13 @@
     const productsGrid = document.getElementById('products-grid');
     if (!productsGrid) return;
 
+    // Pre-rendered grids only hold the first page of products; all-products.js
+    // filters the whole (sub)category with the static facet index instead
+    if (productsGrid.dataset.prerendered === 'true') {
+      console.log('🔧 Client filters skipped: pre-rendered grid uses the facet index');
+      return;
+    }
+
     // Get all product cards
     const productCards = productsGrid.querySelectorAll('.product-card-horizontal, .product-card');
     if (productCards.length === 0) return;
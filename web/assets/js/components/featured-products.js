@@ -5,6 +5,7 @@
  * No dependency on main.js - has its own card renderer.
  */
 import { products } from '../api/client.js';
+import { staticProducts } from '../api/static-api.js';
 
 function _fpLocale() { const m = window.location.pathname.match(/\/(be-nl|nl-nl|be-fr|de-de)\//); return m ? m[1] : 'be-nl'; }
 const _fpT = {
@@ -32,14 +33,21 @@ async function loadFeaturedProducts() {
   console.log('[FeaturedProducts] Loading featured products...');
 
   try {
-    // Try featured first, fall back to all products
-    let data = await products.getFeatured(8);
-    let allProducts = data.items || [];
-
-    if (allProducts.length === 0) {
-      console.log('[FeaturedProducts] No featured products, falling back to all products');
-      data = await products.getAll({ limit: 12 });
+    // The static mirror already falls back to the newest products;
+    // only ask the CMS when the mirror is unavailable
+    const shard = await staticProducts.getFeatured();
+    let allProducts = shard?.products || [];
+
+    if (!shard) {
+      // Try featured first, fall back to all products
+      let data = await products.getFeatured(8);
       allProducts = data.items || [];
+
+      if (allProducts.length === 0) {
+        console.log('[FeaturedProducts] No featured products, falling back to all products');
+        data = await products.getAll({ limit: 12 });
+        allProducts = data.items || [];
+      }
     }
 
     console.log('[FeaturedProducts] Got', allProducts.length, 'products');
@@ -1,6 +1,7 @@
 /**
  * Footer Loader Component
- * Dynamically loads unified footer on all pages
+ * Renders the unified footer on pages that still have the placeholder;
+ * locale pages ship it baked in at build time (scripts/site_layout.py)
  * Supports multilanguage with locale prefixes (be-nl, nl-nl, be-fr, de-de)
  */
 
@@ -1,10 +1,13 @@
 /**
  * Header Loader Component
- * Dynamically loads the unified header with mega menus on all pages
+ * Attaches the header behaviour (mobile menu, scroll state, language and
+ * account dropdowns). Locale pages ship the header baked in at build time
+ * (scripts/site_layout.py); on pages that still have the placeholder the
+ * unified header with mega menus is rendered here first.
  * Supports multilanguage with locale prefixes (be-nl, nl-nl, be-fr, de-de)
  * 
  * Usage: Add <div id="header-placeholder"></div> at start of <body>
- *        Then include this script
+ *        (or bake the header), then include this script
  */
 
 (function() {
@@ -798,19 +801,21 @@
 
   // Initialize header
   function initHeader() {
-    // Support both header-placeholder and header-wrapper IDs
-    const placeholder = document.getElementById('header-placeholder') || document.getElementById('header-wrapper');
+    // Baked pages already contain the header; only render it into a placeholder
+    const placeholder = document.getElementById('header-placeholder');
     if (placeholder) {
       const basePath = getBasePath();
       placeholder.outerHTML = getHeaderHTML(basePath);
       console.log('✅ Header loaded via header-loader.js (basePath: ' + basePath + ')');
-      
-      // Initialize mobile menu toggle after header is loaded
-      initMobileMenu();
-      
-      // Initialize header scroll behavior (top-bar hide/show)
-      initHeaderScroll();
     }
+    
+    if (!document.getElementById('header-wrapper')) return;
+    
+    // Initialize mobile menu toggle
+    initMobileMenu();
+    
+    // Initialize header scroll behavior (top-bar hide/show)
+    initHeaderScroll();
   }
 
   /**
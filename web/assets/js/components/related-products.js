@@ -1,6 +1,8 @@
 /**
  * Structon - Related Products Loader
  * Dynamically loads relevant products from CMS based on current product
+ * (from the static JSON mirror when available) on pages whose related
+ * products were not baked in by scripts/related_products.py
  */
 
 (function() {
@@ -21,6 +23,29 @@
     ? 'http://localhost:4000/api'
     : 'https://structon-production.up.railway.app/api';
 
+  // Static JSON mirror of the product lists (written by scripts/static_api.py)
+  const STATIC_API_BASE = (window.location.pathname.includes('/Structon/') ? '/Structon' : '') + '/api/v1';
+  let staticManifest = null;
+
+  /**
+   * Fetch a shard of the static mirror; null if the mirror is unavailable
+   */
+  function fetchStaticShard(name) {
+    if (!staticManifest) {
+      staticManifest = fetch(`${STATIC_API_BASE}/manifest.json`, { cache: 'no-cache' })
+        .then(response => response.ok ? response.json() : null)
+        .catch(() => null);
+    }
+    return staticManifest.then(manifest => {
+      if (!manifest || !manifest.shards) return null;
+      const entry = manifest.shards[name];
+      if (!entry) return { total: 0, products: [] };
+      return fetch(`${STATIC_API_BASE}/${name}.json?v=${entry.hash}`)
+        .then(response => response.ok ? response.json() : null)
+        .catch(() => null);
+    });
+  }
+
   /**
    * Get current product data from page
    */
@@ -55,6 +80,13 @@
    */
   async function fetchProducts(filters = {}) {
     try {
+      const shardName = filters.subcategory_slug ? `subcategories/${filters.subcategory_slug}`
+        : filters.category_slug ? `categories/${filters.category_slug}` : null;
+      const shard = shardName ? await fetchStaticShard(shardName) : null;
+      if (shard) {
+        return filters.limit ? shard.products.slice(0, filters.limit) : shard.products;
+      }
+      
       const params = new URLSearchParams();
       
       if (filters.category_slug) params.set('category_slug', filters.category_slug);
@@ -225,6 +257,12 @@
     
     if (!section || !grid) return;
 
+    // Generated product pages come with their related products baked in
+    if (grid.dataset.prerendered === 'true') {
+      console.log('✅ Using pre-rendered related products');
+      return;
+    }
+
     const currentProduct = getCurrentProduct();
     if (!currentProduct) {
       console.log('No current product found');
@@ -0,0 +1,109 @@
+/**
+ * Structon Facet Index
+ * Filters a static product shard with its precomputed facet index
+ * (facets/<scope>/<slug>.json, written by scripts/static_api.py).
+ * Every facet value carries a bitset of product ordinals - positions in
+ * the product shard - and its count, so a filter is an OR of the checked
+ * values and a filter combination an AND across facets.
+ */
+
+import { getShard } from './api/static-api.js';
+
+// Filters the index answers; brand and search still need the API
+const FACET_FILTERS = ['excavator_weight_ranges', 'volume_min', 'volume_max', 'width', 'attachment_type'];
+const LISTING_FILTERS = ['category_slug', 'subcategory_slug', 'sort', 'limit', 'offset'];
+
+function decodeBits(base64) {
+  return Uint8Array.from(atob(base64), char => char.charCodeAt(0));
+}
+
+function emptyBits(size) {
+  return new Uint8Array((size + 7) >> 3);
+}
+
+/**
+ * Bitset with every product of the shard set
+ */
+function allBits(size) {
+  const bits = emptyBits(size).fill(255);
+  if (size & 7) bits[bits.length - 1] = (1 << (size & 7)) - 1;
+  return bits;
+}
+
+/**
+ * OR of the bitsets of `values` in `facet`
+ */
+function anyOf(index, facet, values) {
+  const bits = emptyBits(index.size);
+  values.forEach(value => {
+    const entry = index.facets[facet]?.[String(value)];
+    if (!entry) return;
+    decodeBits(entry.bits).forEach((byte, i) => { bits[i] |= byte; });
+  });
+  return bits;
+}
+
+/**
+ * Load the facet index of the category or subcategory in `filters`
+ * (as returned by getActiveFilters); null without one
+ */
+export async function loadFacetIndex({ category_slug, subcategory_slug }) {
+  if (subcategory_slug) return getShard(`facets/subcategories/${subcategory_slug}`);
+  if (category_slug) return getShard(`facets/categories/${category_slug}`);
+  return null;
+}
+
+/**
+ * Whether `filters` use any facet, and whether the index answers all of them
+ */
+export function hasFacetFilters(filters) {
+  return FACET_FILTERS.some(key => key in filters);
+}
+
+export function canFilterByFacets(filters) {
+  return Object.keys(filters).every(key => FACET_FILTERS.includes(key) || LISTING_FILTERS.includes(key));
+}
+
+/**
+ * Bitset of the products matching `filters`
+ */
+export function matchFacets(index, filters) {
+  const bits = allBits(index.size);
+  const selections = [];
+
+  if (filters.excavator_weight_ranges?.length) {
+    selections.push(anyOf(index, 'excavator', filters.excavator_weight_ranges));
+  }
+  if (filters.width) {
+    selections.push(anyOf(index, 'width', String(filters.width).split(',')));
+  }
+  if (filters.attachment_type) {
+    selections.push(anyOf(index, 'attachment', [filters.attachment_type]));
+  }
+  if (filters.volume_min || filters.volume_max) {
+    // Volume is a range slider: OR every indexed volume inside the range
+    const min = filters.volume_min || 0;
+    const max = filters.volume_max || Infinity;
+    const volumes = Object.keys(index.facets.volume || {})
+      .filter(volume => parseFloat(volume) >= min && parseFloat(volume) <= max);
+    selections.push(anyOf(index, 'volume', volumes));
+  }
+
+  selections.forEach(selection => {
+    selection.forEach((byte, i) => { bits[i] &= byte; });
+  });
+  return bits;
+}
+
+/**
+ * Ordinals set in `bits`, in product shard order
+ */
+export function toOrdinals(bits) {
+  const ordinals = [];
+  bits.forEach((byte, i) => {
+    for (let bit = 0; byte; bit++, byte >>= 1) {
+      if (byte & 1) ordinals.push((i << 3) + bit);
+    }
+  });
+  return ordinals;
+}
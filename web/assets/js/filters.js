@@ -954,6 +954,54 @@ function injectActiveFiltersStyles() {
   document.head.appendChild(style);
 }
 
+/**
+ * Show next to every checkbox how many products it matches, from the
+ * precomputed counts of the facet index (see facet-index.js)
+ */
+export function showFacetCounts(index) {
+  if (!index?.facets) return;
+  injectFacetCountStyles();
+
+  // Checkbox names match the facet names of the index
+  ['excavator', 'width', 'attachment'].forEach(facet => {
+    document.querySelectorAll(`input[name="${facet}"]`).forEach(checkbox => {
+      const label = checkbox.closest('.checkbox-label');
+      if (!label) return;
+
+      const count = index.facets[facet]?.[checkbox.value]?.count || 0;
+      let badge = label.querySelector('.filter-count');
+      if (!badge) {
+        badge = document.createElement('span');
+        badge.className = 'filter-count';
+        label.appendChild(badge);
+      }
+      badge.textContent = `(${count})`;
+      label.classList.toggle('is-empty', count === 0);
+    });
+  });
+}
+
+/**
+ * Inject styles for facet counts
+ */
+function injectFacetCountStyles() {
+  if (document.getElementById('facet-count-styles')) return;
+
+  const style = document.createElement('style');
+  style.id = 'facet-count-styles';
+  style.textContent = `
+    .checkbox-label .filter-count {
+      margin-left: auto;
+      font-size: 12px;
+      color: #9ca3af;
+    }
+    .checkbox-label.is-empty {
+      opacity: 0.5;
+    }
+  `;
+  document.head.appendChild(style);
+}
+
 /**
  * Update active filters display
  */
@@ -5,8 +5,10 @@
  */
 
 import { products, categories, subcategories, brands } from '../api/client.js';
+import { staticProducts } from '../api/static-api.js';
 import { createProductCardHorizontal, createProductCard, createIndustryProductCard, showLoading, showError, showNoResults, escapeHtml } from '../main.js';
-import { initFilters, getActiveFilters } from '../filters.js';
+import { initFilters, getActiveFilters, showFacetCounts } from '../filters.js';
+import { loadFacetIndex, hasFacetFilters, canFilterByFacets, matchFacets, toOrdinals } from '../facet-index.js';
 import { initPagination, updatePagination, getOffset, getItemsPerPage } from '../pagination.js';
 import { createExpertBox } from '../components/expert-box.js';
 import { loadProductPrices } from '../pricing.js';
@@ -56,6 +58,14 @@ async function initPage() {
   } else {
     // Show products list
     await initFilters(handleFilterChange);
+    loadFacetIndex(getActiveFilters()).then(showFacetCounts);
+    
+    // Catalog pages come with their subcategories and first page of products
+    // rendered at build time; only fetch when the URL asks for another view
+    if (isPrerendered() && !hasListingParams(params)) {
+      enhancePrerenderedProducts();
+      return;
+    }
     
     // Load subcategories FIRST if viewing a main category (not a subcategory)
     // This ensures subcategories appear before products load
@@ -96,6 +106,38 @@ async function initPage() {
   }
 }
 
+/**
+ * True if the products grid was rendered by generate_catalog_pages.py
+ */
+function isPrerendered() {
+  return document.getElementById('products-grid')?.dataset.prerendered === 'true';
+}
+
+/**
+ * True if the URL selects filters, sorting or search on top of the category
+ */
+function hasListingParams(params) {
+  return ['subcat', 'tonnage', 'brand', 'search'].some(name => params.has(name)) ||
+    (params.has('sort') && params.get('sort') !== 'newest');
+}
+
+/**
+ * Attach pagination and prices to the pre-rendered product cards
+ */
+function enhancePrerenderedProducts() {
+  const container = document.getElementById('products-grid');
+  const total = parseInt(container.dataset.total, 10) || 0;
+  
+  document.getElementById('products-count').textContent = total;
+  initPagination(total, handlePageChange);
+  
+  const productElements = container.querySelectorAll('[data-product-id]');
+  if (productElements.length > 0) {
+    loadProductPrices(productElements);
+  }
+  console.log('✅ Using pre-rendered products:', total);
+}
+
 /**
  * Load and display subcategories for a main category
  */
@@ -164,11 +206,12 @@ async function loadSubcategories(categorySlug) {
     const subcategoriesWithCounts = await Promise.all(
       categorySubcategories.map(async (subcat) => {
         try {
-          // Use subcategory_slug for filtering (more reliable than id)
-          const productsData = await products.getAll({ 
-            subcategory_slug: subcat.slug,
-            limit: 1 
-          });
+          // Static mirror first; use subcategory_slug for filtering (more reliable than id)
+          const productsData = await staticProducts.getBySubcategory(subcat.slug) ||
+            await products.getAll({ 
+              subcategory_slug: subcat.slug,
+              limit: 1 
+            });
           
           console.log(`📦 Subcategory ${subcat.slug} products:`, productsData);
           
@@ -378,6 +421,36 @@ async function updateCategoryHeader() {
   headerSection.style.display = 'none';
 }
 
+/**
+ * Serve a category/subcategory listing from the static mirror, filtered
+ * with its facet index
+ * @returns {Object|null} { total, items, faceted } or null if the filters need the API
+ */
+async function getStaticListing(filters) {
+  const { category_slug, subcategory_slug, sort, limit, offset } = filters;
+  if (!canFilterByFacets(filters) || (sort && sort !== 'newest')) return null;
+  if (!category_slug && !subcategory_slug) return null;
+
+  const shard = subcategory_slug
+    ? await staticProducts.getBySubcategory(subcategory_slug)
+    : await staticProducts.getByCategory(category_slug);
+  if (!shard) return null;
+
+  // Shards are sorted newest first, like the API default
+  let items = shard.products;
+  if (hasFacetFilters(filters)) {
+    const index = await loadFacetIndex(filters);
+    if (!index || index.size !== items.length) return null;
+    items = toOrdinals(matchFacets(index, filters)).map(ordinal => shard.products[ordinal]);
+  }
+
+  return {
+    total: items.length,
+    items: items.slice(offset, offset + limit),
+    faceted: true
+  };
+}
+
 /**
  * Load products
  */
@@ -393,7 +466,7 @@ async function loadProducts() {
     filters.offset = getOffset();
 
     console.log('🔍 Loading products with filters:', filters);
-    const data = await products.getAll(filters);
+    const data = await getStaticListing(filters) || await products.getAll(filters);
     
     console.log('📦 Products API Response:', {
       total: data.total,
@@ -404,7 +477,8 @@ async function loadProducts() {
     let filteredProducts = data.items || [];
     
     // Apply client-side excavator weight filter (API doesn't support this filter)
-    if (filters.excavator_weight_ranges && filters.excavator_weight_ranges.length > 0) {
+    const clientFiltered = filters.excavator_weight_ranges?.length > 0 && !data.faceted;
+    if (clientFiltered) {
       filteredProducts = filteredProducts.filter(product => {
         return filters.excavator_weight_ranges.some(rangeValue => {
           // rangeValue is checkbox value in kg - define filter ranges in TONS to match product data
@@ -428,7 +502,7 @@ async function loadProducts() {
     }
     
     allProducts = filteredProducts;
-    const total = filters.excavator_weight_ranges?.length > 0 ? filteredProducts.length : (data.total || allProducts.length);
+    const total = clientFiltered ? filteredProducts.length : (data.total || allProducts.length);
 
     // Update count
     document.getElementById('products-count').textContent = total;
@@ -884,13 +958,14 @@ async function loadFeaturedProducts(currentProduct) {
   if (!container) return;
 
   try {
-    // Fetch featured products
+    // Fetch featured products (static mirror first)
     const filters = {
       is_featured: true,
       limit: 5 // Fetch 5 to have a buffer if we filter out the current one
     };
 
-    const data = await products.getAll(filters);
+    const shard = await staticProducts.getFeatured();
+    const data = shard ? { items: shard.products.slice(0, filters.limit) } : await products.getAll(filters);
     let featured = data.items || [];
 
     // Filter out current product
@@ -904,7 +979,10 @@ async function loadFeaturedProducts(currentProduct) {
       if (currentProduct.category_id) {
         categoryFilters.category_id = currentProduct.category_id;
       }
-      const categoryData = await products.getAll(categoryFilters);
+      const categoryShard = currentProduct.category_slug && await staticProducts.getByCategory(currentProduct.category_slug);
+      const categoryData = categoryShard
+        ? { items: categoryShard.products.slice(0, categoryFilters.limit) }
+        : await products.getAll(categoryFilters);
       featured = (categoryData.items || []).filter(p => p.id !== currentProduct.id).slice(0, 4);
     }
 
@@ -1,6 +1,9 @@
 /**
  * Standalone Brand Products Loader
- * Loads products from CMS API directly - no module dependencies
+ * Loads the products that fit the brand's machines (or the ?model= machine)
+ * from the compatibility index of the static JSON mirror
+ * (scripts/compatibility_index.py), else the newest products, falling back
+ * to the CMS API - no module dependencies
  * Works independently of brand.js and brand-data.js
  */
 (function() {
@@ -24,6 +27,67 @@
     return window.location.pathname.includes('/Structon/') ? '/Structon' : '';
   }
 
+  function fetchJson(url, options) {
+    return fetch(url, options).then(function(res) {
+      if (!res.ok) throw new Error('API error ' + res.status);
+      return res.json();
+    });
+  }
+
+  function getBrandSlug() {
+    var main = document.querySelector('[data-brand]');
+    return main ? main.dataset.brand : null;
+  }
+
+  function fetchShard(manifest, name) {
+    var entry = manifest.shards && manifest.shards[name];
+    if (!entry) return Promise.reject(new Error('No ' + name + ' shard'));
+    return fetchJson(getBasePath() + '/api/v1/' + name + '.json?v=' + entry.hash);
+  }
+
+  // Products compatible with the brand's models: product ids per category
+  // from compat/<brand>, resolved against the category shards
+  function fetchCompatibleProducts(manifest) {
+    var brand = getBrandSlug();
+    if (!brand) return Promise.resolve([]);
+
+    return fetchShard(manifest, 'compat/' + brand).then(function(compat) {
+      var model = new URLSearchParams(window.location.search).get('model');
+      var models = model && compat.models[model] ? [compat.models[model]] : Object.values(compat.models);
+      var idsByCategory = {};
+      models.forEach(function(entry) {
+        Object.keys(entry.products).forEach(function(category) {
+          idsByCategory[category] = idsByCategory[category] || new Set();
+          entry.products[category].forEach(function(id) { idsByCategory[category].add(id); });
+        });
+      });
+
+      return Promise.all(Object.keys(idsByCategory).map(function(category) {
+        return fetchShard(manifest, 'categories/' + category).then(function(shard) {
+          return shard.products.filter(function(product) { return idsByCategory[category].has(product.id); });
+        });
+      }));
+    }).then(function(lists) {
+      return [].concat.apply([], lists);
+    });
+  }
+
+  // Compatible (else newest) products from the static mirror; the CMS only if the mirror is unavailable
+  function fetchBrandProducts() {
+    return fetchJson(getBasePath() + '/api/v1/manifest.json', { cache: 'no-cache' })
+      .then(function(manifest) {
+        return fetchCompatibleProducts(manifest)
+          .catch(function() { return []; })
+          .then(function(products) {
+            if (products.length > 0) return { products: products };
+            return fetchShard(manifest, 'latest');
+          });
+      })
+      .catch(function() {
+        return fetchJson(API_BASE + '/products?limit=50&_t=' + Date.now(), { cache: 'no-store' });
+      });
+  }
+
   function buildProductUrl(product) {
     const basePath = getBasePath();
     const locale = getLocale();
@@ -96,11 +160,7 @@
     var container = document.getElementById('products-grid');
     if (!container) return;
 
-    fetch(API_BASE + '/products?limit=50&_t=' + Date.now(), { cache: 'no-store' })
-      .then(function(res) {
-        if (!res.ok) throw new Error('API error ' + res.status);
-        return res.json();
-      })
+    fetchBrandProducts()
       .then(function(data) {
         var items = data.products || data.items || [];
         if (items.length === 0) {
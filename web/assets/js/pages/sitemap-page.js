@@ -3,6 +3,59 @@
  */
 
 import { API_BASE_URL } from '../api/client.js';
+import { staticProducts } from '../api/static-api.js';
+
+/**
+ * Load the category > subcategory > product tree, from the static mirror
+ * or else built from the CMS API (same shape as the static sitemap shard)
+ */
+async function loadSitemapTree() {
+  const tree = await staticProducts.getSitemapTree();
+  if (tree) return tree;
+
+  // Fetch all data in parallel
+  const [categoriesRes, subcategoriesRes, productsRes] = await Promise.all([
+    fetch(`${API_BASE_URL}/categories`),
+    fetch(`${API_BASE_URL}/subcategories`),
+    fetch(`${API_BASE_URL}/products?limit=1000`)
+  ]);
+
+  if (!categoriesRes.ok || !subcategoriesRes.ok || !productsRes.ok) {
+    throw new Error('Failed to load sitemap data');
+  }
+
+  const categoriesData = await categoriesRes.json();
+  const subcategoriesData = await subcategoriesRes.json();
+  const productsData = await productsRes.json();
+
+  const categories = categoriesData.categories || [];
+  const subcategories = subcategoriesData.subcategories || [];
+  const products = productsData.products || productsData.items || [];
+
+  return {
+    categories: categories.map(category => {
+      // Get products for this category
+      const catProducts = products.filter(p => 
+        p.category_id === category.id || p.category_slug === category.slug
+      );
+      
+      return {
+        slug: category.slug,
+        title: category.title,
+        // Get subcategories for this category, with their products
+        subcategories: subcategories
+          .filter(sub => sub.category_id === category.id || sub.category_slug === category.slug)
+          .map(sub => ({
+            slug: sub.slug,
+            title: sub.title,
+            products: products.filter(p => p.subcategory_id === sub.id || p.subcategory_slug === sub.slug)
+          })),
+        // Products without subcategory directly under category
+        products: catProducts.filter(p => !p.subcategory_id)
+      };
+    })
+  };
+}
 
 async function initSitemapPage() {
   const container = document.getElementById('sitemap-content');
@@ -11,26 +64,9 @@ async function initSitemapPage() {
   try {
     console.log('🗺️ Loading sitemap data...');
     
-    // Fetch all data in parallel
-    const [categoriesRes, subcategoriesRes, productsRes] = await Promise.all([
-      fetch(`${API_BASE_URL}/categories`),
-      fetch(`${API_BASE_URL}/subcategories`),
-      fetch(`${API_BASE_URL}/products?limit=1000`)
-    ]);
-
-    if (!categoriesRes.ok || !subcategoriesRes.ok || !productsRes.ok) {
-      throw new Error('Failed to load sitemap data');
-    }
-
-    const categoriesData = await categoriesRes.json();
-    const subcategoriesData = await subcategoriesRes.json();
-    const productsData = await productsRes.json();
-
-    const categories = categoriesData.categories || [];
-    const subcategories = subcategoriesData.subcategories || [];
-    const products = productsData.products || productsData.items || [];
+    const { categories } = await loadSitemapTree();
 
-    console.log(`✅ Loaded ${categories.length} categories, ${subcategories.length} subcategories, ${products.length} products`);
+    console.log(`✅ Loaded ${categories.length} categories`);
 
     // Build sitemap HTML
     let html = '';
@@ -94,15 +130,7 @@ async function initSitemapPage() {
       // Skip hidden categories
       if (hiddenCategories.includes(catSlug)) return;
       
-      // Get subcategories for this category
-      const catSubcategories = subcategories.filter(sub => 
-        sub.category_id === category.id || sub.category_slug === category.slug
-      );
-      
-      // Get products for this category
-      const catProducts = products.filter(p => 
-        p.category_id === category.id || p.category_slug === category.slug
-      );
+      const catSubcategories = category.subcategories;
       
       html += `
         <div class="sitemap-column">
@@ -114,9 +142,7 @@ async function initSitemapPage() {
       // Add subcategories
       if (catSubcategories.length > 0) {
         catSubcategories.forEach(sub => {
-          const subProducts = products.filter(p => 
-            p.subcategory_id === sub.id || p.subcategory_slug === sub.slug
-          );
+          const subProducts = sub.products;
           
           html += `
             <li>
@@ -137,7 +163,7 @@ async function initSitemapPage() {
       }
       
       // Add products without subcategory directly under category
-      const productsWithoutSubcat = catProducts.filter(p => !p.subcategory_id);
+      const productsWithoutSubcat = category.products;
       if (productsWithoutSubcat.length > 0) {
         productsWithoutSubcat.forEach(product => {
           html += `<li><a href="../producten/?id=${product.id}">${product.title}</a></li>`;
@@ -0,0 +1,135 @@
+/**
+ * Structon Search Index
+ * Typeahead search over the per-locale index of the static API
+ * (search/<locale>/..., written by scripts/search_index.py): products,
+ * categories, brands, machine models and blog posts, without a CMS request.
+ * Every query word is matched as a prefix of the indexed words; a word
+ * without prefix matches falls back to the words sharing most of its
+ * trigrams, so typos and partial model names still find something.
+ */
+
+import { getShard } from './api/static-api.js';
+
+const MAX_PREFIX_TERMS = 50;
+const MIN_TRIGRAM_SHARE = 0.5;
+// Scores per query word: exact word, prefix of a word, similar word
+const EXACT_SCORE = 3;
+const PREFIX_SCORE = 2;
+const SIMILAR_SCORE = 1;
+// Ties go to the broader result
+const TYPE_ORDER = ['category', 'subcategory', 'brand', 'product', 'model', 'blog'];
+
+const EMPTY_SHARD = { terms: {}, trigrams: {} };
+const basePath = window.location.pathname.includes('/Structon/') ? '/Structon' : '';
+const sortedTerms = new Map();
+
+function getLocale() {
+  const match = window.location.pathname.match(/\/(be-nl|nl-nl|be-fr|de-de)\//);
+  return match ? match[1] : 'be-nl';
+}
+
+/**
+ * Lowercase, accent-free words, like normalize() / tokenize() in search_index.py
+ */
+export function tokenize(text) {
+  const normalized = String(text).normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+  return [...new Set(normalized.match(/[a-z0-9]+/g) || [])];
+}
+
+function trigrams(word) {
+  const grams = new Set();
+  for (let i = 0; i + 3 <= word.length; i++) grams.add(word.slice(i, i + 3));
+  return grams;
+}
+
+async function loadTermShard(locale, char) {
+  const shard = await getShard(`search/${locale}/${char}`, EMPTY_SHARD) || EMPTY_SHARD;
+  if (!sortedTerms.has(shard)) {
+    // Object key order puts numeric keys first, so sort once for the range scans
+    sortedTerms.set(shard, Object.keys(shard.terms).sort());
+  }
+  return shard;
+}
+
+/**
+ * Indexed words starting with `word`
+ */
+function prefixTerms(shard, word) {
+  const terms = sortedTerms.get(shard);
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (terms[mid] < word) low = mid + 1;
+    else high = mid;
+  }
+  const matches = [];
+  for (let i = low; i < terms.length && terms[i].startsWith(word) && matches.length < MAX_PREFIX_TERMS; i++) {
+    matches.push(terms[i]);
+  }
+  return matches;
+}
+
+/**
+ * Indexed words sharing at least MIN_TRIGRAM_SHARE of their trigrams with `word`
+ */
+async function similarTerms(locale, word) {
+  const grams = trigrams(word);
+  const shared = new Map();
+  for (const gram of grams) {
+    const shard = await loadTermShard(locale, gram[0]);
+    (shard.trigrams[gram] || []).forEach(term => shared.set(term, (shared.get(term) || 0) + 1));
+  }
+  return [...shared]
+    .filter(([term, count]) => count / Math.max(grams.size, trigrams(term).size) >= MIN_TRIGRAM_SHARE)
+    .map(([term]) => term);
+}
+
+/**
+ * Best score of `word` per doc id
+ */
+async function scoreWord(locale, word) {
+  const scores = new Map();
+  const addPostings = (shard, term, score) => {
+    (shard.terms[term] || []).forEach(id => scores.set(id, Math.max(scores.get(id) || 0, score)));
+  };
+
+  const shard = await loadTermShard(locale, word[0]);
+  prefixTerms(shard, word).forEach(term => addPostings(shard, term, term === word ? EXACT_SCORE : PREFIX_SCORE));
+
+  if (scores.size === 0 && word.length >= 3) {
+    for (const term of await similarTerms(locale, word)) {
+      addPostings(await loadTermShard(locale, term[0]), term, SIMILAR_SCORE);
+    }
+  }
+  return scores;
+}
+
+/**
+ * Search the site
+ * @param {string} query - What the visitor typed
+ * @returns {Promise<Array>} [{ type, title, url }] best first; url is absolute.
+ *   Empty when the static index is unavailable.
+ */
+export async function searchSite(query, { locale = getLocale(), limit = 8 } = {}) {
+  const words = tokenize(query);
+  if (words.length === 0) return [];
+
+  const index = await getShard(`search/${locale}/docs`);
+  if (!index) return [];
+
+  // Docs matching more (and better) query words rank first
+  const totals = new Map();
+  for (const scores of await Promise.all(words.map(word => scoreWord(locale, word)))) {
+    scores.forEach((score, id) => totals.set(id, (totals.get(id) || 0) + score));
+  }
+
+  return [...totals]
+    .map(([id, score]) => ({ doc: index.docs[id], score }))
+    .filter(({ doc }) => doc)
+    .sort((a, b) => b.score - a.score ||
+      TYPE_ORDER.indexOf(a.doc.type) - TYPE_ORDER.indexOf(b.doc.type) ||
+      a.doc.title.length - b.doc.title.length)
+    .slice(0, limit)
+    .map(({ doc }) => ({ ...doc, url: `${basePath}/${locale}/${doc.url}` }));
+}
@@ -112,6 +112,12 @@ self.addEventListener('fetch', (event) => {
     return; // Let browser handle cross-origin requests normally
   }
 
+  // Static API shards - the ?v= hash changes with the content, so cache first
+  if (url.pathname.includes('/api/v1/') && url.searchParams.has('v')) {
+    event.respondWith(cacheFirstStrategy(request, API_CACHE));
+    return;
+  }
+
   // API requests - stale-while-revalidate for better UX
   // NOTE: This will only apply to same-origin API requests now
   if (url.pathname.startsWith('/api/')) {